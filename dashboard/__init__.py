@@ -0,0 +1 @@
+"""Modul bersama untuk dashboard evaluasi (akses data dan perhitungan survei)."""
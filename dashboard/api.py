@@ -0,0 +1,143 @@
+"""Layanan HTTP lokal yang menyajikan KPI Home sebagai JSON.
+
+Angka yang sama dengan halaman Home (persentase Puas C1-C8 beserta rincian
+Dosen/Tendik/Mahasiswa; ``cakupan`` menandai apakah angka utama berasal dari
+satu sumber atau gabungan) diambil dari :func:`dashboard.kpi.load_home_kpis`,
+jadi query KPI ke tabel fakta hanya dijalankan ulang saat ada CSV yang berubah, bukan per
+request. ETag diturunkan dari versi (mtime, ukuran) setiap CSV sumber; klien
+yang mengirim ``If-None-Match`` dengan ETag yang masih berlaku mendapat
+``304 Not Modified`` tanpa KPI dimuat sama sekali.
+
+Endpoint:
+
+- ``GET /kpis``: ringkasan dan tabel KPI semua kriteria
+- ``GET /kpis/<c1..c8>``: ringkasan dan tabel satu kriteria
+
+Jalankan::
+
+    python -m dashboard.api --port 8502
+"""
+import argparse
+import hashlib
+import json
+import sys
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from dashboard.kpi import SNAPSHOT_VERSION, kpi_summary, load_home_kpis, source_signatures
+
+CRITERIA = ["c1", "c2", "c3", "c4", "c5", "c6", "c7", "c8"]
+
+# Body JSON yang sudah diserialisasi untuk ETag terakhir
+_bodies = {}
+_lock = threading.Lock()
+
+
+def current_etag():
+    """ETag untuk versi CSV sumber saat ini (hanya stat file, tanpa membaca data)."""
+    sources = json.dumps([SNAPSHOT_VERSION, source_signatures()], sort_keys=True)
+    return '"' + hashlib.sha1(sources.encode()).hexdigest()[:20] + '"'
+
+
+def etag_matches(header, etag):
+    if header is None:
+        return False
+    candidates = [value.strip() for value in header.split(",")]
+    # Perbandingan lemah (RFC 9110): awalan W/ diabaikan
+    return "*" in candidates or etag in (value.removeprefix("W/") for value in candidates)
+
+
+def _build_bodies(etag):
+    kpis = load_home_kpis()
+    summary = kpi_summary(kpis)
+    # NaN (persentase dari total nol) bukan JSON yang valid: kirim sebagai null
+    tables = {
+        key: table.astype(object).where(table.notna(), None).to_dict(orient="records")
+        for key, table in kpis.items()
+    }
+    version = etag.strip('"')
+
+    def encode(payload):
+        return json.dumps(payload, ensure_ascii=False, default=int, allow_nan=False).encode("utf-8")
+
+    bodies = {"/kpis": encode({"version": version, "summary": summary, "kpis": tables})}
+    for key in CRITERIA:
+        bodies[f"/kpis/{key}"] = encode({"version": version, "summary": summary[key], "data": tables[key]})
+    return bodies
+
+
+def get_body(path, etag):
+    """Body JSON untuk ``path`` pada versi ``etag`` (None jika path tidak dikenal)."""
+    with _lock:
+        bodies = _bodies.get(etag)
+    if bodies is None:
+        bodies = _build_bodies(etag)
+        with _lock:
+            _bodies.clear()
+            _bodies[etag] = bodies
+    return bodies.get(path)
+
+
+class KPIRequestHandler(BaseHTTPRequestHandler):
+    server_version = "DashboardKPI/1.0"
+
+    def _send(self, status, body=b"", etag=None):
+        self.send_response(status)
+        if etag:
+            self.send_header("ETag", etag)
+            # Klien boleh menyimpan respons tetapi harus validasi ulang dengan ETag
+            self.send_header("Cache-Control", "no-cache")
+        if status != HTTPStatus.NOT_MODIFIED:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD" and status != HTTPStatus.NOT_MODIFIED:
+            self.wfile.write(body)
+
+    def _error(self, status, message):
+        self._send(status, json.dumps({"error": message}).encode("utf-8"))
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0].rstrip("/") or "/"
+        if path != "/kpis" and path.removeprefix("/kpis/") not in CRITERIA:
+            self._error(HTTPStatus.NOT_FOUND, f"Endpoint tidak dikenal: {path}")
+            return
+
+        etag = current_etag()
+        if etag_matches(self.headers.get("If-None-Match"), etag):
+            self._send(HTTPStatus.NOT_MODIFIED, etag=etag)
+            return
+        try:
+            body = get_body(path, etag)
+        except Exception as e:
+            self._error(HTTPStatus.INTERNAL_SERVER_ERROR, f"Gagal memuat data KPI: {e}")
+            return
+        self._send(HTTPStatus.OK, body, etag=etag)
+
+    do_HEAD = do_GET
+
+
+def make_server(host="127.0.0.1", port=8502):
+    return ThreadingHTTPServer((host, port), KPIRequestHandler)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Layanan JSON KPI dashboard.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8502)
+    args = parser.parse_args(argv)
+
+    server = make_server(args.host, args.port)
+    print(f"KPI tersedia di http://{args.host}:{server.server_port}/kpis")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
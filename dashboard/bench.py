@@ -0,0 +1,212 @@
+"""Benchmark headless tahap load/transform/aggregate setiap halaman.
+
+Untuk setiap ukuran data, dataset sintetis (:mod:`dashboard.synthetic`)
+dibuat lalu diukur di proses terpisah (cache kosong) dengan tahap:
+
+- ``load_csv``: parsing CSV + konversi ke cache kolumnar (muat pertama)
+- ``load_arrow``: muat ulang dari cache kolumnar (cache memori dikosongkan)
+- ``load_memo``: muat ulang dari cache di memori
+- ``transform``: struktur turunan halaman (tabel long, partisi SQLite C.6)
+- ``aggregate``: perhitungan chart/KPI halaman
+
+Hasilnya berupa tabel waktu per ukuran dan eksponen skala (kemiringan
+log-log; ~1 berarti linear) sehingga terlihat tahap mana yang pertama kali
+melewati anggaran waktu::
+
+    python -m dashboard.bench --sizes 1000 10000 100000 1000000 --budget 1.0
+"""
+import argparse
+import json
+import math
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+STAGES = ["load_csv", "load_arrow", "load_memo", "transform", "aggregate"]
+
+STATUS_COLUMN = '1. Status Bpk/Ibu/Saudara/i:'
+
+# Dataset yang dimuat oleh setiap halaman
+PAGES = {
+    "home": ["c1_stt", "c1_tif", "c2_dosen", "c2_mhs", "c3", "c4_dosen", "c4_tendik",
+             "c5_dosen", "c5_mhs", "c5_tendik", "c6_dosen", "c6_tendik", "c7", "c8"],
+    "c1": ["c1_stt", "c1_tif"],
+    "c2": ["c2_dosen", "c2_mhs"],
+    "c3": ["c3"],
+    "c4": ["c4_dosen", "c4_tendik"],
+    "c5": ["c5_dosen", "c5_mhs", "c5_tendik"],
+    "c6": ["c6_dosen", "c6_tendik"],
+    "c7": ["c7"],
+    "c8": ["c8"],
+}
+
+
+def _transform(page):
+    # Struktur turunan yang dibangun halaman sebelum menggambar chart
+    from dashboard.long_table import load_long_table
+    from dashboard.partitions import current_manifest
+
+    if page == "c2":
+        load_long_table("c2_mhs")
+    elif page == "c4":
+        load_long_table("c4_dosen")
+        load_long_table("c4_tendik")
+    elif page == "c6":
+        current_manifest()
+
+
+def _aggregate(page):
+    from dashboard import lecturers
+    from dashboard.data import load_dataset
+    from dashboard.kpi import compute_home_kpis
+    from dashboard.likert import category_distribution, total_counts
+    from dashboard.long_table import load_long_table
+
+    if page == "home":
+        compute_home_kpis()
+        return
+    for name in PAGES[page]:
+        data = load_dataset(name)
+        category_distribution(total_counts(data))
+        if name in ("c1_stt", "c1_tif"):
+            data.groupby(STATUS_COLUMN, observed=True).mean()
+        elif name in ("c2_mhs", "c4_dosen", "c4_tendik"):
+            load_long_table(name).frame.groupby(['kategori', 'pertanyaan'], observed=True)['nilai'].mean()
+        elif name == "c6_dosen":
+            tahun = lecturers.options('Tahun Akademik')[-1]
+            dosen = next(iter(lecturers.lecturers(tahun)))
+            lecturers.kompetensi_averages(tahun, dosen)
+            lecturers.rows(tahun, dosen)
+            data.groupby(['Tahun Akademik', 'Kompetensi'], observed=True)['Rata-rata per Kompetensi'].mean()
+        else:
+            data.mean(numeric_only=True)
+
+
+def _timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def run_pages(pages):
+    """Ukur semua tahap untuk ``pages`` pada data di DASHBOARD_DATA_DIR."""
+    from dashboard import columnar
+    from dashboard.data import clear_cache, load_dataset
+
+    def load(page):
+        for name in PAGES[page]:
+            load_dataset(name)
+
+    results = {}
+    for page in pages:
+        shutil.rmtree(columnar.CACHE_DIR, ignore_errors=True)
+        clear_cache()
+        timings = {"load_csv": _timed(lambda: load(page))}
+        clear_cache()
+        timings["load_arrow"] = _timed(lambda: load(page))
+        timings["load_memo"] = _timed(lambda: load(page))
+        timings["transform"] = _timed(lambda: _transform(page))
+        timings["aggregate"] = _timed(lambda: _aggregate(page))
+        results[page] = timings
+    return results
+
+
+def _run_worker(data_dir, pages, repeat):
+    env = dict(os.environ, DASHBOARD_DATA_DIR=str(data_dir))
+    runs = []
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            env["DASHBOARD_CACHE_DIR"] = cache_dir
+            output = subprocess.run(
+                [sys.executable, "-m", "dashboard.bench", "--worker", "--pages", *pages],
+                env=env, check=True, capture_output=True, text=True,
+            ).stdout
+            runs.append(json.loads(output.splitlines()[-1]))
+    # Median per tahap dari beberapa pengulangan
+    return {
+        page: {stage: sorted(run[page][stage] for run in runs)[len(runs) // 2] for stage in STAGES}
+        for page in pages
+    }
+
+
+def scaling_exponent(sizes, seconds):
+    # Kemiringan regresi log(waktu) terhadap log(ukuran)
+    points = [(math.log(n), math.log(t)) for n, t in zip(sizes, seconds) if t > 0]
+    if len(points) < 2:
+        return float("nan")
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    var_x = sum((x - mean_x) ** 2 for x, _ in points)
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / var_x if var_x else float("nan")
+
+
+def report(results, budget):
+    sizes = sorted(results)
+    pages = list(results[sizes[0]])
+    lines = []
+    header = f"{'halaman':<8} {'tahap':<11}" + "".join(f"{n:>12,}" for n in sizes) + f"{'eksponen':>10}"
+    lines.append(header)
+    lines.append("-" * len(header))
+    for page in pages:
+        for stage in STAGES:
+            seconds = [results[n][page][stage] for n in sizes]
+            cells = "".join(f"{t * 1000:>10.1f}ms" for t in seconds)
+            lines.append(f"{page:<8} {stage:<11}{cells}{scaling_exponent(sizes, seconds):>10.2f}")
+
+    # Render pertama = load_csv + transform + aggregate; render berikutnya = load_memo + aggregate
+    lines.append("")
+    lines.append(f"Ukuran pertama yang melewati anggaran {budget:.2f}s:")
+    for page in pages:
+        first = {}
+        for label, stages in (("render pertama", ("load_csv", "transform", "aggregate")),
+                              ("rerun", ("load_memo", "aggregate"))):
+            over = [n for n in sizes if sum(results[n][page][s] for s in stages) > budget]
+            first[label] = f"{over[0]:,}" if over else "-"
+        lines.append(f"  {page:<8} render pertama: {first['render pertama']:>12}   rerun: {first['rerun']:>12}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark skala dashboard dengan data sintetis.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--pages", nargs="+", choices=list(PAGES), default=list(PAGES))
+    parser.add_argument("--repeat", type=int, default=1, help="pengulangan per ukuran (diambil median)")
+    parser.add_argument("--budget", type=float, default=1.0, help="anggaran waktu per render (detik)")
+    parser.add_argument("--data-root", help="folder data sintetis (dipakai ulang jika sudah ada)")
+    parser.add_argument("--json", help="simpan hasil mentah ke file JSON")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(run_pages(args.pages)))
+        return 0
+
+    from dashboard.synthetic import generate
+
+    data_root = Path(args.data_root or tempfile.mkdtemp(prefix="dashboard-bench-"))
+    results = {}
+    for n_rows in args.sizes:
+        data_dir = data_root / f"rows-{n_rows}"
+        marker = data_dir / ".complete"
+        if not marker.exists():
+            print(f"Membuat data sintetis {n_rows:,} baris di {data_dir} ...", file=sys.stderr)
+            generate(data_dir, n_rows)
+            marker.touch()
+        print(f"Mengukur {n_rows:,} baris ...", file=sys.stderr)
+        results[n_rows] = _run_worker(data_dir, args.pages, args.repeat)
+
+    print(report(results, args.budget))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({str(n): timings for n, timings in results.items()}, f, indent=2)
+    if args.data_root is None:
+        shutil.rmtree(data_root, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+"""Cache kolumnar (Arrow IPC / Feather) untuk file CSV survei.
+
+Setiap CSV prep dikonversi sekali ke file ``.arrow`` tanpa kompresi di
+``.cache/columnar`` dengan tipe data ringkas (:func:`compact_frame`):
+
+- kolom skor bulat menjadi ``int8``; kolom skor yang berisi sel kosong (dibaca
+  pandas sebagai ``float64``) menjadi ``Int8`` nullable, jadi sel kosong
+  disimpan sebagai mask, bukan NaN 8 byte. ``likert.score_matrix`` memberi sel
+  ini kode 0 seperti NaN sebelumnya
+- kolom bilangan bulat lain (NO, Tahun Akademik, NIDN, jumlah) diperkecil ke
+  tipe integer terkecil yang muat
+- kolom teks (Status, Kompetensi, Nama Dosen, Matakuliah, ...) menjadi
+  ``category``
+
+Pemuatan berikutnya membaca file tersebut lewat memory map, dan file dibangun
+ulang otomatis saat CSV atau aturan kompaksi berubah (keduanya disimpan di
+metadata skema Arrow).
+
+Jika pyarrow tidak tersedia atau folder cache tidak bisa ditulis, pemuatan
+kembali ke ``pd.read_csv`` biasa (tetap dikompakkan).
+
+Konversi semua dataset sekaligus (misalnya setelah deploy) lalu tampilkan
+laporan memori per dataset (CSV mentah vs hasil kompaksi)::
+
+    python -m dashboard.columnar
+    python -m dashboard.columnar --columns   # rincian per kolom
+"""
+import argparse
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # pragma: no cover - pyarrow ikut terpasang bersama streamlit
+    pa = None
+
+from dashboard.paths import CACHE_DIR as CACHE_ROOT
+
+CACHE_DIR = CACHE_ROOT / "columnar"
+
+_SIGNATURE_KEY = b"source_signature"
+# Naikkan jika aturan compact_frame berubah supaya cache lama dibangun ulang
+COMPACT_VERSION = 2
+
+
+def _fits_int8(values):
+    return values.min() >= np.iinfo(np.int8).min and values.max() <= np.iinfo(np.int8).max
+
+
+def compact_frame(data):
+    # Skor bulat -> int8 (Int8 jika ada sel kosong), integer lain -> tipe terkecil,
+    # kolom teks -> category
+    data = data.copy()
+    for col in data.columns:
+        series = data[col]
+        if pd.api.types.is_integer_dtype(series.dtype):
+            if len(series):
+                data[col] = pd.to_numeric(series, downcast="integer")
+        elif pd.api.types.is_float_dtype(series.dtype):
+            values = series.dropna()
+            if len(values) and (values == np.floor(values)).all() and _fits_int8(values):
+                data[col] = series.astype("Int8")
+        elif pd.api.types.is_string_dtype(series.dtype) or series.dtype == object:
+            data[col] = series.astype("category")
+    return data
+
+
+def cache_path(source_path, kind):
+    return CACHE_DIR / f"{Path(source_path).stem}.{kind}.arrow"
+
+
+def _encode_signature(signature):
+    return f"{signature[0]}:{signature[1]}:v{COMPACT_VERSION}".encode()
+
+
+def _read_if_fresh(target, signature):
+    if not target.exists():
+        return None
+    with pa.memory_map(str(target), "r") as source:
+        reader = pa.ipc.open_file(source)
+        metadata = reader.schema.metadata or {}
+        if metadata.get(_SIGNATURE_KEY) != _encode_signature(signature):
+            return None
+    return feather.read_table(str(target), memory_map=True).to_pandas()
+
+
+def _write(target, data, signature):
+    table = pa.Table.from_pandas(data, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[_SIGNATURE_KEY] = _encode_signature(signature)
+    table = table.replace_schema_metadata(metadata)
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    # Tanpa kompresi supaya file bisa dibaca lewat memory map
+    feather.write_feather(table, str(tmp_path), compression="uncompressed")
+    os.replace(tmp_path, target)
+
+
+def load_columnar(source_path, kind, reader, signature):
+    """Muat ``source_path`` dari cache kolumnar, bangun ulang jika CSV berubah."""
+    if pa is None:
+        return compact_frame(reader(source_path))
+
+    target = cache_path(source_path, kind)
+    try:
+        data = _read_if_fresh(target, signature)
+    except (OSError, pa.ArrowException):
+        data = None
+    if data is not None:
+        return data
+
+    data = compact_frame(reader(source_path))
+    try:
+        _write(target, data, signature)
+    except (OSError, pa.ArrowException):
+        # Cache hanya optimasi: tetap kembalikan data meski gagal ditulis
+        pass
+    return data
+
+
+def frame_memory(data):
+    return int(data.memory_usage(deep=True, index=False).sum())
+
+
+def memory_report(names=None, columns=False):
+    """Baris laporan memori per dataset: CSV mentah (pandas default) vs kompak."""
+    from dashboard import data as data_store
+
+    lines = [f"{'dataset':<12}{'baris':>7}{'kolom':>7}{'mentah KiB':>12}{'kompak KiB':>12}{'rasio':>8}"]
+    lines.append("-" * len(lines[0]))
+    total_raw = total_compact = 0
+    for name in names or data_store.DATASETS:
+        raw = data_store.read_source(name)
+        compact = data_store.load_dataset(name)
+        raw_size, compact_size = frame_memory(raw), frame_memory(compact)
+        total_raw += raw_size
+        total_compact += compact_size
+        lines.append(f"{name:<12}{len(compact):>7}{compact.shape[1]:>7}{raw_size / 1024:>12.1f}"
+                     f"{compact_size / 1024:>12.1f}{raw_size / max(compact_size, 1):>7.1f}x")
+        if columns:
+            raw_usage = raw.memory_usage(deep=True, index=False)
+            compact_usage = compact.memory_usage(deep=True, index=False)
+            for col in compact.columns:
+                lines.append(f"    {str(col)[:40]:<40} {str(raw[col].dtype):>8} -> {str(compact[col].dtype):<9}"
+                             f"{raw_usage[col] / 1024:>8.1f} -> {compact_usage[col] / 1024:.1f} KiB")
+    lines.append("-" * len(lines[1]))
+    lines.append(f"{'total':<26}{total_raw / 1024:>12.1f}{total_compact / 1024:>12.1f}"
+                 f"{total_raw / max(total_compact, 1):>7.1f}x")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bangun cache kolumnar dan laporan memori per dataset.")
+    parser.add_argument("--datasets", nargs="+", help="hanya dataset ini (default: semua)")
+    parser.add_argument("--columns", action="store_true", help="rincian tipe dan memori per kolom")
+    args = parser.parse_args(argv)
+
+    print(memory_report(args.datasets, args.columns))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+"""Lapisan akses data survei yang dipakai bersama oleh Home dan semua halaman.
+
+Setiap file dimuat sekali per proses dan disimpan di cache yang dikunci oleh
+path, mtime dan ukuran file. Cache hit hanya membutuhkan satu ``os.stat`` -
+tidak ada parsing CSV ulang dan tidak ada hashing DataFrame seperti pada
+``st.cache_data``. Cache miss membaca salinan kolumnar dari
+:mod:`dashboard.columnar` (dibangun ulang otomatis saat CSV berubah).
+DataFrame yang dikembalikan dipakai bersama, jadi jangan diubah secara
+in-place.
+"""
+import os
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+from dashboard.columnar import load_columnar
+from dashboard.paths import DATA_DIR
+from dashboard.timing import timed
+
+# Daftar dataset survei yang dipakai dashboard
+DATASETS = {
+    "c1_stt": "C.1.SurveyPemahamanVisiMisiSTTWastukancana.csv",
+    "c1_tif": "C.1.SurveyPemahamanVisiMisiTIF.csv",
+    "c2_dosen": "C2.tatakeloladosendantendik-prep.csv",
+    "c2_mhs": "C2.tatakelolamhs-preprossesing.csv",
+    "c3": "C3.-layanan-mahasiswa-prep.csv",
+    "c4_dosen": "C.4.KepuasanDosenterhadapSDM-prep.csv",
+    "c4_tendik": "C.4.KepuasanTendikterhadapSDM-prep.csv",
+    "c5_dosen": "C5.saranadosen-prep.csv",
+    "c5_mhs": "C5.saranamahasiswa-prep.csv",
+    "c5_tendik": "C5.saranatendik-prep.csv",
+    "c6_dosen": "C.6.Kepuasandosen-prep.csv",
+    "c6_tendik": "C.6.Kepuasantendik-prep.csv",
+    "c7": "penelitian-prep.csv",
+    "c8": "pengabdian-prep.csv",
+}
+
+# Dataset dengan header dua baris (kategori, pertanyaan)
+MULTI_HEADER_DATASETS = {"c2_mhs", "c4_dosen", "c4_tendik"}
+
+_cache = {}
+_derived = {}
+_lock = threading.Lock()
+
+
+def resolve_path(file_path):
+    path = Path(file_path)
+    if not path.is_absolute():
+        path = DATA_DIR / path
+    return path
+
+
+def file_signature(file_path):
+    # Versi file: berubah setiap kali isi CSV ditulis ulang
+    stat = os.stat(resolve_path(file_path))
+    return stat.st_mtime_ns, stat.st_size
+
+
+def dataset_fingerprint(names):
+    # Versi gabungan beberapa dataset (untuk kunci cache turunan lintas dataset)
+    if isinstance(names, str):
+        names = [names]
+    return tuple(file_signature(DATASETS[name]) for name in names)
+
+
+def _load_cached(file_path, kind, reader):
+    path = resolve_path(file_path)
+    signature = file_signature(path)
+    key = (str(path), kind)
+
+    with _lock:
+        entry = _cache.get(key)
+    if entry is not None and entry[0] == signature:
+        return entry[1]
+
+    with timed("load", path.name):
+        data = load_columnar(path, kind, reader, signature)
+    with _lock:
+        _cache[key] = (signature, data)
+    return data
+
+
+def _read_flat(path):
+    return pd.read_csv(path)
+
+
+def _read_multi_header(path):
+    data = pd.read_csv(path, header=[0, 1], encoding="utf-8")
+    data.columns = ['_'.join(col).strip() for col in data.columns.values]
+    return data
+
+
+# Fungsi untuk memuat data dari file CSV
+def load_data(file_path):
+    return _load_cached(file_path, "flat", _read_flat)
+
+
+# Fungsi untuk memuat data dengan multi-header (kolom digabung "kategori_pertanyaan")
+def load_data_with_multi_header(file_path):
+    return _load_cached(file_path, "multi_header", _read_multi_header)
+
+
+def load_dataset(name):
+    if name in MULTI_HEADER_DATASETS:
+        return load_data_with_multi_header(DATASETS[name])
+    return load_data(DATASETS[name])
+
+
+def read_source(name):
+    """CSV dataset ``name`` apa adanya (tanpa cache dan kompaksi), untuk perbandingan."""
+    path = resolve_path(DATASETS[name])
+    if name in MULTI_HEADER_DATASETS:
+        return _read_multi_header(path)
+    return _read_flat(path)
+
+
+def load_derived(name, key, builder):
+    """Hasil ``builder(dataset)`` yang di-cache per versi file dataset ``name``.
+
+    Dipakai untuk struktur turunan (indeks, tabel long, agregat) supaya hanya
+    dibangun ulang ketika CSV sumbernya berubah.
+    """
+    signature = file_signature(DATASETS[name])
+    cache_key = (name, key)
+    with _lock:
+        entry = _derived.get(cache_key)
+    if entry is not None and entry[0] == signature:
+        return entry[1]
+
+    data = load_dataset(name)
+    with timed("clean", f"{name}.{key[0] if isinstance(key, tuple) else key}"):
+        result = builder(data)
+    with _lock:
+        _derived[cache_key] = (signature, result)
+    return result
+
+
+def clear_cache():
+    with _lock:
+        _cache.clear()
+        _derived.clear()
@@ -0,0 +1,325 @@
+"""Ekspor snapshot statis (HTML) seluruh dashboard.
+
+Home dan setiap halaman di ``pages/`` dijalankan secara headless dengan
+``streamlit.testing`` lalu pohon elemennya ditulis ulang sebagai HTML biasa:
+figure Plotly disematkan sebagai JSON (digambar oleh ``plotly.min.js`` lokal),
+tabel sebagai ``<table>``, kolom dan tab sebagai flexbox/CSS. Setiap tab
+dirender dengan filter default. Dengan ``--filters``, setiap nilai selectbox
+berkardinalitas rendah (misalnya Status) juga diekspor sebagai halaman varian
+sehingga snapshot bisa disajikan oleh server file statis mana pun tanpa
+komputasi per penonton::
+
+    python -m dashboard.export /srv/snapshot-dashboard --filters
+    python -m http.server -d /srv/snapshot-dashboard
+"""
+import argparse
+import html
+import json
+import re
+import sys
+from pathlib import Path
+
+from dashboard.paths import BASE_DIR
+from dashboard.startup import PAGE_FILES
+
+# Selectbox dengan opsi sebanyak ini atau kurang diekspor per nilai (--filters)
+MAX_FILTER_OPTIONS = 8
+CONTAINER_NODES = ("ElementTree", "SpecialBlock", "Block", "Column", "Tab")
+ACTIVE = ' class="active"'
+
+STYLE = """
+body { font-family: "Source Sans Pro", Arial, sans-serif; margin: 0 auto; max-width: 1400px; padding: 1rem 2rem; }
+nav { display: flex; flex-wrap: wrap; gap: .75rem; padding-bottom: .5rem; border-bottom: 1px solid #ddd; }
+nav a { color: #31333f; text-decoration: none; } nav a.active { font-weight: bold; }
+.row { display: flex; gap: 1rem; align-items: stretch; }
+.col, .stack { min-width: 0; display: flex; flex-direction: column; gap: .5rem; }
+.card { border: 1px solid rgba(49, 51, 63, .2); border-radius: .5rem; padding: 1rem; }
+.filter { margin: .5rem 0; } .filter .label { color: #555; margin-right: .5rem; } .filter .value { font-weight: bold; }
+.tabs > input { display: none; }
+.tabs > label { display: inline-block; padding: .5rem 1rem; cursor: pointer; border-bottom: 2px solid transparent; }
+.tabs > .panel { display: none; padding-top: 1rem; }
+table.data { border-collapse: collapse; width: 100%; font-size: .9rem; }
+table.data th, table.data td { border: 1px solid #e6e6e6; padding: .25rem .5rem; text-align: left; }
+.alert { padding: .75rem 1rem; border-radius: .5rem; background: #fff8e1; }
+.variants { font-size: .9rem; }
+"""
+
+SCRIPT = """
+document.querySelectorAll("script.plotly-figure").forEach(function (node) {
+  var figure = JSON.parse(node.textContent);
+  var target = document.getElementById(node.dataset.target);
+  Plotly.newPlot(target, figure.spec.data || [], figure.spec.layout || {},
+                 Object.assign({responsive: true, displaylogo: false}, figure.config));
+});
+document.querySelectorAll(".tabs > input").forEach(function (input) {
+  input.addEventListener("change", function () {
+    document.querySelectorAll(".js-plotly-plot").forEach(function (plot) { Plotly.Plots.resize(plot); });
+  });
+});
+"""
+
+
+def page_title(page):
+    if page == "home":
+        return "Home"
+    return Path(PAGE_FILES[page]).stem.split("_", 1)[1]
+
+
+def slug(value):
+    return re.sub(r"[^0-9A-Za-z]+", "-", str(value)).strip("-").lower() or "x"
+
+
+def block_kind(node):
+    # Column/Tab punya proto sendiri; Block menyimpan jenisnya di oneof "type"
+    name = type(node).__name__
+    if name in ("Column", "Tab"):
+        return name.lower()
+    if name == "Block" and node.proto is not None:
+        return node.proto.WhichOneof("type")
+    return None
+
+
+def widget_key(element_id):
+    # ID widget Streamlit: "$$ID-<hash>-<key>"
+    key = element_id.split("-", 2)[-1]
+    return None if key == "None" else key
+
+
+class HTMLRenderer:
+    """Tulis ulang pohon elemen ``AppTest`` menjadi HTML statis."""
+
+    def __init__(self):
+        self._counter = 0
+        self.tab_panels = {}
+
+    def _next_id(self, prefix):
+        self._counter += 1
+        return f"{prefix}-{self._counter}"
+
+    def render(self, node):
+        name = type(node).__name__
+        if name in CONTAINER_NODES:
+            return self._render_block(node)
+        render = getattr(self, f"_render_{node.type}", None)
+        if render is None:
+            return f"<!-- elemen {html.escape(node.type)} tidak diekspor -->"
+        return render(node)
+
+    def render_children(self, node):
+        return "\n".join(self.render(child) for child in node.children.values())
+
+    def _render_block(self, node):
+        kind = block_kind(node)
+        if kind == "tab_container":
+            return self._render_tabs(node)
+        proto = node.proto if kind else None
+        inner = self.render_children(node)
+        if kind == "column":
+            return f'<div class="col" style="flex: {proto.weight:.4f} 1 0">{inner}</div>'
+        if kind == "flex_container":
+            container = proto.flex_container
+            direction = container.DESCRIPTOR.fields_by_name["direction"].enum_type.values_by_number[container.direction].name
+            classes = ["row" if direction == "HORIZONTAL" else "stack"] + (["card"] if container.border else [])
+            return f'<div class="{" ".join(classes)}">{inner}</div>'
+        if kind == "expandable":
+            return f"<details open><summary>{html.escape(proto.expandable.label)}</summary>{inner}</details>"
+        return inner
+
+    def _render_tabs(self, node):
+        tabs_id = self._next_id("tabs")
+        parts, styles = [], []
+        for i, tab in enumerate(node.children.values()):
+            label = tab.proto.label
+            tab_id = f"{tabs_id}-{i}"
+            checked = " checked" if i == 0 else ""
+            parts.append(f'<input type="radio" name="{tabs_id}" id="{tab_id}"{checked}>'
+                         f'<label for="{tab_id}">{html.escape(label)}</label>')
+            styles.append(f"#{tab_id}:checked ~ #{tab_id}-panel {{ display: block; }} "
+                          f"#{tab_id}:checked + label {{ border-bottom-color: #ff4b4b; }}")
+        for i, tab in enumerate(node.children.values()):
+            # Isi tab diambil dari render saat tab itu terbuka (tab lazy)
+            inner = self.tab_panels.get(tab.proto.label)
+            if inner is None:
+                inner = self.render_children(tab)
+            parts.append(f'<div class="panel" id="{tabs_id}-{i}-panel">{inner}</div>')
+        return f'<style>{"".join(styles)}</style><div class="tabs">{"".join(parts)}</div>'
+
+    def _render_markdown(self, node):
+        if node.proto.allow_html:
+            return node.value
+        return "<p>" + html.escape(node.value).replace("\n", "<br>") + "</p>"
+
+    def _render_divider(self, node):
+        return "<hr>"
+
+    def _render_plotly_chart(self, node):
+        target = self._next_id("figure")
+        payload = {"spec": json.loads(node.proto.spec), "config": json.loads(node.proto.config or "{}")}
+        # "</" di dalam <script> harus di-escape supaya tidak menutup tag
+        data = json.dumps(payload, ensure_ascii=False).replace("</", "<\\/")
+        return (f'<div id="{target}" class="figure"></div>'
+                f'<script type="application/json" class="plotly-figure" data-target="{target}">{data}</script>')
+
+    def _render_dataframe(self, node):
+        return node.value.to_html(index=False, classes="data", border=0, na_rep="",
+                                  float_format=lambda value: f"{value:.2f}")
+
+    def _render_selectbox(self, node):
+        return (f'<div class="filter"><span class="label">{html.escape(node.label)}</span>'
+                f'<span class="value">{html.escape(str(node.value))}</span></div>')
+
+    def _render_metric(self, node):
+        return (f'<div class="card"><div class="label">{html.escape(node.label)}</div>'
+                f'<div class="value">{html.escape(str(node.value))}</div></div>')
+
+    def _render_alert(self, node):
+        return f'<div class="alert">{html.escape(node.value)}</div>'
+
+    _render_error = _render_warning = _render_info = _render_success = _render_alert
+
+
+def run_page(page, tab_state=None, selection=None):
+    """Jalankan halaman headless; ``selection`` = (id selectbox, indeks opsi).
+
+    Opsi dipilih lewat indeks karena ``options`` berisi label tampilan
+    (hasil ``format_func``), bukan nilai aslinya. AppTest mengirim label itu
+    kembali ke ``format_func``, jadi ``format_func`` halaman harus
+    mengembalikan nilai yang tidak dikenalnya apa adanya (atau raise).
+    """
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(BASE_DIR / PAGE_FILES[page]), default_timeout=300)
+    for key, label in (tab_state or {}).items():
+        at.session_state[key] = label
+    at.run()
+    if selection is not None:
+        element_id, index = selection
+        selectbox = next(box for box in at.selectbox if box.id == element_id)
+        selectbox.select_index(index).run()
+    if at.exception:
+        raise RuntimeError(f"Halaman {page} gagal dirender: {at.exception[0].value}")
+    return at
+
+
+def _tab_containers(node):
+    if type(node).__name__ not in CONTAINER_NODES:
+        return []
+    found = [node] if block_kind(node) == "tab_container" else []
+    for child in node.children.values():
+        found += _tab_containers(child)
+    return found
+
+
+def _open_tab(container):
+    # Tab lazy yang terbuka adalah satu-satunya tab yang berisi elemen
+    return next((tab for tab in container.children.values() if tab.children), None)
+
+
+def _selectboxes(node):
+    if type(node).__name__ not in CONTAINER_NODES:
+        return [node] if node.type == "selectbox" else []
+    return [box for child in node.children.values() for box in _selectboxes(child)]
+
+
+def document(page, body, title=None):
+    links = "".join(
+        f'<a href="{name}.html"{ACTIVE if name == page else ""}>{html.escape(page_title(name))}</a>'
+        for name in PAGE_FILES
+    )
+    title = html.escape(title or page_title(page))
+    return (f'<!DOCTYPE html><html lang="id"><head><meta charset="utf-8"><title>{title}</title>'
+            f'<meta name="viewport" content="width=device-width, initial-scale=1">'
+            f'<style>{STYLE}</style><script src="plotly.min.js"></script></head>'
+            f'<body><nav>{links}</nav><main>{body}</main><script>{SCRIPT}</script></body></html>')
+
+
+def export_page(page, output_dir, filters=False, max_options=MAX_FILTER_OPTIONS):
+    """Tulis ``<page>.html`` (+ varian filter); kembalikan daftar file."""
+    default = run_page(page)
+    main = default.main
+    tab_states = [{}]
+    containers = _tab_containers(main)
+    for container in containers:
+        key = widget_key(container.proto.tab_container.id)
+        if key is None:
+            continue  # tab tanpa key tidak lazy: semua tab sudah terender
+        tab_states += [{key: tab.proto.label} for tab in list(container.children.values())[1:]]
+
+    renderer = HTMLRenderer()
+    written = []
+    variant_links = {}
+    for tab_state in tab_states:
+        at = default if not tab_state else run_page(page, tab_state)
+        tab_root = at.main
+        open_tabs = [_open_tab(container) for container in _tab_containers(tab_root)]
+        label = next((tab.proto.label for tab in open_tabs if tab is not None), None)
+        if tab_state and label is not None:
+            renderer.tab_panels[label] = renderer.render_children(next(tab for tab in open_tabs if tab is not None))
+        if not filters:
+            continue
+
+        # Satu halaman varian per nilai selectbox berkardinalitas rendah
+        scope = next((tab for tab in open_tabs if tab is not None), tab_root)
+        for box in _selectboxes(scope):
+            if len(box.options) > max_options:
+                continue
+            for index, value in enumerate(box.options):
+                if index == box.index:
+                    continue
+                variant = run_page(page, tab_state, (box.id, index))
+                variant_root = variant.main
+                variant_tab = next((_open_tab(c) for c in _tab_containers(variant_root)), None)
+                heading = " / ".join(part for part in (label, f"{box.label} {value}") if part)
+                body = (f"<h3>{html.escape(page_title(page))}: {html.escape(heading)}</h3>"
+                        + HTMLRenderer().render_children(variant_tab or variant_root))
+                parts = [page] + ([slug(label)] if label else []) + [f"{slug(box.label)}-{slug(value)}"]
+                path = output_dir / ("--".join(parts) + ".html")
+                path.write_text(document(page, body, f"{page_title(page)} - {heading}"), encoding="utf-8")
+                written.append(path)
+                variant_links.setdefault(label, []).append((f"{box.label} {value}", path.name))
+
+    body = renderer.render_children(main)
+    if variant_links:
+        items = "".join(
+            f"<li>{html.escape(tab_label or '')} {html.escape(text)}: <a href=\"{name}\">{html.escape(name)}</a></li>"
+            for tab_label, links in variant_links.items() for text, name in links
+        )
+        body += f'<details class="variants"><summary>Varian filter</summary><ul>{items}</ul></details>'
+    path = output_dir / f"{page}.html"
+    path.write_text(document(page, body), encoding="utf-8")
+    return [path] + written
+
+
+def export(output_dir, pages=None, filters=False, max_options=MAX_FILTER_OPTIONS):
+    from plotly.offline import get_plotlyjs
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    (output_dir / "plotly.min.js").write_text(get_plotlyjs(), encoding="utf-8")
+    written = []
+    for page in pages or PAGE_FILES:
+        print(f"Mengekspor {page} ...", file=sys.stderr)
+        written += export_page(page, output_dir, filters=filters, max_options=max_options)
+    home = output_dir / "home.html"
+    if home.exists():
+        # index.html = Home supaya server statis langsung menampilkan dashboard
+        (output_dir / "index.html").write_text(home.read_text(encoding="utf-8"), encoding="utf-8")
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ekspor dashboard sebagai snapshot HTML statis.")
+    parser.add_argument("output_dir")
+    parser.add_argument("--pages", nargs="+", choices=list(PAGE_FILES), default=list(PAGE_FILES))
+    parser.add_argument("--filters", action="store_true", help="ekspor juga setiap nilai selectbox berkardinalitas rendah")
+    parser.add_argument("--max-options", type=int, default=MAX_FILTER_OPTIONS,
+                        help="batas jumlah opsi selectbox untuk --filters")
+    args = parser.parse_args(argv)
+
+    written = export(args.output_dir, args.pages, filters=args.filters, max_options=args.max_options)
+    print(f"{len(written)} halaman ditulis ke {args.output_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""Cache figure Plotly per (versi dataset, id chart, filter).
+
+Setiap rerun Streamlit menjalankan ulang seluruh halaman, sehingga semua
+``px.*``/``go.*`` dibangun dan divalidasi ulang meskipun hanya satu selectbox
+yang berubah. Halaman cukup menulis::
+
+    key = figure_key("c3", "donut_puas", (selected_question_index,))
+    fig = get_figure(key)
+    if fig is None:
+        fig = px.pie(...)
+        fig.update_layout(...)
+        fig = put_figure(key, fig)
+    st.plotly_chart(fig)
+
+Figure disimpan sebagai objek ``go.Figure`` yang sudah tervalidasi: Streamlit
+memvalidasi ulang figure yang diberikan sebagai dict/JSON, jadi menyimpan
+JSON saja tidak menghemat apa pun. Ukuran JSON hasil serialisasi dipakai
+sebagai perkiraan memori untuk eviksi LRU dalam anggaran
+``DASHBOARD_FIGURE_CACHE_MB`` (default 64 MB). Figure dari cache dipakai
+bersama antar sesi, jadi jangan diubah setelah ``put_figure``.
+"""
+import os
+import threading
+from collections import OrderedDict
+
+import plotly.io as pio
+
+from dashboard.data import dataset_fingerprint
+from dashboard.timing import figure_built, figure_lookup
+
+FIGURE_CACHE_BUDGET = int(float(os.environ.get("DASHBOARD_FIGURE_CACHE_MB", "64")) * 1024 * 1024)
+
+_figures = OrderedDict()
+_total_size = 0
+_lock = threading.Lock()
+
+
+def figure_key(datasets, chart_id, filters=()):
+    """Kunci cache: versi ``datasets``, id chart dan nilai filter yang memengaruhinya."""
+    return dataset_fingerprint(datasets), chart_id, tuple(filters)
+
+
+def get_figure(key):
+    with _lock:
+        entry = _figures.get(key)
+        if entry is not None:
+            _figures.move_to_end(key)
+    figure_lookup(key[1], hit=entry is not None)
+    return None if entry is None else entry[0]
+
+
+def _discard(key):
+    global _total_size
+    _, size = _figures.pop(key)
+    _total_size -= size
+
+
+def put_figure(key, figure):
+    """Simpan ``figure`` untuk ``key`` lalu kembalikan figure yang sama."""
+    global _total_size
+    figure_built(key[1])
+    size = len(pio.to_json(figure, validate=False))
+    if size > FIGURE_CACHE_BUDGET:
+        return figure
+
+    _, chart_id, filters = key
+    with _lock:
+        # Figure untuk versi data lama tidak akan dipakai lagi
+        stale = [k for k in _figures if k[1] == chart_id and k[2] == filters and k != key]
+        for stale_key in stale:
+            _discard(stale_key)
+        if key in _figures:
+            _discard(key)
+
+        _figures[key] = (figure, size)
+        _total_size += size
+        while _total_size > FIGURE_CACHE_BUDGET:
+            _discard(next(iter(_figures)))
+    return figure
+
+
+def cache_info():
+    with _lock:
+        return {"figures": len(_figures), "bytes": _total_size, "budget": FIGURE_CACHE_BUDGET}
+
+
+def clear_figures():
+    global _total_size
+    with _lock:
+        _figures.clear()
+        _total_size = 0
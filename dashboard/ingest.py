@@ -0,0 +1,250 @@
+"""Ingest inkremental export mentah Google Forms C.1 ke CSV prep.
+
+CSV prep C.1 adalah kolom Status dan kolom Likert nomor 5-9 dari export
+mentah, baris demi baris (kolom Timestamp, Score, Nama, Email dan jawaban
+teks bebas dibuang). Posisi terakhir yang sudah diproses (offset byte, jumlah
+baris, Timestamp terakhir) beserta agregat jumlah skor per Status dan per
+pertanyaan disimpan di ``.cache/ingest_state.json``. Saat export mentah
+bertambah, hanya baris baru yang dibaca, ditambahkan ke CSV prep, dan digabung
+ke agregat; proses ulang penuh hanya terjadi jika header berubah, file
+mengecil, atau CSV prep diubah di luar pipeline ini. Agregat dipakai KPI C1
+Home (:mod:`dashboard.kpi`) selama CSV prep masih sama dengan hasil ingest.
+
+Perbarui CSV prep setelah mengunduh export baru::
+
+    python -m dashboard.ingest
+    python -m dashboard.ingest --full    # proses ulang seluruh riwayat
+"""
+import argparse
+import csv
+import hashlib
+import io
+import json
+import os
+import re
+import sys
+import threading
+
+from dashboard.data import DATASETS, file_signature, resolve_path
+from dashboard.paths import CACHE_DIR
+
+# Naikkan jika format state berubah supaya state lama dibuang
+STATE_VERSION = 3
+STATE_PATH = CACHE_DIR / "ingest_state.json"
+
+# Export mentah Google Forms untuk setiap dataset prep C.1
+RAW_SOURCES = {
+    "c1_stt": "C.1.HasilSurveyPemahamanVMTSUPPS2024.csv",
+    "c1_tif": "C.1.HasilSurveyPemahamanVMTSPS2024.csv",
+}
+
+TIMESTAMP_COLUMN = 'Timestamp'
+STATUS_COLUMN = '1. Status Bpk/Ibu/Saudara/i:'
+LIKERT_PATTERN = re.compile(r'^[5-9]\. Saya ')
+SCORES = ['1', '2', '3', '4', '5']
+
+# Byte terakhir sebelum offset yang dicocokkan untuk memastikan bagian lama
+# export tidak berubah (tanpa membaca ulang seluruh file)
+TAIL_BYTES = 4096
+
+_lock = threading.Lock()
+
+
+def prep_columns(header):
+    """Indeks kolom export mentah yang masuk ke CSV prep (Status + Likert 5-9)."""
+    if STATUS_COLUMN not in header:
+        raise ValueError(f"Kolom {STATUS_COLUMN!r} tidak ada di export mentah")
+    columns = [header.index(STATUS_COLUMN)]
+    columns += [i for i, name in enumerate(header) if LIKERT_PATTERN.match(name)]
+    return columns
+
+
+def _tail_hash(path, offset):
+    with open(path, 'rb') as f:
+        f.seek(max(0, offset - TAIL_BYTES))
+        return hashlib.sha1(f.read(offset - max(0, offset - TAIL_BYTES))).hexdigest()
+
+
+def _record_end(chunk):
+    """Posisi setelah newline terakhir yang mengakhiri record CSV lengkap.
+
+    Newline di dalam field berkutip (jawaban teks bebas multi-baris) bukan
+    akhir record; ``chunk`` selalu dimulai di batas record.
+    """
+    end = start = 0
+    quoted = False
+    newline = chunk.find(b'\n')
+    while newline != -1:
+        # Kutip ganda yang di-escape ("") menjumlah genap sehingga tidak mengubah status
+        if chunk.count(b'"', start, newline) % 2:
+            quoted = not quoted
+        if not quoted:
+            end = newline + 1
+        start = newline + 1
+        newline = chunk.find(b'\n', start)
+    return end
+
+
+def _read_rows(path, offset):
+    """Record lengkap setelah ``offset`` byte beserta offset akhirnya.
+
+    Record terakhir yang belum lengkap (export sedang ditulis, termasuk field
+    berkutip yang newline-nya belum tertutup) tidak diproses dan akan dibaca
+    lagi pada refresh berikutnya.
+    """
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        chunk = f.read()
+    end = _record_end(chunk)
+    text = chunk[:end].decode('utf-8-sig' if offset == 0 else 'utf-8')
+    rows = [row for row in csv.reader(io.StringIO(text, newline='')) if row]
+    return rows, offset + end
+
+
+def _last_timestamp(raw_rows, previous):
+    for row in reversed(raw_rows):
+        if row[0]:
+            return row[0]
+    return previous
+
+
+def _empty_aggregates(likert_names):
+    return {"responses": 0, "status": {}, "counts": {name: dict.fromkeys(SCORES, 0) for name in likert_names}}
+
+
+def merge_aggregates(aggregates, rows):
+    # Tambahkan jumlah respons per Status dan jumlah skor 1-5 per pertanyaan
+    likert_names = list(aggregates["counts"])
+    for row in rows:
+        status, scores = row[0], row[1:]
+        aggregates["responses"] += 1
+        aggregates["status"][status] = aggregates["status"].get(status, 0) + 1
+        for name, score in zip(likert_names, scores):
+            if score in aggregates["counts"][name]:
+                aggregates["counts"][name][score] += 1
+    return aggregates
+
+
+def read_state():
+    try:
+        with open(STATE_PATH, encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if state.get("version") != STATE_VERSION:
+        return {}
+    return state.get("sources", {})
+
+
+def write_state(sources):
+    STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = STATE_PATH.with_name(f"{STATE_PATH.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"version": STATE_VERSION, "sources": sources}, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_path, STATE_PATH)
+
+
+def _can_resume(entry, raw_path, prep_path, header):
+    if not entry or entry.get("header") != header or not prep_path.exists():
+        return False
+    if list(file_signature(prep_path)) != entry["prep_signature"]:
+        return False  # CSV prep diubah di luar pipeline
+    offset = entry["offset"]
+    if os.path.getsize(raw_path) < offset:
+        return False  # export diganti dengan file yang lebih pendek
+    return _tail_hash(raw_path, offset) == entry["tail_hash"]
+
+
+def ingest(name, state=None, full=False):
+    """Perbarui CSV prep ``name`` dari export mentahnya; kembalikan entri state.
+
+    Hanya baris yang ditambahkan sejak ingest terakhir yang dibaca kecuali
+    ``full`` atau state tidak cocok lagi dengan file di disk.
+    """
+    state = read_state() if state is None else state
+    raw_path = resolve_path(RAW_SOURCES[name])
+    prep_path = resolve_path(DATASETS[name])
+
+    with open(raw_path, newline='', encoding='utf-8-sig') as f:
+        header = next(csv.reader(f))
+    columns = prep_columns(header)
+    entry = state.get(name)
+
+    if full or not _can_resume(entry, raw_path, prep_path, header):
+        rows, offset = _read_rows(raw_path, 0)
+        raw_rows = rows[1:]
+        entry = {
+            "header": header,
+            "rows": 0,
+            "last_timestamp": None,
+            "aggregates": _empty_aggregates([header[i] for i in columns[1:]]),
+        }
+        mode = 'w'
+    else:
+        raw_rows, offset = _read_rows(raw_path, entry["offset"])
+        mode = 'a'
+
+    new_rows = [[row[i] if i < len(row) else '' for i in columns] for row in raw_rows]
+    prep_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(prep_path, mode, newline='', encoding='utf-8') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        if mode == 'w':
+            writer.writerow([header[i] for i in columns])
+        writer.writerows(new_rows)
+
+    merge_aggregates(entry["aggregates"], new_rows)
+    entry.update(
+        rows=entry["rows"] + len(new_rows),
+        new_rows=len(new_rows),
+        last_timestamp=_last_timestamp(raw_rows, entry["last_timestamp"]),
+        offset=offset,
+        tail_hash=_tail_hash(raw_path, offset),
+        prep_signature=list(file_signature(prep_path)),
+    )
+    state[name] = entry
+    return entry
+
+
+def ingest_all(names=None, full=False):
+    """Ingest semua export C.1 lalu simpan state; kembalikan state per dataset."""
+    with _lock:
+        state = read_state()
+        for name in names or RAW_SOURCES:
+            ingest(name, state, full=full)
+        write_state(state)
+    return state
+
+
+def load_aggregates(name):
+    """Agregat jumlah respons/skor dari ingest terakhir.
+
+    ``None`` jika belum pernah di-ingest atau CSV prep sudah berubah sejak
+    ingest terakhir (agregat tidak lagi mewakili isi CSV).
+    """
+    entry = read_state().get(name)
+    if not entry:
+        return None
+    prep_path = resolve_path(DATASETS[name])
+    if not prep_path.exists() or list(file_signature(prep_path)) != entry["prep_signature"]:
+        return None
+    return entry["aggregates"]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Perbarui CSV prep C.1 dari export mentah Google Forms.")
+    parser.add_argument("--dataset", action="append", choices=sorted(RAW_SOURCES), help="hanya dataset ini")
+    parser.add_argument("--full", action="store_true", help="proses ulang seluruh export")
+    args = parser.parse_args(argv)
+
+    state = ingest_all(args.dataset, full=args.full)
+    for name in args.dataset or RAW_SOURCES:
+        entry = state[name]
+        print(f"{name}: {entry['new_rows']} baris baru, total {entry['rows']} "
+              f"(Timestamp terakhir: {entry['last_timestamp']}) -> {DATASETS[name]}")
+        for status, count in sorted(entry["aggregates"]["status"].items()):
+            print(f"  {status}: {count} respons")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
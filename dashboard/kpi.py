@@ -0,0 +1,213 @@
+"""Ringkasan KPI untuk halaman Home beserta snapshot-nya.
+
+Semua KPI Home (persentase Puas C3/C5/C7/C8, grouped bar C1/C4, donut C2/C6)
+dihitung dari satu query grouped atas tabel fakta :mod:`dashboard.warehouse`
+(jumlah jawaban per kriteria, sumber dan skor); jumlah C1 diambil dari agregat
+inkremental :mod:`dashboard.ingest` selama masih sesuai dengan CSV prep. Hasilnya ditulis ke
+``.cache/kpi_snapshot.json`` bersama versi (mtime, ukuran) setiap CSV sumber. Home cukup membaca snapshot ini; hitung
+ulang hanya terjadi jika ada CSV yang berubah atau snapshot belum ada.
+
+Bangun snapshot secara eksplisit (misalnya setelah memperbarui CSV)::
+
+    python -m dashboard.kpi
+"""
+import json
+import os
+import sys
+import threading
+
+import pandas as pd
+
+from dashboard.ingest import RAW_SOURCES, load_aggregates
+from dashboard.likert import CATEGORIES_SKALA_5, SATISFACTION, SCORES, category_distribution
+from dashboard.paths import CACHE_DIR
+from dashboard.warehouse import SURVEYS, score_counts, source_signatures
+
+# Naikkan jika cara perhitungan KPI berubah supaya snapshot lama dibuang
+SNAPSHOT_VERSION = 4
+SNAPSHOT_PATH = CACHE_DIR / "kpi_snapshot.json"
+
+# Label yang dihitung sebagai "Puas" per kriteria (default: "Puas")
+POSITIVE_LABELS = {"c1": ("Faham",), "c6": ("Baik", "Sangat Baik")}
+
+# Kriteria -> (kategori skor, nama kolom label) tabel KPI
+KPI_CATEGORIES = {
+    "c1": ({"Tidak Faham": (1, 2), "Faham": (4, 5)}, "Kategori"),
+    "c2": (SATISFACTION, "Kategori"),
+    "c3": (SATISFACTION, "Status"),
+    "c4": ({"Tidak Puas": (1, 2), "Puas": (4, 5)}, "Kategori"),
+    "c5": (SATISFACTION, "Status"),
+    "c6": (CATEGORIES_SKALA_5, "Kategori"),
+    "c7": (SATISFACTION, "Status"),
+    "c8": (SATISFACTION, "Status"),
+}
+# Sumber (kolom ``sumber`` tabel survei) yang dipisah per kriteria, berurutan
+KPI_SOURCES = {
+    "c1": ["STT Wastukancana", "TIF"],
+    "c4": ["Dosen", "Tendik"],
+    "c5": ["Dosen", "Mahasiswa", "Tendik"],
+    "c6": ["Tendik", "Dosen"],
+}
+
+# Sumber yang angkanya tampil sebagai kartu KPI Home (kartu C5 membaca baris
+# Puas pertama tabel, yaitu Dosen); kriteria multi-sumber lain tampil per sumber
+HEADLINE_SOURCES = {"c5": "Dosen", "c6": "Tendik"}
+# Sumber yang tidak ikut angka gabungan: C6 Dosen adalah rekap rata-rata per
+# dosen x mata kuliah x kompetensi (satu baris per rekap, bukan per responden)
+# sehingga tidak bisa dijumlah dengan jawaban mentah Tendik
+UNPOOLED_SOURCES = {"c6": ("Dosen",)}
+
+_memo = {}
+_lock = threading.Lock()
+
+
+def kpi_tables(counts):
+    """Tabel KPI semua kriteria dari hasil :func:`dashboard.warehouse.score_counts`.
+
+    Kriteria dengan beberapa sumber (C1, C4, C5, C6) mendapat satu blok baris per
+    sumber beserta kolom ``Sumber``; sumber tanpa jawaban dilewati.
+    """
+    tables = {}
+    for key, (categories, label_column) in KPI_CATEGORIES.items():
+        rows = counts[counts['kriteria'] == key]
+        frames = []
+        for source in KPI_SOURCES.get(key, [None]):
+            source_rows = rows if source is None else rows[rows['sumber'] == source]
+            totals = source_rows.groupby('skor')['jumlah'].sum().reindex(SCORES, fill_value=0)
+            table = category_distribution(totals, categories, label_column=label_column)
+            if source is not None:
+                if table['Jumlah'].sum() == 0:
+                    continue
+                table['Sumber'] = source
+            frames.append(table)
+        tables[key] = pd.concat(frames, ignore_index=True)
+    return tables
+
+
+def ingest_counts():
+    """Jumlah skor C1 (format :func:`dashboard.warehouse.score_counts`) dari agregat ingest.
+
+    ``None`` jika salah satu dataset C1 belum punya agregat yang sesuai dengan
+    CSV prep-nya.
+    """
+    rows = []
+    for name in RAW_SOURCES:
+        aggregates = load_aggregates(name)
+        if aggregates is None:
+            return None
+        kriteria, sumber, _ = SURVEYS[name]
+        for counts in aggregates["counts"].values():
+            rows += [(kriteria, sumber, int(score), count) for score, count in counts.items()]
+    counts = pd.DataFrame(rows, columns=['kriteria', 'sumber', 'skor', 'jumlah'])
+    return counts.groupby(['kriteria', 'sumber', 'skor'], as_index=False)['jumlah'].sum()
+
+
+def compute_home_kpis():
+    # Hitung semua KPI Home dari satu query grouped atas tabel fakta; C1 dari
+    # agregat ingest jika tersedia (tanpa membaca ulang jawaban C1)
+    counts = score_counts()
+    c1 = ingest_counts()
+    if c1 is not None:
+        counts = pd.concat([counts[counts['kriteria'] != 'c1'], c1], ignore_index=True)
+    return kpi_tables(counts)
+
+
+def _positive_share(table, labels):
+    # Persentase (dan jumlah) baris berlabel positif terhadap seluruh baris tabel
+    label_column = table.columns[0]
+    total = int(table['Jumlah'].sum())
+    positive = int(table.loc[table[label_column].isin(labels), 'Jumlah'].sum())
+    return {"persentase": positive / total * 100 if total else None, "jumlah": total}
+
+
+def kpi_summary(kpis):
+    """Persentase Puas (Faham untuk C1) per kriteria beserta rincian per sumber.
+
+    Untuk kriteria multi-sumber, ``persentase`` adalah angka yang tampil di
+    Home (sumber ``HEADLINE_SOURCES``) atau gabungan semua sumber jika Home
+    tidak menampilkan satu angka; ``cakupan`` menyebutkan yang mana, dan
+    ``gabungan`` selalu berisi angka gabungan (tanpa ``UNPOOLED_SOURCES``).
+    """
+    summary = {}
+    for key, table in kpis.items():
+        labels = POSITIVE_LABELS.get(key, ("Puas",))
+        entry = _positive_share(table, labels)
+        if "Sumber" in table.columns:
+            sources = {
+                source: _positive_share(group, labels)
+                for source, group in table.groupby("Sumber", sort=False)
+            }
+            headline = HEADLINE_SOURCES.get(key)
+            pooled = _positive_share(table[~table["Sumber"].isin(UNPOOLED_SOURCES.get(key, ()))], labels)
+            entry = dict(sources[headline]) if headline in sources else dict(pooled)
+            entry["cakupan"] = headline if headline in sources else "gabungan"
+            entry["gabungan"] = pooled
+            entry["sumber"] = sources
+        summary[key] = entry
+    return summary
+
+
+def _read_snapshot(sources):
+    try:
+        with open(SNAPSHOT_PATH, encoding="utf-8") as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if snapshot.get("version") != SNAPSHOT_VERSION or snapshot.get("sources") != sources:
+        return None
+    return {
+        key: pd.DataFrame(table["data"], columns=table["columns"])
+        for key, table in snapshot["kpis"].items()
+    }
+
+
+def write_snapshot(kpis, sources):
+    snapshot = {
+        "version": SNAPSHOT_VERSION,
+        "sources": sources,
+        "kpis": {key: table.to_dict(orient="split", index=False) for key, table in kpis.items()},
+    }
+    SNAPSHOT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = SNAPSHOT_PATH.with_name(f"{SNAPSHOT_PATH.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(snapshot, f, ensure_ascii=False, default=int)
+    os.replace(tmp_path, SNAPSHOT_PATH)
+
+
+def load_home_kpis():
+    """KPI Home dari snapshot; dihitung ulang hanya jika snapshot basi."""
+    sources = source_signatures()
+    key = json.dumps(sources, sort_keys=True)
+    with _lock:
+        if key in _memo:
+            return _memo[key]
+
+    kpis = _read_snapshot(sources)
+    if kpis is None:
+        kpis = compute_home_kpis()
+        try:
+            write_snapshot(kpis, sources)
+        except OSError:
+            # Snapshot hanya optimasi: Home tetap tampil dari hasil hitung langsung
+            pass
+
+    with _lock:
+        _memo.clear()
+        _memo[key] = kpis
+    return kpis
+
+
+def build_snapshot():
+    kpis = compute_home_kpis()
+    write_snapshot(kpis, source_signatures())
+    return kpis
+
+
+def main():
+    kpis = build_snapshot()
+    print(f"Snapshot KPI ditulis ke {SNAPSHOT_PATH} ({len(kpis)} kriteria)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
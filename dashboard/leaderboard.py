@@ -0,0 +1,273 @@
+"""Peringkat dosen dan mata kuliah terbaik/terendah per kompetensi dan semester.
+
+Nilai setiap dosen (NIDN) atau mata kuliah dalam satu Tahun Akademik x
+Kompetensi adalah rata-rata ``Rata-rata per Kompetensi`` yang ditimbang
+``Jumlah Responden``; kandidat dengan total responden di bawah
+``MIN_RESPONDEN`` tidak ikut diperingkat.
+
+Peringkat dipilih per kelompok dengan seleksi top-k terbatas
+(``heapq.nlargest``/``nsmallest``, O(n log k)), bukan mengurutkan seluruh
+kelompok. Nilai dibandingkan setelah dibulatkan dua desimal seperti tampilan;
+kandidat yang seri dengan peringkat ke-k ikut ditampilkan dan peringkat
+memakai gaya kompetisi (1, 2, 2, 4).
+
+``K_MAX`` teratas dan terbawah setiap semester x kompetensi dihitung
+sebelumnya dan disimpan di ``.cache/c6_dosen/leaderboard.sqlite`` bersama
+hash partisinya (:mod:`dashboard.partitions`); hanya semester yang berubah
+yang dihitung ulang. Halaman C.6 cukup membaca tabel peringkat ini. Pilihan
+"All" (seluruh semester) atau ambang responden lain dihitung dari agregat
+per semester yang tersimpan di file yang sama.
+
+Tampilkan peringkat::
+
+    python -m dashboard.leaderboard --jenis dosen --kompetensi Pedagogik --tahun 20201
+"""
+import argparse
+import heapq
+import sqlite3
+import sys
+import threading
+
+import pandas as pd
+
+from dashboard.partitions import PARTITION_DIR, current_manifest, query_partitions
+from dashboard.timing import timed
+from dashboard.trend import ALL, VALID_ROWS
+
+# Naikkan jika cara pemeringkatan berubah supaya semua peringkat dihitung ulang
+LEADERBOARD_VERSION = 1
+LEADERBOARD_PATH = PARTITION_DIR / "leaderboard.sqlite"
+K_MAX = 10
+DEFAULT_K = 5
+MIN_RESPONDEN = 10
+ROUND_DIGITS = 2
+DIRECTIONS = ["atas", "bawah"]
+
+# Jenis peringkat -> (kolom kunci, kolom nama) di tabel ``dosen`` partisi
+ENTITIES = {
+    "dosen": ("nidn", "MIN(nama_dosen)"),
+    "matakuliah": ("matakuliah", "matakuliah"),
+}
+COLUMNS = ['Peringkat', 'Kunci', 'Nama', 'Rata-rata', 'Jumlah Responden']
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entitas (
+    tahun_akademik INTEGER NOT NULL,
+    jenis TEXT NOT NULL,
+    kompetensi TEXT NOT NULL,
+    kunci TEXT NOT NULL,
+    nama TEXT NOT NULL,
+    bobot REAL NOT NULL,
+    responden INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entitas_tahun ON entitas (tahun_akademik);
+CREATE TABLE IF NOT EXISTS peringkat (
+    tahun_akademik INTEGER NOT NULL,
+    jenis TEXT NOT NULL,
+    kompetensi TEXT NOT NULL,
+    arah TEXT NOT NULL,
+    peringkat INTEGER NOT NULL,
+    kunci TEXT NOT NULL,
+    nama TEXT NOT NULL,
+    rata_rata REAL NOT NULL,
+    responden INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS peringkat_kelompok ON peringkat (tahun_akademik, jenis, kompetensi, arah);
+CREATE TABLE IF NOT EXISTS partisi (tahun_akademik INTEGER PRIMARY KEY, hash TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+LOAD_RANKINGS_QUERY = """
+SELECT * FROM peringkat
+ORDER BY tahun_akademik, jenis, kompetensi, arah, peringkat, nama, kunci
+"""
+LOAD_ENTITIES_QUERY = """
+SELECT * FROM entitas
+ORDER BY tahun_akademik, jenis, kompetensi, kunci
+"""
+
+ENTITY_QUERY = """
+SELECT kompetensi, CAST({key} AS TEXT) AS kunci, {name} AS nama,
+       SUM(rata_rata * jumlah_responden) AS bobot, SUM(jumlah_responden) AS responden
+FROM dosen WHERE {valid}
+GROUP BY kompetensi, {key}
+"""
+
+_memo = {}
+_lock = threading.Lock()
+
+
+def top_k(candidates, k, largest=True, min_responden=MIN_RESPONDEN):
+    """``k`` kandidat terbaik (atau terendah) beserta kandidat yang seri dengan ke-k.
+
+    ``candidates``: iterable ``(kunci, nama, rata_rata, responden)``. Hasil
+    berurutan ``(peringkat, kunci, nama, rata_rata, responden)`` dengan
+    peringkat kompetisi atas nilai yang dibulatkan ``ROUND_DIGITS``.
+    """
+    eligible = [
+        (key, name, round(mean, ROUND_DIGITS), responden)
+        for key, name, mean, responden in candidates
+        if responden >= min_responden
+    ]
+    if k <= 0 or not eligible:
+        return []
+    select = heapq.nlargest if largest else heapq.nsmallest
+    chosen = select(k, eligible, key=lambda item: item[2])
+    boundary = chosen[-1][2]
+    # Kandidat lain yang seri dengan nilai ke-k ikut masuk
+    chosen_keys = {item[0] for item in chosen}
+    chosen += [item for item in eligible if item[2] == boundary and item[0] not in chosen_keys]
+    chosen.sort(key=lambda item: (-item[2] if largest else item[2], item[1], item[0]))
+
+    ranked = []
+    for position, (key, name, mean, responden) in enumerate(chosen, start=1):
+        rank = ranked[-1][0] if ranked and ranked[-1][3] == mean else position
+        ranked.append((rank, key, name, mean, responden))
+    return ranked
+
+
+def _groups(entities):
+    # (jenis, kompetensi) -> kandidat (kunci, nama, rata_rata, responden)
+    groups = {}
+    for row in entities.itertuples(index=False):
+        if row.responden <= 0:
+            continue
+        groups.setdefault((row.jenis, row.kompetensi), []).append(
+            (row.kunci, row.nama, row.bobot / row.responden, row.responden)
+        )
+    return groups
+
+
+def _partition_entities(tahun):
+    # Agregat per dosen / mata kuliah x kompetensi dari satu partisi
+    frames = []
+    for jenis, (key, name) in ENTITIES.items():
+        rows = query_partitions(ENTITY_QUERY.format(key=key, name=name, valid=VALID_ROWS), tahun=tahun)
+        frames.append(rows.assign(jenis=jenis, tahun_akademik=tahun))
+    return pd.concat(frames, ignore_index=True)
+
+
+def _open(path):
+    connection = sqlite3.connect(path)
+    connection.executescript(SCHEMA)
+    settings = dict(connection.execute("SELECT key, value FROM meta"))
+    expected = {"version": str(LEADERBOARD_VERSION), "k_max": str(K_MAX), "min_responden": str(MIN_RESPONDEN)}
+    if settings != expected:
+        # Versi atau parameter berubah: semua semester dihitung ulang
+        connection.executescript("DELETE FROM entitas; DELETE FROM peringkat; DELETE FROM partisi; DELETE FROM meta;")
+        connection.executemany("INSERT INTO meta VALUES (?, ?)", expected.items())
+        connection.commit()
+    return connection
+
+
+def refresh(path=LEADERBOARD_PATH):
+    """Hitung ulang peringkat semester yang partisinya berubah; kembalikan ``(diperbarui, tetap, dihapus)``."""
+    partitions = current_manifest()["partitions"]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    connection = _open(path)
+    try:
+        stored = dict(connection.execute("SELECT tahun_akademik, hash FROM partisi"))
+        wanted = {int(key): entry["hash"] for key, entry in partitions.items()}
+        changed = sorted(tahun for tahun, digest in wanted.items() if stored.get(tahun) != digest)
+        removed = sorted(set(stored) - set(wanted))
+
+        for tahun in removed + changed:
+            for table in ("entitas", "peringkat", "partisi"):
+                connection.execute(f"DELETE FROM {table} WHERE tahun_akademik = ?", (tahun,))
+        for tahun in changed:
+            entities = _partition_entities(tahun)
+            columns = ['tahun_akademik', 'jenis', 'kompetensi', 'kunci', 'nama', 'bobot', 'responden']
+            connection.executemany(
+                "INSERT INTO entitas VALUES (?, ?, ?, ?, ?, ?, ?)",
+                zip(*(entities[column].tolist() for column in columns)),
+            )
+            rankings = []
+            for (jenis, kompetensi), candidates in _groups(entities).items():
+                for arah in DIRECTIONS:
+                    for ranked in top_k(candidates, K_MAX, largest=arah == "atas"):
+                        rankings.append((tahun, jenis, kompetensi, arah, *ranked))
+            connection.executemany("INSERT INTO peringkat VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rankings)
+            connection.execute("INSERT INTO partisi VALUES (?, ?)", (tahun, wanted[tahun]))
+        connection.commit()
+    finally:
+        connection.close()
+    kept = sorted(set(wanted) - set(changed))
+    return changed, kept, removed
+
+
+def load_tables(path=LEADERBOARD_PATH):
+    """Tabel ``(peringkat, entitas)`` tersimpan (diperbarui dulu jika partisi berubah)."""
+    manifest = current_manifest()
+    key = (str(path), tuple(sorted((k, entry["hash"]) for k, entry in manifest["partitions"].items())))
+    with _lock:
+        if key in _memo:
+            return _memo[key]
+        refresh(path)
+        connection = sqlite3.connect(path)
+        try:
+            with timed("load", path.name):
+                # Urutan eksplisit: entri seri (peringkat sama) selalu urut nama
+                rankings = pd.read_sql_query(LOAD_RANKINGS_QUERY, connection)
+                entities = pd.read_sql_query(LOAD_ENTITIES_QUERY, connection)
+        finally:
+            connection.close()
+        _memo.clear()
+        _memo[key] = (rankings, entities)
+    return rankings, entities
+
+
+def _frame(ranked):
+    return pd.DataFrame(ranked, columns=COLUMNS)
+
+
+def leaderboard(jenis, kompetensi, tahun=ALL, k=DEFAULT_K, largest=True, min_responden=MIN_RESPONDEN):
+    """Peringkat ``k`` teratas (``largest``) atau terbawah untuk satu kompetensi.
+
+    Semester tunggal dengan ambang bawaan dibaca dari peringkat yang sudah
+    dihitung; selain itu (``tahun`` = ``'All'``, ambang lain, ``k`` >
+    ``K_MAX``) dihitung dari agregat per semester.
+    """
+    if jenis not in ENTITIES:
+        raise ValueError(f"Jenis peringkat tidak dikenal: {jenis!r} (pilih {list(ENTITIES)})")
+    rankings, entities = load_tables()
+    if tahun != ALL and min_responden == MIN_RESPONDEN and k <= K_MAX:
+        rows = rankings[
+            (rankings['tahun_akademik'] == tahun)
+            & (rankings['jenis'] == jenis)
+            & (rankings['kompetensi'] == kompetensi)
+            & (rankings['arah'] == ("atas" if largest else "bawah"))
+            & (rankings['peringkat'] <= k)
+        ]
+        return _frame(rows[['peringkat', 'kunci', 'nama', 'rata_rata', 'responden']].to_numpy().tolist())
+
+    rows = entities[(entities['jenis'] == jenis) & (entities['kompetensi'] == kompetensi)]
+    if tahun != ALL:
+        rows = rows[rows['tahun_akademik'] == tahun]
+    totals = rows.groupby('kunci', sort=False).agg(
+        nama=('nama', 'first'), bobot=('bobot', 'sum'), responden=('responden', 'sum')
+    )
+    totals = totals[totals['responden'] > 0]
+    candidates = zip(totals.index, totals['nama'], totals['bobot'] / totals['responden'], totals['responden'])
+    return _frame(top_k(candidates, k, largest=largest, min_responden=min_responden))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Peringkat dosen / mata kuliah C.6 per kompetensi.")
+    parser.add_argument("--jenis", choices=list(ENTITIES), default="dosen")
+    parser.add_argument("--kompetensi", required=True)
+    parser.add_argument("--tahun", type=int)
+    parser.add_argument("-k", type=int, default=DEFAULT_K)
+    parser.add_argument("--min-responden", type=int, default=MIN_RESPONDEN)
+    args = parser.parse_args(argv)
+
+    tahun = ALL if args.tahun is None else args.tahun
+    for largest, label in ((True, "Terbaik"), (False, "Terendah")):
+        result = leaderboard(args.jenis, args.kompetensi, tahun, args.k, largest, args.min_responden)
+        print(f"{label}:")
+        print(result.to_string(index=False) if not result.empty else "  (tidak ada kandidat)")
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""Query rekap per dosen C.6 lewat tabel ``dosen`` berindeks di SQLite.
+
+Rekap C.6 bertambah setiap semester (dosen x mata kuliah x kompetensi).
+Halaman C.6 tidak lagi memfilter seluruh riwayat dengan boolean mask pandas
+setiap rerun: opsi dropdown bertingkat, rata-rata per kompetensi (donut) dan
+baris tabel masing-masing satu query ke tabel ``dosen`` yang berindeks pada
+NIDN, Matakuliah dan Kompetensi.
+
+Tabel ``dosen`` dipartisi per Tahun Akademik (:mod:`dashboard.partitions`):
+pilihan Tahun Akademik menentukan partisi mana yang dibuka, dan query
+dijalankan per partisi lalu hasilnya digabung (agregat sebagai jumlah dan
+cacah, bukan rata-rata).
+
+Pilihan filter berurutan seperti dropdown halaman: Tahun Akademik, NIDN,
+Matakuliah, Kompetensi; ``'All'`` berarti tidak difilter. Contoh::
+
+    python -m dashboard.lecturers --tahun 20201 --kompetensi Pedagogik
+"""
+import argparse
+import sys
+
+import pandas as pd
+
+from dashboard.likert import SCORES
+from dashboard.partitions import LECTURER_COLUMNS, current_manifest, query_partitions
+
+ALL = 'All'
+
+# Dimensi filter bertingkat (kolom tampilan, urutan = urutan dropdown)
+FILTER_DIMENSIONS = ['Tahun Akademik', 'NIDN', 'Matakuliah', 'Kompetensi']
+TABLE_COLUMNS = ['Tahun Akademik', 'Nama Dosen', 'Matakuliah', 'Kompetensi',
+                 'Rata-rata per Kompetensi', 'Kategori per Kompetensi']
+SCORE_COLUMN = 'Rata-rata per Kompetensi'
+
+
+def format_nidn(value):
+    # NIDN dibaca sebagai angka sehingga nol di depan hilang
+    return str(value).zfill(10)
+
+
+def _query(sql, selection, where_prefix=""):
+    # Jalankan ``sql`` (dengan {where}) hanya di partisi Tahun Akademik terpilih
+    if len(selection) > len(FILTER_DIMENSIONS):
+        raise ValueError(f"Pilihan filter melebihi {len(FILTER_DIMENSIONS)} dimensi: {selection!r}")
+    tahun = selection[0] if selection and selection[0] != ALL else None
+    clauses = [where_prefix] if where_prefix else []
+    params = []
+    # Tahun Akademik sudah ditangani partition pruning
+    for dimension, value in list(zip(FILTER_DIMENSIONS, selection))[1:]:
+        if value == ALL:
+            continue
+        clauses.append(f"{LECTURER_COLUMNS[dimension]} = ?")
+        params.append(value)
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+    return query_partitions(sql.format(where=where), params, tahun=tahun)
+
+
+def options(dimension, *selection):
+    """Nilai ``dimension`` (terurut) yang ada untuk pilihan dimensi sebelumnya."""
+    if dimension == 'Tahun Akademik':
+        # Daftar partisi di manifest, tanpa membuka satu partisi pun
+        return sorted(int(key) for key in current_manifest()["partitions"])
+    column = LECTURER_COLUMNS[dimension]
+    result = _query(f"SELECT DISTINCT {column} FROM dosen{{where}}", selection)
+    return sorted(set(result[column].tolist()))
+
+
+def lecturers(*selection):
+    """``{nidn: nama}`` dosen yang ada untuk pilihan Tahun Akademik, urut nama."""
+    result = _query("SELECT DISTINCT nidn, nama_dosen FROM dosen{where}", selection)
+    result = result.drop_duplicates().sort_values(['nama_dosen', 'nidn'])
+    return dict(zip(result['nidn'].tolist(), result['nama_dosen'].tolist()))
+
+
+def rows(*selection, columns=TABLE_COLUMNS):
+    """Baris rekap untuk ``selection`` (urutan CSV) dengan nama kolom asli."""
+    select = ", ".join(LECTURER_COLUMNS[column] for column in columns)
+    result = _query(f"SELECT baris, {select} FROM dosen{{where}} ORDER BY baris", selection)
+    result = result.sort_values('baris', ignore_index=True).drop(columns='baris')
+    return result.rename(columns={LECTURER_COLUMNS[column]: column for column in columns})
+
+
+def kompetensi_averages(*selection):
+    """Rata-rata ``Rata-rata per Kompetensi`` per kompetensi untuk ``selection``."""
+    result = _query(
+        "SELECT kompetensi, SUM(rata_rata) AS jumlah, COUNT(rata_rata) AS cacah "
+        "FROM dosen{where} GROUP BY kompetensi",
+        selection,
+    )
+    totals = result.groupby('kompetensi').sum()
+    averages = totals['jumlah'] / totals['cacah']
+    return averages.rename_axis('Kompetensi').rename(SCORE_COLUMN)
+
+
+def score_counts(*selection):
+    """Jumlah rata-rata kompetensi yang bernilai bulat 1..5 (seperti ``likert.total_counts``)."""
+    result = _query(
+        "SELECT CAST(rata_rata AS INTEGER) AS skor, COUNT(*) AS jumlah FROM dosen{where} GROUP BY skor",
+        selection,
+        where_prefix="rata_rata IN (1, 2, 3, 4, 5)",
+    )
+    return result.groupby('skor')['jumlah'].sum().reindex(SCORES, fill_value=0)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query rekap per dosen C.6.")
+    parser.add_argument("--tahun", type=int)
+    parser.add_argument("--nidn", type=int)
+    parser.add_argument("--matakuliah")
+    parser.add_argument("--kompetensi")
+    args = parser.parse_args(argv)
+
+    selection = tuple(ALL if value is None else value
+                      for value in (args.tahun, args.nidn, args.matakuliah, args.kompetensi))
+    with pd.option_context("display.max_rows", 50, "display.width", 160):
+        print(kompetensi_averages(*selection).round(2).to_string())
+        print()
+        print(rows(*selection).to_string(index=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
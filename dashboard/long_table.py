@@ -0,0 +1,91 @@
+"""Tabel long (kategori, pertanyaan, nilai) untuk survei multi-header.
+
+Kolom survei multi-header bernama ``"KATEGORI_Pertanyaan"``. Kolom
+``pertanyaan`` berisi ID pendek dari :mod:`dashboard.questions` (urutan
+kategorinya tetap urutan teks pertanyaan); teks lengkap diambil dengan
+``question_text`` hanya untuk tampilan. Tabel long
+dibangun sekali per versi file tanpa ``melt`` dan tanpa loop per kolom: nilai
+diambil kolom demi kolom (urutan Fortran) sehingga setiap pasangan
+(kategori, pertanyaan) menempati satu blok baris yang berurutan, dan setiap
+kategori juga satu blok. Filter halaman cukup mengambil slice ``iloc`` dari
+blok tersebut (view, bukan salinan).
+"""
+import numpy as np
+import pandas as pd
+
+from dashboard.data import load_derived
+from dashboard.questions import normalize, question_id
+
+ALL = 'All'
+SEPARATOR = '_'
+
+
+class LongTable:
+    """Tabel long beserta posisi blok per kategori dan per pertanyaan."""
+
+    def __init__(self, data, separator=SEPARATOR):
+        parts = pd.Index(data.columns).str.split(separator)
+        kategori_codes, kategori_values = pd.factorize(parts.str[0], sort=True)
+        text_codes, pertanyaan_texts = pd.factorize(pd.Index([normalize(text) for text in parts.str[1]]), sort=True)
+        # Teks yang hanya berbeda spasi (atau bertabrakan hash) berbagi ID;
+        # kategori ``pertanyaan`` harus unik, jadi kolom dengan ID sama digabung
+        id_codes, pertanyaan_values = pd.factorize(pd.Index([question_id(text) for text in pertanyaan_texts]))
+        pertanyaan_codes = id_codes[text_codes]
+
+        # Kelompokkan kolom per kategori (stabil) supaya setiap kategori satu blok
+        order = np.argsort(kategori_codes, kind='stable')
+        kategori_codes = kategori_codes[order]
+        pertanyaan_codes = pertanyaan_codes[order]
+        n_rows = len(data)
+
+        values = data.iloc[:, order].to_numpy()
+        self.frame = pd.DataFrame({
+            'nilai': values.ravel(order='F'),
+            'kategori': pd.Categorical.from_codes(np.repeat(kategori_codes, n_rows), categories=kategori_values),
+            'pertanyaan': pd.Categorical.from_codes(np.repeat(pertanyaan_codes, n_rows), categories=pertanyaan_values),
+        })
+
+        # Posisi blok [start, stop) untuk setiap kategori dan setiap kolom asli
+        self._kategori_blocks = {}
+        self._pertanyaan_blocks = {}
+        for i, (k_code, p_code) in enumerate(zip(kategori_codes, pertanyaan_codes)):
+            kategori = kategori_values[k_code]
+            pertanyaan = pertanyaan_values[p_code]
+            start, stop = i * n_rows, (i + 1) * n_rows
+            first, _ = self._kategori_blocks.get(kategori, (start, stop))
+            self._kategori_blocks[kategori] = (first, stop)
+            self._pertanyaan_blocks.setdefault(pertanyaan, []).append((kategori, start, stop))
+
+    def kategori_options(self):
+        return list(self._kategori_blocks)
+
+    def pertanyaan_options(self, kategori=ALL):
+        # ID pertanyaan (urut teks pertanyaan) yang ada pada kategori terpilih
+        return [
+            pertanyaan for pertanyaan in self.frame['pertanyaan'].cat.categories
+            if kategori == ALL or any(block[0] == kategori for block in self._pertanyaan_blocks.get(pertanyaan, []))
+        ]
+
+    def view(self, kategori=ALL, pertanyaan=ALL):
+        """Baris tabel long untuk filter kategori/pertanyaan (``'All'`` = semua)."""
+        if pertanyaan == ALL:
+            if kategori == ALL:
+                return self.frame
+            start, stop = self._kategori_blocks.get(kategori, (0, 0))
+            return self.frame.iloc[start:stop]
+
+        blocks = [
+            (start, stop) for block_kategori, start, stop in self._pertanyaan_blocks.get(pertanyaan, [])
+            if kategori == ALL or block_kategori == kategori
+        ]
+        if len(blocks) == 1:
+            start, stop = blocks[0]
+            return self.frame.iloc[start:stop]
+        # Pertanyaan yang sama di beberapa kategori: gabungkan blok-bloknya
+        positions = [np.arange(start, stop) for start, stop in blocks]
+        return self.frame.take(np.concatenate(positions) if positions else np.empty(0, dtype=np.intp))
+
+
+def load_long_table(name):
+    """LongTable untuk dataset multi-header ``name``, di-cache per versi CSV."""
+    return load_derived(name, "long_table", LongTable)
@@ -0,0 +1,225 @@
+"""Riwayat rekap per dosen C.6 yang dipartisi per Tahun Akademik.
+
+Setiap Tahun Akademik di ``C.6.Kepuasandosen-prep.csv`` disimpan sebagai satu
+file SQLite (tabel ``dosen`` berindeks NIDN, Matakuliah, Kompetensi) di
+``.cache/c6_dosen``. ``manifest.json`` mencatat versi CSV sumber dan, per
+partisi, nama file, jumlah baris dan hash barisnya.
+
+Saat CSV berubah, hanya partisi yang hash-nya berbeda yang ditulis ulang:
+menambah satu semester menulis satu file baru tanpa menyentuh riwayat.
+Query (:func:`query_partitions`) hanya membuka partisi yang cocok dengan
+Tahun Akademik yang dipilih (partition pruning), jadi biaya muat dingin
+mengikuti rentang yang dipilih, bukan seluruh riwayat.
+
+Sinkronkan partisi dengan CSV dan tampilkan isi manifest::
+
+    python -m dashboard.partitions
+"""
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+
+import pandas as pd
+
+from dashboard.data import DATASETS, file_signature, load_dataset
+from dashboard.paths import CACHE_DIR
+from dashboard.timing import timed
+
+# Naikkan jika skema partisi berubah supaya semua partisi ditulis ulang
+PARTITION_VERSION = 1
+PARTITION_DATASET = "c6_dosen"
+PARTITION_DIR = CACHE_DIR / PARTITION_DATASET
+MANIFEST_PATH = PARTITION_DIR / "manifest.json"
+PARTITION_COLUMN = 'Tahun Akademik'
+
+# Kolom rekap per dosen (CSV -> tabel ``dosen``)
+LECTURER_COLUMNS = {
+    'Tahun Akademik': 'tahun_akademik',
+    'NIDN': 'nidn',
+    'Nama Dosen': 'nama_dosen',
+    'Matakuliah': 'matakuliah',
+    'Kompetensi': 'kompetensi',
+    'Rata-rata per Kompetensi': 'rata_rata',
+    'Kategori per Kompetensi': 'kategori',
+    'Jumlah Responden': 'jumlah_responden',
+}
+
+SCHEMA = """
+CREATE TABLE dosen (
+    baris INTEGER PRIMARY KEY,
+    tahun_akademik INTEGER NOT NULL,
+    nidn INTEGER NOT NULL,
+    nama_dosen TEXT NOT NULL,
+    matakuliah TEXT NOT NULL,
+    kompetensi TEXT NOT NULL,
+    rata_rata REAL,
+    kategori TEXT,
+    jumlah_responden INTEGER
+);
+CREATE INDEX dosen_nidn ON dosen (nidn);
+CREATE INDEX dosen_matakuliah ON dosen (matakuliah);
+CREATE INDEX dosen_kompetensi ON dosen (kompetensi);
+"""
+
+_checked = {}
+_lock = threading.Lock()
+
+
+def partition_file_name(tahun):
+    return f"tahun={tahun}.sqlite"
+
+
+def rows_hash(rows):
+    # Indeks ikut di-hash: ``baris`` (urutan di CSV) tersimpan di partisi
+    content = rows[list(LECTURER_COLUMNS)].to_csv().encode("utf-8")
+    return hashlib.sha1(f"{PARTITION_VERSION}\n".encode() + content).hexdigest()
+
+
+def read_manifest():
+    try:
+        with open(MANIFEST_PATH, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {"partitions": {}}
+    if manifest.get("version") != PARTITION_VERSION:
+        return {"partitions": {}}
+    return manifest
+
+
+def write_manifest(manifest):
+    tmp_path = MANIFEST_PATH.with_name(f"{MANIFEST_PATH.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(tmp_path, MANIFEST_PATH)
+
+
+def write_partition(path, rows):
+    """Tulis baris satu Tahun Akademik ke file partisi (atomik)."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.unlink(missing_ok=True)
+    columns = rows[list(LECTURER_COLUMNS)].astype(object)
+    values = columns.where(columns.notna(), None)
+    connection = sqlite3.connect(tmp_path)
+    try:
+        connection.execute("PRAGMA journal_mode = OFF")
+        connection.executescript(SCHEMA)
+        connection.executemany(
+            f"INSERT INTO dosen (baris, {', '.join(LECTURER_COLUMNS.values())}) "
+            f"VALUES (?{', ?' * len(LECTURER_COLUMNS)})",
+            # ``baris``: nomor baris di CSV (mulai 1) untuk urutan tampilan
+            ((int(i) + 1, *row) for i, row in zip(rows.index, values.itertuples(index=False, name=None))),
+        )
+        connection.commit()
+    finally:
+        connection.close()
+    os.replace(tmp_path, path)
+
+
+def sync(force=False):
+    """Samakan partisi dengan CSV; kembalikan ``(ditulis, tetap, dihapus)``."""
+    source = list(file_signature(DATASETS[PARTITION_DATASET]))
+    PARTITION_DIR.mkdir(parents=True, exist_ok=True)
+    manifest = read_manifest()
+    old = manifest["partitions"]
+    partitions = {}
+    written = []
+    kept = []
+
+    data = load_dataset(PARTITION_DATASET)
+    for tahun, rows in data.groupby(PARTITION_COLUMN, sort=True, observed=True):
+        key = str(tahun)
+        path = PARTITION_DIR / partition_file_name(tahun)
+        digest = rows_hash(rows)
+        entry = old.get(key, {})
+        if not force and entry.get("hash") == digest and path.exists():
+            kept.append(key)
+        else:
+            write_partition(path, rows)
+            written.append(key)
+        partitions[key] = {"file": path.name, "rows": len(rows), "hash": digest}
+
+    removed = sorted(set(old) - set(partitions))
+    for key in removed:
+        (PARTITION_DIR / old[key]["file"]).unlink(missing_ok=True)
+
+    write_manifest({"version": PARTITION_VERSION, "source": source, "partitions": partitions})
+    return written, kept, removed
+
+
+def current_manifest():
+    """Manifest partisi yang sesuai dengan CSV (sinkronkan dulu jika CSV berubah)."""
+    source = list(file_signature(DATASETS[PARTITION_DATASET]))
+    with _lock:
+        manifest = _checked.get("manifest")
+        if manifest is not None and manifest["source"] == source:
+            return manifest
+        manifest = read_manifest()
+        if manifest.get("source") != source or any(
+            not (PARTITION_DIR / entry["file"]).exists() for entry in manifest["partitions"].values()
+        ):
+            sync()
+            manifest = read_manifest()
+        _checked["manifest"] = manifest
+        return manifest
+
+
+def partition_paths(tahun=None):
+    """File partisi untuk ``tahun`` (satu nilai atau daftar; ``None`` = semua), urut."""
+    partitions = current_manifest()["partitions"]
+    if tahun is None:
+        keys = sorted(partitions)
+    else:
+        wanted = {str(value) for value in (tahun if isinstance(tahun, (list, tuple, set)) else [tahun])}
+        keys = sorted(key for key in partitions if key in wanted)
+    return [PARTITION_DIR / partitions[key]["file"] for key in keys]
+
+
+def query_partitions(sql, params=(), tahun=None):
+    """Hasil ``sql`` dari setiap partisi yang cocok dengan ``tahun``, digabung.
+
+    ``sql`` dijalankan terpisah per partisi, jadi agregat harus digabung oleh
+    pemanggil (misalnya jumlah dan cacah, bukan rata-rata).
+    """
+    frames = []
+    for path in partition_paths(tahun):
+        connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            with timed("load", path.name):
+                frame = pd.read_sql_query(sql, connection, params=params)
+        finally:
+            connection.close()
+        # Hasil kosong (tipe kolom object) tidak ikut digabung
+        if not frame.empty:
+            frames.append(frame)
+    if not frames:
+        # Tidak ada partisi yang cocok: hasil kosong dengan kolom yang benar
+        connection = sqlite3.connect(":memory:")
+        try:
+            connection.executescript(SCHEMA)
+            return pd.read_sql_query(sql, connection, params=params)
+        finally:
+            connection.close()
+    return pd.concat(frames, ignore_index=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sinkronkan partisi C.6 per Tahun Akademik.")
+    parser.add_argument("--force", action="store_true", help="tulis ulang semua partisi")
+    args = parser.parse_args(argv)
+
+    written, kept, removed = sync(force=args.force)
+    for key, entry in sorted(read_manifest()["partitions"].items()):
+        status = "ditulis" if key in written else "tetap"
+        print(f"{key}  {entry['rows']:>6} baris  {entry['file']:<24} {status}")
+    if removed:
+        print(f"Dihapus: {', '.join(removed)}")
+    print(f"{len(written)} partisi ditulis, {len(kept)} tetap di {PARTITION_DIR}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,12 @@
+"""Lokasi folder yang dipakai bersama oleh modul dashboard."""
+import os
+from pathlib import Path
+
+# Folder root repositori
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+# Folder tempat file CSV survei berada (bisa diarahkan ke data sintetis)
+DATA_DIR = Path(os.environ.get("DASHBOARD_DATA_DIR", BASE_DIR))
+
+# Folder artefak turunan (cache kolumnar, snapshot KPI, dll.)
+CACHE_DIR = Path(os.environ.get("DASHBOARD_CACHE_DIR", BASE_DIR / ".cache"))
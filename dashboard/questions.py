@@ -0,0 +1,157 @@
+"""Registri ID pendek untuk pertanyaan survei.
+
+Nama kolom survei berupa kalimat pertanyaan lengkap (hingga ~150 karakter)
+yang dipakai sebagai kunci groupby, variabel ``melt``, nilai kategori tabel
+long, kunci cache figure dan isi payload chart. Setiap pertanyaan mendapat ID
+pendek yang stabil, ``q`` + 8 digit heksadesimal SHA-1 dari teks pertanyaan
+yang dinormalisasi (spasi dirapikan). ID hanya bergantung pada teks, jadi
+tetap sama walaupun urutan kolom berubah, dan pertanyaan yang sama di
+beberapa survei mendapat ID yang sama.
+
+Perhitungan memakai ID; teks lengkap hanya diambil kembali untuk tampilan
+(label dropdown, tabel) lewat :func:`question_text` dan :func:`display_frame`.
+
+Daftar semua pertanyaan beserta ID dan survei asalnya (keluar dengan kode 1
+jika ada dua teks berbeda dengan ID sama)::
+
+    python -m dashboard.questions
+"""
+import argparse
+import hashlib
+import re
+import sys
+import textwrap
+import threading
+
+import pandas as pd
+
+from dashboard.data import DATASETS, MULTI_HEADER_DATASETS, load_derived, resolve_path
+
+ID_PREFIX = "q"
+ID_LENGTH = 8
+# Kolom teks pertanyaan untuk hover chart (nilai sumbu/warna tetap berupa ID)
+HOVER_COLUMN = "Pertanyaan"
+HOVER_WIDTH = 60
+# Dataset yang kolomnya berupa field rekap, bukan pertanyaan survei
+NON_QUESTION_DATASETS = {"c6_dosen"}
+
+_texts = {}
+_scanned = False
+_lock = threading.Lock()
+
+
+def normalize(text):
+    return re.sub(r"\s+", " ", str(text)).strip()
+
+
+def question_id(text):
+    """ID pendek dan stabil untuk teks pertanyaan ``text``."""
+    text = normalize(text)
+    qid = ID_PREFIX + hashlib.sha1(text.encode("utf-8")).hexdigest()[:ID_LENGTH]
+    with _lock:
+        _texts.setdefault(qid, text)
+    return qid
+
+
+def question_columns(name):
+    # Teks pertanyaan dataset ``name`` dari header CSV saja (tanpa memuat data)
+    path = resolve_path(DATASETS[name])
+    if name in MULTI_HEADER_DATASETS:
+        header = pd.read_csv(path, header=[0, 1], nrows=0, encoding="utf-8").columns
+        return [pertanyaan for _, pertanyaan in header]
+    return list(pd.read_csv(path, nrows=0).columns)
+
+
+def _scan_sources():
+    # Daftarkan semua pertanyaan dari header CSV (sekali per proses)
+    global _scanned
+    for name in DATASETS:
+        if name in NON_QUESTION_DATASETS:
+            continue
+        try:
+            for text in question_columns(name):
+                question_id(text)
+        except OSError:
+            continue
+    _scanned = True
+
+
+def question_text(qid):
+    """Teks lengkap untuk ``qid`` (``qid`` apa adanya jika tidak dikenal)."""
+    with _lock:
+        text = _texts.get(qid)
+    if text is None and not _scanned and str(qid).startswith(ID_PREFIX):
+        _scan_sources()
+        with _lock:
+            text = _texts.get(qid)
+    return qid if text is None else text
+
+
+def with_ids(name):
+    """Dataset ``name`` dengan kolom pertanyaan diganti ID, di-cache per versi CSV."""
+    return load_derived(name, "question_ids", lambda data: data.rename(columns=question_id))
+
+
+def is_question_id(value):
+    with _lock:
+        return value in _texts
+
+
+def display_frame(frame, columns=()):
+    """Salinan ``frame`` untuk tampilan: label kolom ID dan nilai ID di ``columns`` jadi teks."""
+    frame = frame.rename(columns=lambda column: question_text(column) if is_question_id(column) else column)
+    for column in columns:
+        values = frame[column]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            frame[column] = values.cat.rename_categories(question_text)
+        else:
+            frame[column] = values.map(question_text)
+    return frame
+
+
+def with_hover_text(frame, column, hover_column=HOVER_COLUMN):
+    """Salinan ``frame`` dengan kolom ``hover_column``: teks pertanyaan ``column``, dipatah per baris.
+
+    Dipakai sebagai ``hover_data`` chart yang sumbu atau warnanya memakai ID,
+    supaya hover menampilkan pertanyaan, bukan ID.
+    """
+    texts = {qid: "<br>".join(textwrap.wrap(question_text(qid), HOVER_WIDTH))
+             for qid in frame[column].unique()}
+    return frame.assign(**{hover_column: frame[column].map(texts).astype(object)})
+
+
+def registry(names=None):
+    """Tabel ID, teks dan dataset asal setiap pertanyaan."""
+    rows = {}
+    for name in names or DATASETS:
+        if name in NON_QUESTION_DATASETS:
+            continue
+        for text in question_columns(name):
+            text = normalize(text)
+            entry = rows.setdefault((question_id(text), text), [])
+            if name not in entry:
+                entry.append(name)
+    return pd.DataFrame(
+        [(qid, text, ", ".join(datasets)) for (qid, text), datasets in rows.items()],
+        columns=["id", "pertanyaan", "dataset"],
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Daftar ID pertanyaan survei.")
+    parser.add_argument("--datasets", nargs="+", choices=list(DATASETS))
+    args = parser.parse_args(argv)
+
+    table = registry(args.datasets)
+    for row in table.itertuples(index=False):
+        print(f"{row.id}  {row.pertanyaan[:90]:<90}  {row.dataset}")
+    collisions = table[table.duplicated("id", keep=False)]
+    if not collisions.empty:
+        print(f"\nID bentrok untuk teks berbeda:\n{collisions.to_string(index=False)}", file=sys.stderr)
+        return 1
+    print(f"\n{len(table)} pertanyaan")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,228 @@
+"""Rapor kepuasan per dosen (C.6) yang dirender massal ke PNG/PDF.
+
+Setiap dosen (NIDN) di ``C.6.Kepuasandosen-prep.csv`` mendapat satu file
+berisi donut per kompetensi, rata-rata per semester, dan tabel mata kuliah.
+Render dibagi ke beberapa proses (``ProcessPoolExecutor``) karena membangun
+figure dan mengekspor gambar terikat CPU dan memakan waktu per file.
+
+Hash baris data setiap dosen disimpan di ``manifest.json`` folder keluaran;
+dosen yang barisnya tidak berubah sejak run terakhir (dan filenya masih ada)
+dilewati. Ekspor PNG/PDF memakai kaleido; jika kaleido tidak terpasang, rapor
+ditulis sebagai HTML mandiri (offline) beserta peringatan::
+
+    python -m dashboard.reportcard reports/ --format pdf --workers 4
+"""
+import argparse
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from dashboard.data import load_dataset
+from dashboard.lecturers import format_nidn
+
+# Naikkan jika tampilan rapor berubah supaya semua file dirender ulang
+REPORT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+FORMATS = ["png", "pdf", "html"]
+KOMPETENSI = ['Pedagogik', 'Profesional', 'Kepribadian', 'Sosial']
+TABLE_COLUMNS = ['Tahun Akademik', 'Matakuliah', 'Kompetensi', 'Rata-rata per Kompetensi',
+                 'Kategori per Kompetensi', 'Jumlah Responden']
+
+logger = logging.getLogger(__name__)
+
+
+def rows_hash(rows):
+    content = rows.to_csv(index=False).encode("utf-8")
+    return hashlib.sha1(f"{REPORT_VERSION}\n".encode() + content).hexdigest()
+
+
+def report_file_name(nidn, nama, fmt):
+    return f"{nidn}-{re.sub(r'[^0-9A-Za-z]+', '-', nama).strip('-').lower()}.{fmt}"
+
+
+def lecturer_rows(data):
+    """Baris data per dosen: ``{nidn: (nama, DataFrame)}`` sesuai urutan file."""
+    return {
+        format_nidn(nidn): (rows['Nama Dosen'].iloc[0], rows.reset_index(drop=True))
+        for nidn, rows in data.groupby('NIDN', sort=False)
+    }
+
+
+# Fungsi untuk membangun figure rapor satu dosen
+def build_report_figure(nama, nidn, rows):
+    import plotly.express as px
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    kompetensi_list = [k for k in KOMPETENSI if k in set(rows['Kompetensi'])]
+    table = rows[TABLE_COLUMNS].sort_values(['Tahun Akademik', 'Matakuliah', 'Kompetensi'])
+    fig = make_subplots(
+        rows=3,
+        cols=4,
+        specs=[
+            [{"type": "domain"}] * 4,
+            [{"type": "xy", "colspan": 4}, None, None, None],
+            [{"type": "table", "colspan": 4}, None, None, None],
+        ],
+        row_heights=[0.25, 0.3, 0.45],
+        vertical_spacing=0.06,
+        subplot_titles=[f"Kompetensi {k}" for k in kompetensi_list]
+        + [None] * (4 - len(kompetensi_list))
+        + ["Rata-rata Nilai Kompetensi per Tahun Akademik", None],
+    )
+
+    # Donut Puas / Tidak Puas per kompetensi (sama seperti halaman C.6)
+    colors = px.colors.sequential.Purpor
+    for i, kompetensi in enumerate(kompetensi_list):
+        avg_score = rows.loc[rows['Kompetensi'] == kompetensi, 'Rata-rata per Kompetensi'].mean()
+        fulfilled_percentage = (avg_score / 5) * 100
+        fig.add_trace(go.Pie(
+            labels=['Puas', 'Tidak Puas'],
+            values=[fulfilled_percentage, 100 - fulfilled_percentage],
+            hole=0.4,
+            marker_colors=[colors[-1], colors[1]],
+            showlegend=i == 0,
+            legendgroup="status",
+        ), row=1, col=i + 1)
+
+    # Rata-rata per semester untuk setiap kompetensi
+    per_semester = (rows.groupby(['Tahun Akademik', 'Kompetensi'])['Rata-rata per Kompetensi']
+                    .mean().unstack())
+    for kompetensi in kompetensi_list:
+        fig.add_trace(go.Bar(
+            x=per_semester.index.astype(str),
+            y=per_semester[kompetensi].round(2),
+            name=kompetensi,
+        ), row=2, col=1)
+    fig.update_xaxes(type="category", title_text="Tahun Akademik", row=2, col=1)
+    fig.update_yaxes(range=[0, 5], title_text="Rata-rata Nilai", row=2, col=1)
+
+    # Tabel mata kuliah
+    fig.add_trace(go.Table(
+        header={"values": TABLE_COLUMNS, "fill_color": colors[2], "font": {"color": "white"}},
+        cells={"values": [table[column] for column in TABLE_COLUMNS]},
+    ), row=3, col=1)
+
+    fig.update_layout(
+        title=f"Rapor Kepuasan Pembelajaran: {nama} (NIDN {nidn})",
+        barmode="group",
+        width=1200,
+        height=900 + 22 * len(table),
+        legend_orientation="h",
+    )
+    return fig
+
+
+def render_report(nidn, nama, rows, path, fmt):
+    fig = build_report_figure(nama, nidn, rows)
+    if fmt == "html":
+        # plotly.min.js ditulis sekali di folder keluaran oleh render_all
+        fig.write_html(path, include_plotlyjs="directory", full_html=True)
+    else:
+        fig.write_image(path, format=fmt)
+    return path
+
+
+def _render_job(job):
+    nidn, nama, rows, path, fmt, digest = job
+    render_report(nidn, nama, rows, path, fmt)
+    return nidn, digest
+
+
+def read_manifest(output_dir):
+    try:
+        with open(output_dir / MANIFEST_NAME, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_manifest(output_dir, manifest):
+    path = output_dir / MANIFEST_NAME
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def resolve_format(fmt):
+    # Ekspor gambar butuh kaleido; tanpa itu rapor tetap dibuat sebagai HTML
+    if fmt != "html" and importlib.util.find_spec("kaleido") is None:
+        logger.warning(
+            "kaleido tidak terpasang: rapor ditulis sebagai HTML, bukan %s "
+            "(pasang dengan `pip install -r requirements.txt`)", fmt.upper()
+        )
+        return "html"
+    return fmt
+
+
+def render_all(output_dir, fmt="png", workers=None, nidns=None, force=False):
+    """Render rapor semua dosen; kembalikan ``(ditulis, dilewati)``.
+
+    ``fmt`` dipakai apa adanya: pemanggil yang meminta PNG/PDF sebaiknya
+    melewatkannya ke :func:`resolve_format` dulu.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    # NIDN boleh ditulis tanpa nol di depan (seperti di CSV)
+    nidns = {format_nidn(value) for value in nidns} if nidns else None
+    manifest = read_manifest(output_dir)
+
+    jobs = []
+    skipped = []
+    for nidn, (nama, rows) in lecturer_rows(load_dataset("c6_dosen")).items():
+        if nidns and nidn not in nidns:
+            continue
+        path = output_dir / report_file_name(nidn, nama, fmt)
+        digest = rows_hash(rows)
+        entry = manifest.get(nidn, {})
+        if not force and entry.get("hash") == digest and entry.get("file") == path.name and path.exists():
+            skipped.append(nidn)
+            continue
+        jobs.append((nidn, nama, rows, path, fmt, digest))
+        manifest[nidn] = {"nama": nama, "file": path.name}
+
+    if fmt == "html" and jobs:
+        from plotly.offline import get_plotlyjs
+
+        (output_dir / "plotly.min.js").write_text(get_plotlyjs(), encoding="utf-8")
+
+    written = []
+    pool = ProcessPoolExecutor(max_workers=workers) if workers != 1 and len(jobs) > 1 else None
+    try:
+        for nidn, digest in (pool.map if pool else map)(_render_job, jobs):
+            manifest[nidn]["hash"] = digest
+            written.append(nidn)
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        # Simpan kemajuan walaupun ada render yang gagal: dosen yang sudah
+        # selesai tidak perlu dirender ulang pada run berikutnya
+        write_manifest(output_dir, manifest)
+    return written, skipped
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render rapor kepuasan C.6 untuk setiap dosen.")
+    parser.add_argument("output_dir", type=Path)
+    parser.add_argument("--format", choices=FORMATS, default="png")
+    parser.add_argument("--workers", type=int, default=None, help="jumlah proses (default: jumlah CPU)")
+    parser.add_argument("--nidn", nargs="+", help="hanya dosen dengan NIDN ini")
+    parser.add_argument("--force", action="store_true", help="render ulang walaupun data tidak berubah")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(format="%(levelname)s: %(message)s")
+    fmt = resolve_format(args.format)
+    written, skipped = render_all(args.output_dir, fmt, args.workers, args.nidn, args.force)
+    print(f"{len(written)} rapor {fmt.upper()} ditulis, {len(skipped)} dilewati (tidak berubah) di {args.output_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+"""Pengukuran time-to-first-paint halaman dan impor modul berat yang ditunda.
+
+Setiap halaman memanggil :func:`page_started` tepat setelah ``import
+streamlit`` (sebelum pandas/plotly/data dimuat) dan :func:`first_paint`
+setelah chart pertamanya dikirim ke browser. Selisihnya dibandingkan dengan
+anggaran ``DASHBOARD_STARTUP_BUDGET`` (detik, default 1.0); render yang
+melewati anggaran dicatat sebagai peringatan di log. Jika trace diminta
+(lihat :mod:`dashboard.timing`), hasilnya juga ditulis ke
+``.cache/startup.jsonl`` beserta penanda ``cold`` (render pertama halaman itu
+di proses ini) bersama catatan render lainnya di akhir render.
+
+Ukur cold start setiap halaman di proses baru lalu tampilkan ringkasan::
+
+    python -m dashboard.startup --measure
+    python -m dashboard.startup            # ringkasan catatan yang sudah ada
+"""
+import argparse
+import importlib
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+
+from dashboard import timing
+from dashboard.paths import BASE_DIR, CACHE_DIR
+
+STARTUP_BUDGET = float(os.environ.get("DASHBOARD_STARTUP_BUDGET", "1.0"))
+TRACE_PATH = CACHE_DIR / "startup.jsonl"
+
+# File skrip setiap halaman (nama halaman sama dengan dashboard.bench)
+PAGE_FILES = {
+    "home": "1_Home.py",
+    "c1": "pages/2_C.1.VisidanMisi.py",
+    "c2": "pages/3_C.2.TataKelola,TataPamong,danKerjaSama.py",
+    "c3": "pages/4_C.3.Mahasiswa.py",
+    "c4": "pages/5_C.4.SumberDayaManusia.py",
+    "c5": "pages/6_C.5.Keuangan,Sarana,danPrasarana.py",
+    "c6": "pages/7_C.6.Pendidikan.py",
+    "c7": "pages/8_C.7.Penelitian.py",
+    "c8": "pages/9_C.8.PengabdianKepadaMasyarakat.py",
+}
+
+logger = logging.getLogger(__name__)
+
+# Setiap sesi Streamlit menjalankan skrip di thread-nya sendiri
+_run = threading.local()
+_seen_pages = set()
+_lock = threading.Lock()
+
+
+class _DeferredModule:
+    # Pengganti modul yang mengimpor modul aslinya saat atribut pertama dipakai.
+    # ``importlib.import_module`` memakai lock impor per modul, jadi aman bila
+    # beberapa sesi (thread) merender pertama kali bersamaan; LazyLoader belum
+    # aman untuk thread sebelum Python 3.12.
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attribute):
+        module = self._module
+        if module is None:
+            module = self._module = importlib.import_module(self._name)
+        return getattr(module, attribute)
+
+    def __repr__(self):
+        return f"<modul tertunda {self._name!r}>"
+
+
+def lazy_import(name):
+    """Modul ``name`` yang baru benar-benar diimpor saat atributnya dipakai."""
+    if name in sys.modules:
+        return sys.modules[name]
+    return _DeferredModule(name)
+
+
+def page_started(page):
+    """Tandai awal render ``page``; panggil sebelum impor/muat data yang berat."""
+    with _lock:
+        cold = page not in _seen_pages
+        _seen_pages.add(page)
+    _run.page = page
+    _run.cold = cold
+    _run.start = time.perf_counter()
+    _run.painted = False
+    timing.begin(page)
+
+
+def first_paint():
+    """Catat time-to-first-paint render ini (hanya panggilan pertama per render)."""
+    if getattr(_run, "painted", True):
+        return None
+    _run.painted = True
+    seconds = time.perf_counter() - _run.start
+    over_budget = seconds > STARTUP_BUDGET
+    timing.defer_trace(TRACE_PATH, {
+        "time": time.time(),
+        "page": _run.page,
+        "cold": _run.cold,
+        "seconds": round(seconds, 4),
+        "budget": STARTUP_BUDGET,
+        "over_budget": over_budget,
+    })
+    if over_budget:
+        logger.warning("Halaman %s: first paint %.2fs melewati anggaran %.2fs%s",
+                       _run.page, seconds, STARTUP_BUDGET, " (cold start)" if _run.cold else "")
+    return seconds
+
+
+def read_trace(offset=0):
+    try:
+        with open(TRACE_PATH, encoding="utf-8") as f:
+            f.seek(offset)
+            return [json.loads(line) for line in f if line.strip()]
+    except OSError:
+        return []
+
+
+def summarize(records, budget=STARTUP_BUDGET):
+    lines = [f"{'halaman':<8} {'jenis':<6}{'n':>5}{'median':>10}{'maks':>10}  lewat anggaran {budget:.2f}s"]
+    lines.append("-" * len(lines[0]))
+    for page in PAGE_FILES:
+        for cold in (True, False):
+            seconds = sorted(r["seconds"] for r in records if r["page"] == page and r["cold"] == cold)
+            if not seconds:
+                continue
+            over = sum(1 for s in seconds if s > budget)
+            lines.append(f"{page:<8} {'cold' if cold else 'warm':<6}{len(seconds):>5}"
+                         f"{seconds[len(seconds) // 2]:>9.3f}s{seconds[-1]:>9.3f}s  {over}")
+    return "\n".join(lines)
+
+
+def measure(pages, repeat=1):
+    """Render setiap halaman di proses Python baru (cold start) secara headless."""
+    offset = TRACE_PATH.stat().st_size if TRACE_PATH.exists() else 0
+    script = (
+        "import sys\n"
+        "from streamlit.testing.v1 import AppTest\n"
+        "AppTest.from_file(sys.argv[1], default_timeout=300).run()\n"
+    )
+    # Render di proses anak selalu menulis trace
+    env = dict(os.environ, DASHBOARD_TIMING_TRACE="1")
+    for page in pages:
+        for _ in range(repeat):
+            subprocess.run([sys.executable, "-c", script, str(BASE_DIR / PAGE_FILES[page])],
+                           cwd=BASE_DIR, env=env, check=True, capture_output=True)
+    if TRACE_PATH.exists() and TRACE_PATH.stat().st_size < offset:
+        offset = 0  # file dirotasi selama pengukuran
+    return [record for record in read_trace(offset) if record["page"] in pages and record["cold"]]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ringkasan time-to-first-paint halaman dashboard.")
+    parser.add_argument("--measure", action="store_true", help="ukur cold start setiap halaman di proses baru")
+    parser.add_argument("--pages", nargs="+", choices=list(PAGE_FILES), default=list(PAGE_FILES))
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--budget", type=float, default=STARTUP_BUDGET, help="anggaran first paint (detik)")
+    args = parser.parse_args(argv)
+
+    records = measure(args.pages, args.repeat) if args.measure else read_trace()
+    if not records:
+        print(f"Belum ada catatan di {TRACE_PATH}")
+        return 0
+    print(summarize(records, args.budget))
+    over = [r for r in records if r["cold"] and r["seconds"] > args.budget]
+    return 1 if args.measure and over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
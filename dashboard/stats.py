@@ -0,0 +1,237 @@
+"""Interval kepercayaan rata-rata skor per pertanyaan (dan per grup).
+
+Semua pertanyaan dihitung sekaligus dari matriks jawaban (baris x
+pertanyaan). Bootstrap tidak mengambil ulang baris satu per satu: setiap
+resample dinyatakan sebagai bobot multinomial per baris, sehingga ``B``
+resample menjadi satu matriks bobot ``(B, baris)`` dan rata-rata semua
+resample x pertanyaan diperoleh dengan dua perkalian matriks. Sel kosong
+(NaN) tidak dihitung, sama seperti ``DataFrame.mean()`` di halaman. Bobot
+dibangkitkan per potongan resample (paling banyak ``BOOTSTRAP_CHUNK_CELLS``
+sel) sehingga memori tetap terbatas walaupun respondennya jutaan.
+
+Selain bootstrap persentil tersedia interval analitik (Student t; nilai
+kritis eksak untuk derajat bebas kecil). Hasil
+di-cache per versi CSV lewat :func:`dashboard.data.load_derived`, jadi pita
+interval tidak menambah biaya per rerun. Seed tetap supaya pita tidak
+berubah antar proses.
+
+Tampilkan interval satu dataset::
+
+    python -m dashboard.stats c8 --method analytic
+"""
+import argparse
+import functools
+import math
+import sys
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+from dashboard.data import DATASETS, load_dataset, load_derived
+
+METHODS = ["bootstrap", "analytic"]
+DEFAULT_LEVEL = 0.95
+DEFAULT_RESAMPLES = 2000
+SEED = 0
+# Batas sel matriks bobot bootstrap per potongan (float64: 4 juta sel = 32 MB)
+BOOTSTRAP_CHUNK_CELLS = 4_000_000
+# Di bawah derajat bebas ini nilai kritis t dihitung eksak, bukan dihampiri
+EXACT_T_DF = 30
+
+MEAN_COLUMN = 'Rata-Rata Skor'
+LOWER_COLUMN = 'CI Bawah'
+UPPER_COLUMN = 'CI Atas'
+COUNT_COLUMN = 'n'
+
+
+def response_matrix(data, exclude=()):
+    # Matriks float (baris x pertanyaan) dari kolom numerik; sel kosong tetap NaN
+    numeric = data.select_dtypes(include="number")
+    numeric = numeric.drop(columns=[col for col in exclude if col in numeric.columns])
+    return numeric.to_numpy(dtype="float64", na_value=np.nan), list(numeric.columns)
+
+
+def t_cdf(t, df):
+    """CDF distribusi Student t untuk derajat bebas bulat ``df`` (bentuk tertutup)."""
+    theta = math.atan2(t, math.sqrt(df))
+    cos2 = math.cos(theta) ** 2
+    if df % 2:
+        # df ganjil: 2/pi * (theta + sin cos (1 + 2/3 cos^2 + 2*4/(3*5) cos^4 + ...))
+        term = total = 1.0
+        for k in range(1, (df - 3) // 2 + 1):
+            term *= cos2 * (2 * k) / (2 * k + 1)
+            total += term
+        tail = math.sin(theta) * math.cos(theta) * total if df > 1 else 0.0
+        area = 2 / math.pi * (theta + tail)
+    else:
+        # df genap: sin (1 + 1/2 cos^2 + 1*3/(2*4) cos^4 + ...)
+        term = total = 1.0
+        for k in range(1, (df - 2) // 2 + 1):
+            term *= cos2 * (2 * k - 1) / (2 * k)
+            total += term
+        area = math.sin(theta) * total
+    return 0.5 + area / 2
+
+
+@functools.lru_cache(maxsize=None)
+def t_table(p):
+    """Nilai kritis t eksak untuk ``p`` > 0.5 dan df ``1..EXACT_T_DF - 1`` (indeks df - 1)."""
+    table = []
+    for df in range(1, EXACT_T_DF):
+        low, high = 0.0, 1.0
+        while t_cdf(high, df) < p:
+            high *= 2
+        # Bisection sampai presisi float
+        for _ in range(100):
+            middle = (low + high) / 2
+            low, high = (middle, high) if t_cdf(middle, df) < p else (low, middle)
+        table.append((low + high) / 2)
+    return tuple(table)
+
+
+def t_quantile(p, df):
+    """Kuantil distribusi Student t.
+
+    Eksak (tabel dari :func:`t_table`) untuk ``df < EXACT_T_DF``; di atasnya
+    ekspansi Cornish-Fisher dari kuantil normal, yang galatnya sudah di bawah
+    0.001.
+    """
+    if df <= 0:
+        return math.nan
+    if p == 0.5:
+        return 0.0
+    if df < EXACT_T_DF:
+        value = t_table(max(p, 1 - p))[int(df) - 1]
+        return value if p > 0.5 else -value
+    z = NormalDist().inv_cdf(p)
+    return (z
+            + (z ** 3 + z) / (4 * df)
+            + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * df ** 2)
+            + (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / (384 * df ** 3))
+
+
+def _analytic(values, level):
+    valid = ~np.isnan(values)
+    n = valid.sum(axis=0)
+    filled = np.where(valid, values, 0.0)
+    # Rata-rata hanya untuk n >= 1 dan simpangan baku hanya untuk n >= 2;
+    # kolom lain langsung NaN tanpa melewati nanmean/nanstd (RuntimeWarning)
+    mean = np.full(values.shape[1], np.nan)
+    np.divide(filled.sum(axis=0), n, out=mean, where=n > 0)
+    squares = np.where(valid, values - mean, 0.0) ** 2
+    std = np.full(values.shape[1], np.nan)
+    np.sqrt(squares.sum(axis=0) / np.maximum(n - 1, 1), out=std, where=n > 1)
+    t = np.array([t_quantile(0.5 + level / 2, count - 1) for count in n])
+    half = t * std / np.sqrt(np.maximum(n, 1))
+    return mean, mean - half, mean + half, n
+
+
+def _bootstrap(values, level, resamples, rng):
+    valid = ~np.isnan(values)
+    n_rows = len(values)
+    n = valid.sum(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.where(n > 0, np.nansum(values, axis=0) / n, np.nan)
+        if n_rows == 0:
+            return mean, mean, mean, n
+        filled = np.where(valid, values, 0.0)
+        valid = valid.astype(np.float64)
+        probabilities = np.full(n_rows, 1 / n_rows)
+        chunk = max(1, BOOTSTRAP_CHUNK_CELLS // n_rows)
+        means = np.empty((resamples, values.shape[1]))
+        for start in range(0, resamples, chunk):
+            stop = min(start + chunk, resamples)
+            # Bobot (potongan B, baris): berapa kali setiap baris terambil di setiap resample
+            weights = rng.multinomial(n_rows, probabilities, size=stop - start).astype(np.float64)
+            means[start:stop] = (weights @ filled) / (weights @ valid)
+    alpha = (1 - level) / 2
+    lower, upper = np.nanquantile(means, [alpha, 1 - alpha], axis=0)
+    return mean, lower, upper, n
+
+
+def mean_ci(data, group_column=None, method="bootstrap", level=DEFAULT_LEVEL,
+            resamples=DEFAULT_RESAMPLES, seed=SEED):
+    """Rata-rata dan interval kepercayaan setiap pertanyaan (per grup jika diberikan).
+
+    Indeks hasil: pertanyaan, atau (grup, pertanyaan) dengan ``group_column``.
+    Kolom: ``Rata-Rata Skor``, ``CI Bawah``, ``CI Atas``, ``n``. Bootstrap per
+    grup meresample baris di dalam grupnya sendiri.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Metode interval tidak dikenal: {method!r} (pilih {METHODS})")
+    exclude = [group_column] if group_column is not None else []
+    values, questions = response_matrix(data, exclude=exclude)
+    rng = np.random.default_rng(seed)
+
+    def estimate(block):
+        if method == "analytic":
+            return _analytic(block, level)
+        return _bootstrap(block, level, resamples, rng)
+
+    def frame(parts, index):
+        mean, lower, upper, n = parts
+        return pd.DataFrame(
+            {MEAN_COLUMN: mean, LOWER_COLUMN: lower, UPPER_COLUMN: upper, COUNT_COLUMN: n},
+            index=index,
+        )
+
+    if group_column is None:
+        return frame(estimate(values), pd.Index(questions, name="Pertanyaan"))
+
+    group_codes, groups = pd.factorize(data[group_column], sort=True)
+    frames = []
+    for code, group in enumerate(groups):
+        index = pd.MultiIndex.from_product([[group], questions], names=[group_column, "Pertanyaan"])
+        frames.append(frame(estimate(values[group_codes == code]), index))
+    return pd.concat(frames)
+
+
+def load_mean_ci(name, group_column=None, method="bootstrap"):
+    """:func:`mean_ci` untuk dataset ``name``, di-cache per versi CSV."""
+    return load_derived(name, ("mean_ci", group_column, method),
+                        lambda data: mean_ci(data, group_column=group_column, method=method))
+
+
+def with_ci(frame, ci, question_column='Pertanyaan', group_column=None):
+    """Salinan ``frame`` dengan kolom ``CI Bawah``/``CI Atas`` dari ``ci``.
+
+    Baris dicocokkan lewat nilai ``question_column`` (dan ``group_column`` jika
+    ``ci`` per grup). Batas dibulatkan dua desimal seperti tampilan skor.
+    """
+    if group_column is None:
+        keys = frame[question_column].to_numpy()
+    else:
+        keys = pd.MultiIndex.from_arrays([frame[group_column].to_numpy(), frame[question_column].to_numpy()])
+    matched = ci.reindex(keys)
+    frame = frame.copy()
+    frame[LOWER_COLUMN] = matched[LOWER_COLUMN].round(2).to_numpy()
+    frame[UPPER_COLUMN] = matched[UPPER_COLUMN].round(2).to_numpy()
+    return frame
+
+
+def error_bars(frame):
+    """Argumen ``error_y``/``error_y_minus`` px.bar dari kolom rata-rata dan CI ``frame``."""
+    return {
+        "error_y": frame[UPPER_COLUMN] - frame[MEAN_COLUMN],
+        "error_y_minus": frame[MEAN_COLUMN] - frame[LOWER_COLUMN],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Interval kepercayaan rata-rata skor per pertanyaan.")
+    parser.add_argument("dataset", choices=list(DATASETS))
+    parser.add_argument("--method", choices=METHODS, default="bootstrap")
+    parser.add_argument("--group", help="kolom grup (misalnya kolom Status)")
+    parser.add_argument("--level", type=float, default=DEFAULT_LEVEL)
+    parser.add_argument("--resamples", type=int, default=DEFAULT_RESAMPLES)
+    args = parser.parse_args(argv)
+
+    ci = mean_ci(load_dataset(args.dataset), args.group, args.method, args.level, args.resamples)
+    with pd.option_context("display.max_rows", None, "display.max_colwidth", 60, "display.width", 160):
+        print(ci.round(3).to_string())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
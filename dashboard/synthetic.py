@@ -0,0 +1,153 @@
+"""Generator data survei sintetis dengan skema yang sama persis dengan CSV prep.
+
+Sel header setiap CSV disalin dari file asli (termasuk header dua baris
+dan BOM), lalu baris data diisi dengan sampel acak dari nilai yang muncul di
+kolom tersebut sehingga domain nilainya (skala 1-4/1-5, teks Status, dll.)
+tetap sama. Data C.6 dosen dibangun ulang per semester, dosen, mata kuliah dan
+kompetensi supaya filter dan agregat per dosen bisa diuji pada skala besar.
+
+Jalankan dashboard dengan data sintetis::
+
+    python -m dashboard.synthetic /tmp/survei-100k --rows 100000
+    DASHBOARD_DATA_DIR=/tmp/survei-100k DASHBOARD_CACHE_DIR=/tmp/survei-100k/.cache \\
+        streamlit run 1_Home.py
+"""
+import argparse
+import codecs
+import csv
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from dashboard.data import DATASETS, MULTI_HEADER_DATASETS
+from dashboard.paths import BASE_DIR
+
+KOMPETENSI = ['Pedagogik', 'Profesional', 'Kepribadian', 'Sosial']
+
+
+def has_bom(path):
+    with open(path, 'rb') as f:
+        return f.read(3) == codecs.BOM_UTF8
+
+
+def read_header(path, n_rows):
+    # Baris header mentah (list sel) tanpa interpretasi pandas
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        reader = csv.reader(f)
+        return [next(reader) for _ in range(n_rows)]
+
+
+def _sample_columns(source, n_rows, rng):
+    # Sampel per kolom dari nilai mentah yang muncul di CSV asli
+    columns = {}
+    for i in range(source.shape[1]):
+        values = source.iloc[:, i].to_numpy()
+        columns[i] = values[rng.integers(0, len(values), n_rows)] if len(values) else [''] * n_rows
+    return pd.DataFrame(columns)
+
+
+def generate_survey(path, n_rows, rng, header_rows=1):
+    header = read_header(path, header_rows)
+    source = pd.read_csv(path, header=None, skiprows=header_rows, dtype=str, keep_default_na=False,
+                         encoding='utf-8-sig')
+    return header, _sample_columns(source, n_rows, rng)
+
+
+def _kategori(scores):
+    return np.select([scores > 4, scores > 3, scores > 2], ['Sangat Baik', 'Baik', 'Cukup'], 'Kurang')
+
+
+def generate_c6_dosen(path, n_rows, rng, semesters=8, lecturers=None, courses_per_lecturer=3):
+    """C.6 dosen: blok 4 baris kompetensi per (semester, dosen, mata kuliah)."""
+    header = read_header(path, 1)
+    source = pd.read_csv(path, dtype=str, keep_default_na=False, encoding='utf-8-sig')
+    pertanyaan = source.groupby('Kompetensi')['Jumlah Pertanyaan'].first().astype(int)
+
+    n_blocks = max(1, -(-n_rows // len(KOMPETENSI)))
+    if lecturers is None:
+        lecturers = max(1, n_blocks // (semesters * courses_per_lecturer))
+
+    tahun = np.array([2020 + i // 2 for i in range(semesters)]) * 10 + np.array([1 + i % 2 for i in range(semesters)])
+    courses = np.array(sorted(source['Matakuliah'].unique()))
+    lecturer_courses = rng.integers(0, len(courses), (lecturers, courses_per_lecturer))
+
+    block_semester = np.sort(rng.integers(0, semesters, n_blocks))
+    block_lecturer = rng.integers(0, lecturers, n_blocks)
+    block_course = lecturer_courses[block_lecturer, rng.integers(0, courses_per_lecturer, n_blocks)]
+    block_responden = rng.integers(5, 190, n_blocks)
+    block_base = rng.normal(4.1, 0.35, n_blocks)
+
+    # Blok diulang untuk setiap kompetensi lalu dipotong tepat n_rows baris
+    def per_row(values):
+        return np.repeat(values, len(KOMPETENSI))[:n_rows]
+
+    kompetensi = np.tile(KOMPETENSI, n_blocks)[:n_rows]
+    jumlah_pertanyaan = pertanyaan.reindex(kompetensi).to_numpy()
+    responden = per_row(block_responden)
+    rata_rata = np.clip(per_row(block_base) + rng.normal(0, 0.1, n_rows), 1, 5).round(2)
+    keseluruhan = np.clip(per_row(block_base), 1, 5).round(2)
+
+    data = pd.DataFrame({
+        'NO': np.arange(1, n_rows + 1),
+        'Tahun Akademik': tahun[per_row(block_semester)],
+        'NIDN': [f"{9000000000 + i:010d}" for i in per_row(block_lecturer)],
+        'Nama Dosen': [f"DOSEN SINTETIS {i + 1:05d}" for i in per_row(block_lecturer)],
+        'Matakuliah': courses[per_row(block_course)],
+        'Kompetensi': kompetensi,
+        'Jumlah Pertanyaan': jumlah_pertanyaan,
+        'Jumlah Bobot Jawaban': (rata_rata * jumlah_pertanyaan * responden).round().astype(int),
+        'Rata-rata per Kompetensi': rata_rata,
+        'Kategori per Kompetensi': _kategori(rata_rata),
+        'Rata-rata Keseluruhan': keseluruhan,
+        'Jumlah Responden': responden,
+        'Kategori': _kategori(keseluruhan),
+    })
+    return header, data
+
+
+def write_csv(target, header, data, bom=False):
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with open(target, 'w', newline='', encoding='utf-8-sig' if bom else 'utf-8') as f:
+        csv.writer(f).writerows(header)
+        data.to_csv(f, header=False, index=False, lineterminator='\n')
+
+
+def generate(output_dir, n_rows, seed=0, names=None, source_dir=BASE_DIR, **c6_options):
+    """Tulis dataset sintetis ``n_rows`` baris ke ``output_dir``; kembalikan path-nya."""
+    rng = np.random.default_rng(seed)
+    output_dir = Path(output_dir)
+    written = {}
+    for name in names or DATASETS:
+        file_name = DATASETS[name]
+        source = Path(source_dir) / file_name
+        if name == 'c6_dosen':
+            header, data = generate_c6_dosen(source, n_rows, rng, **c6_options)
+        else:
+            header_rows = 2 if name in MULTI_HEADER_DATASETS else 1
+            header, data = generate_survey(source, n_rows, rng, header_rows=header_rows)
+        written[name] = output_dir / file_name
+        write_csv(written[name], header, data, bom=has_bom(source))
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Buat data survei sintetis dengan skema CSV prep.")
+    parser.add_argument("output_dir")
+    parser.add_argument("--rows", type=int, default=10000, help="jumlah responden (baris) per dataset")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--semesters", type=int, default=8, help="jumlah semester data C.6 dosen")
+    parser.add_argument("--lecturers", type=int, default=None, help="jumlah dosen C.6 (default: sesuai --rows)")
+    parser.add_argument("--dataset", action="append", choices=sorted(DATASETS), help="hanya dataset ini")
+    args = parser.parse_args(argv)
+
+    written = generate(args.output_dir, args.rows, seed=args.seed, names=args.dataset,
+                       semesters=args.semesters, lecturers=args.lecturers)
+    for name, path in written.items():
+        print(f"{name}: {path} ({path.stat().st_size / 1024 / 1024:.1f} MiB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,279 @@
+"""Waktu per tahap (load, clean, aggregate, figure, emit) setiap render halaman.
+
+Tahap dicatat otomatis dari modul bersama:
+
+- ``load``: :func:`dashboard.data.load_data` (parsing CSV / cache kolumnar)
+- ``clean``: struktur turunan dari :func:`dashboard.data.load_derived`
+  (tabel long, indeks filter)
+- ``figure``: pembangunan figure antara ``get_figure`` yang miss dan
+  ``put_figure`` (:mod:`dashboard.figures`)
+- ``emit``: serialisasi figure ke browser lewat :func:`plotly_chart`
+
+Bagian lain halaman (misalnya ``apply`` baris per baris atau ``melt``)
+dibungkus dengan :class:`timed`, yang bisa dipakai sebagai context manager
+maupun dekorator::
+
+    with timed("aggregate", "avg_scores"):
+        avg_scores = data.mean()
+
+Catatan render dikumpulkan di memori dan baru ditulis sekali di akhir render
+(:func:`timing_panel`), satu baris JSON per tahap ke ``.cache/timing.jsonl``
+(halaman, id render, tahap, bagian, detik), dan hanya jika diminta: env
+``DASHBOARD_TIMING_TRACE=1`` atau ``?debug=timing`` di URL, yang juga
+menampilkan panel waktu per bagian di bawah halaman. Rerun ``st.fragment``
+hanya menjalankan fungsi fragment, jadi fungsi itu dibungkus
+:func:`traced_fragment` agar catatannya ditulis sebagai render tersendiri.
+File yang melewati
+``DASHBOARD_TRACE_MB`` (default 5) dirotasi ke ``timing.jsonl.1``. Ringkasan
+catatan::
+
+    python -m dashboard.timing --pages c2 c6
+"""
+import argparse
+import functools
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import ContextDecorator
+
+from dashboard.paths import CACHE_DIR
+
+STAGES = ["load", "clean", "aggregate", "figure", "emit"]
+TRACE_PATH = CACHE_DIR / "timing.jsonl"
+DEBUG_PARAM = "debug"
+DEBUG_VALUE = "timing"
+TRACE_ENABLED = os.environ.get("DASHBOARD_TIMING_TRACE", "") not in ("", "0")
+TRACE_MAX_BYTES = int(float(os.environ.get("DASHBOARD_TRACE_MB", "5")) * 1024 * 1024)
+
+# Setiap sesi Streamlit menjalankan skrip di thread-nya sendiri
+_run = threading.local()
+_render_ids = itertools.count(1)
+_lock = threading.Lock()
+
+
+def begin(page):
+    """Mulai catatan render baru untuk ``page`` (dipanggil oleh ``page_started``)."""
+    _run.page = page
+    _run.render = f"{int(time.time())}-{next(_render_ids)}"
+    _run.records = []
+    _run.traces = {}
+    _run.figure = None
+    _run.chart = None
+
+
+def defer_trace(path, record):
+    """Simpan ``record`` untuk ditulis ke ``path`` di akhir render (:func:`flush_traces`)."""
+    if getattr(_run, "page", None) is None:
+        return
+    _run.traces.setdefault(path, []).append(record)
+
+
+def append_trace(path, records):
+    """Tambahkan ``records`` ke file JSONL ``path`` sekaligus; rotasi jika terlalu besar."""
+    if not records:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with _lock:
+            if path.exists() and path.stat().st_size > TRACE_MAX_BYTES:
+                os.replace(path, path.with_name(f"{path.name}.1"))
+            with open(path, "a", encoding="utf-8") as f:
+                f.writelines(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+    except OSError:
+        # Catatan hanya untuk pemantauan: halaman tetap tampil
+        pass
+
+
+def flush_traces():
+    """Tulis semua catatan render ini (satu kali buka file per trace)."""
+    traces = getattr(_run, "traces", {})
+    _run.traces = {}
+    for path, records in traces.items():
+        append_trace(path, records)
+
+
+def record(stage, section, seconds, **extra):
+    # Di luar render halaman (CLI, benchmark) tidak ada yang dicatat
+    if getattr(_run, "page", None) is None:
+        return
+    entry = {
+        "time": time.time(),
+        "page": _run.page,
+        "render": _run.render,
+        "stage": stage,
+        "section": section,
+        "seconds": round(seconds, 6),
+        **extra,
+    }
+    _run.records.append(entry)
+    defer_trace(TRACE_PATH, entry)
+
+
+class timed(ContextDecorator):
+    """Catat lama blok/fungsi sebagai tahap ``stage`` bagian ``section``."""
+
+    def __init__(self, stage, section=None):
+        self.stage = stage
+        self.section = section
+
+    def __call__(self, func):
+        if self.section is None:
+            self.section = func.__name__
+        return super().__call__(func)
+
+    def _recreate_cm(self):
+        # Dekorator bisa dipanggil bersarang/bersamaan: setiap panggilan punya timer sendiri
+        return timed(self.stage, self.section)
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        record(self.stage, self.section, time.perf_counter() - self._start)
+        return False
+
+
+def figure_lookup(chart_id, hit):
+    # Dipanggil get_figure: miss memulai timer tahap "figure" untuk chart ini
+    if getattr(_run, "page", None) is None:
+        return
+    _run.chart = chart_id
+    if hit:
+        record("figure", chart_id, 0.0, cached=True)
+    else:
+        _run.figure = (chart_id, time.perf_counter())
+
+
+def figure_built(chart_id):
+    # Dipanggil put_figure: figure untuk chart ini selesai dibangun
+    started = getattr(_run, "figure", None)
+    if started is None or started[0] != chart_id:
+        return
+    _run.figure = None
+    record("figure", chart_id, time.perf_counter() - started[1], cached=False)
+
+
+def plotly_chart(figure, **kwargs):
+    """``st.plotly_chart`` yang mencatat waktu serialisasinya sebagai tahap ``emit``."""
+    import streamlit as st
+
+    section = getattr(_run, "chart", None) or figure.layout.title.text
+    with timed("emit", section):
+        return st.plotly_chart(figure, **kwargs)
+
+
+def render_records():
+    return list(getattr(_run, "records", []))
+
+
+def _finish_render():
+    # Tulis catatan render jika diminta; hasilnya: apakah panel ?debug=timing aktif
+    import streamlit as st
+
+    debug = st.query_params.get(DEBUG_PARAM) == DEBUG_VALUE
+    if debug or TRACE_ENABLED:
+        flush_traces()
+    return debug
+
+
+def _fragment_rerun():
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    return bool(ctx is not None and ctx.fragment_ids_this_run)
+
+
+def traced_fragment(func):
+    """Dekorator fungsi ``st.fragment``: rerun fragment dicatat dan ditulis sendiri.
+
+    Dipasang di bawah ``@st.fragment``. Saat render penuh fragment ikut
+    tercatat di render halaman; saat hanya fragment yang dijalankan ulang,
+    render baru dimulai untuk halaman yang sama dan ditulis di akhir fragment.
+    """
+    # Nama halaman diambil saat render penuh mendefinisikan fragment
+    page = getattr(_run, "page", None)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if page is None or not _fragment_rerun():
+            return func(*args, **kwargs)
+        begin(page)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _finish_render()
+
+    return wrapper
+
+
+def timing_panel():
+    """Akhiri render: tulis catatan jika diminta, tampilkan panel jika ``?debug=timing``."""
+    import streamlit as st
+
+    if not _finish_render():
+        return
+    import pandas as pd
+
+    records = pd.DataFrame(render_records(), columns=["stage", "section", "seconds"])
+    totals = records.groupby("stage", sort=False)["seconds"].sum().reindex(STAGES, fill_value=0.0)
+    with st.expander(f"⏱️ Waktu render: {totals.sum() * 1000:.1f} ms", expanded=False):
+        st.dataframe(
+            (totals * 1000).round(2).rename("ms").to_frame().T,
+            hide_index=True,
+        )
+        st.dataframe(
+            records.assign(ms=(records["seconds"] * 1000).round(2)).drop(columns="seconds"),
+            hide_index=True,
+            use_container_width=True,
+        )
+
+
+def read_trace():
+    try:
+        with open(TRACE_PATH, encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+    except OSError:
+        return []
+
+
+def summarize(records, pages=None):
+    # Median dan maksimum total waktu per render untuk setiap halaman x tahap
+    totals = {}
+    for r in records:
+        if pages and r["page"] not in pages:
+            continue
+        key = (r["page"], r["stage"])
+        totals.setdefault(key, {}).setdefault(r["render"], 0.0)
+        totals[key][r["render"]] += r["seconds"]
+
+    lines = [f"{'halaman':<8} {'tahap':<10}{'render':>7}{'median':>10}{'maks':>10}"]
+    lines.append("-" * len(lines[0]))
+    for page in sorted({page for page, _ in totals}):
+        for stage in STAGES:
+            seconds = sorted(totals.get((page, stage), {}).values())
+            if not seconds:
+                continue
+            lines.append(f"{page:<8} {stage:<10}{len(seconds):>7}"
+                         f"{seconds[len(seconds) // 2] * 1000:>8.1f}ms{seconds[-1] * 1000:>8.1f}ms")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ringkasan waktu per tahap render halaman dashboard.")
+    parser.add_argument("--pages", nargs="+", help="hanya halaman ini (home, c1..c8)")
+    args = parser.parse_args(argv)
+
+    records = read_trace()
+    if not records:
+        print(f"Belum ada catatan di {TRACE_PATH}")
+        return 0
+    print(summarize(records, args.pages))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,216 @@
+"""Tren nilai kompetensi C.6 per semester yang diperbarui secara inkremental.
+
+Untuk setiap Tahun Akademik x NIDN x Kompetensi disimpan jumlah berjalan
+``bobot`` (jumlah ``Rata-rata per Kompetensi x Jumlah Responden``),
+``responden`` (jumlah ``Jumlah Responden``) dan ``baris`` di
+``.cache/c6_dosen/trend.sqlite``. Rata-rata tertimbang di tingkat mana pun
+(semester, semester x kompetensi, semester x dosen x kompetensi) adalah
+``sum(bobot) / sum(responden)`` atas agregat ini, tanpa membaca ulang baris
+semester lama.
+
+Agregat dihitung per partisi (:mod:`dashboard.partitions`) dan dicatat
+bersama hash partisinya. Saat semester baru ditambahkan hanya partisi yang
+hash-nya berubah yang dibaca ulang, jadi pembaruan sebanding dengan jumlah
+baris baru. Selisih antar semester (``Delta``) dihitung dari agregat yang
+sama.
+
+Tampilkan tren per kompetensi atau per dosen::
+
+    python -m dashboard.trend --level kompetensi
+    python -m dashboard.trend --level dosen --nidn 23077601
+"""
+import argparse
+import sqlite3
+import sys
+import threading
+
+import pandas as pd
+
+from dashboard.partitions import PARTITION_DIR, current_manifest, query_partitions
+from dashboard.timing import timed
+
+# Naikkan jika cara agregasi berubah supaya semua agregat dihitung ulang
+TREND_VERSION = 1
+TREND_PATH = PARTITION_DIR / "trend.sqlite"
+ALL = 'All'
+
+# Tingkat tren -> kolom pengelompokan selain Tahun Akademik
+LEVELS = {
+    "semester": [],
+    "kompetensi": ['Kompetensi'],
+    "dosen": ['NIDN', 'Kompetensi'],
+}
+MEAN_COLUMN = 'Rata-rata Tertimbang'
+RESPONDEN_COLUMN = 'Jumlah Responden'
+DELTA_COLUMN = 'Delta'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS agregat (
+    tahun_akademik INTEGER NOT NULL,
+    nidn INTEGER NOT NULL,
+    kompetensi TEXT NOT NULL,
+    bobot REAL NOT NULL,
+    responden INTEGER NOT NULL,
+    baris INTEGER NOT NULL,
+    PRIMARY KEY (tahun_akademik, nidn, kompetensi)
+);
+CREATE TABLE IF NOT EXISTS partisi (tahun_akademik INTEGER PRIMARY KEY, hash TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+# Agregat satu partisi (baris tanpa skor atau tanpa jumlah responden dilewati)
+PARTITION_AGGREGATE_QUERY = """
+SELECT tahun_akademik, nidn, kompetensi,
+       SUM(rata_rata * jumlah_responden) AS bobot,
+       SUM(jumlah_responden) AS responden,
+       COUNT(*) AS baris
+FROM dosen{where}
+GROUP BY tahun_akademik, nidn, kompetensi
+"""
+VALID_ROWS = "rata_rata IS NOT NULL AND jumlah_responden IS NOT NULL"
+
+_memo = {}
+_lock = threading.Lock()
+
+
+def _open(path):
+    connection = sqlite3.connect(path)
+    connection.executescript(SCHEMA)
+    version = connection.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+    if version is None or version[0] != str(TREND_VERSION):
+        # Versi lama: buang semua agregat, semua partisi dihitung ulang
+        connection.executescript("DELETE FROM agregat; DELETE FROM partisi;")
+        connection.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (str(TREND_VERSION),))
+        connection.commit()
+    return connection
+
+
+def refresh(path=TREND_PATH):
+    """Perbarui agregat dari partisi yang berubah; kembalikan ``(diperbarui, tetap, dihapus)``."""
+    partitions = current_manifest()["partitions"]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    connection = _open(path)
+    try:
+        stored = dict(connection.execute("SELECT tahun_akademik, hash FROM partisi"))
+        wanted = {int(key): entry["hash"] for key, entry in partitions.items()}
+        changed = sorted(tahun for tahun, digest in wanted.items() if stored.get(tahun) != digest)
+        removed = sorted(set(stored) - set(wanted))
+
+        for tahun in removed + changed:
+            connection.execute("DELETE FROM agregat WHERE tahun_akademik = ?", (tahun,))
+            connection.execute("DELETE FROM partisi WHERE tahun_akademik = ?", (tahun,))
+        for tahun in changed:
+            # Hanya partisi semester ini yang dibaca
+            rows = query_partitions(PARTITION_AGGREGATE_QUERY.format(where=f" WHERE {VALID_ROWS}"), tahun=tahun)
+            connection.executemany(
+                "INSERT INTO agregat VALUES (?, ?, ?, ?, ?, ?)",
+                zip(*(rows[column].tolist() for column in rows.columns)),
+            )
+            connection.execute("INSERT INTO partisi VALUES (?, ?)", (tahun, wanted[tahun]))
+        connection.commit()
+    finally:
+        connection.close()
+    kept = sorted(set(wanted) - set(changed))
+    return changed, kept, removed
+
+
+def load_aggregates(path=TREND_PATH):
+    """Agregat Tahun Akademik x NIDN x Kompetensi (diperbarui dulu jika partisi berubah)."""
+    manifest = current_manifest()
+    key = (str(path), tuple(sorted((k, entry["hash"]) for k, entry in manifest["partitions"].items())))
+    with _lock:
+        if key in _memo:
+            return _memo[key]
+        refresh(path)
+        connection = sqlite3.connect(path)
+        try:
+            with timed("load", path.name):
+                aggregates = pd.read_sql_query(
+                    "SELECT tahun_akademik AS \"Tahun Akademik\", nidn AS NIDN, kompetensi AS Kompetensi, "
+                    "bobot, responden, baris FROM agregat ORDER BY tahun_akademik, nidn, kompetensi",
+                    connection,
+                )
+        finally:
+            connection.close()
+        _memo.clear()
+        _memo[key] = aggregates
+    return aggregates
+
+
+def weighted_trend(aggregates, by=()):
+    """Rata-rata tertimbang per Tahun Akademik x ``by`` beserta ``Delta`` antar semester.
+
+    ``Delta`` adalah selisih terhadap semester sebelumnya dalam kelompok yang
+    sama (kosong untuk semester pertama kelompok itu).
+    """
+    by = list(by)
+    keys = ['Tahun Akademik'] + by
+    totals = aggregates.groupby(keys, sort=True)[['bobot', 'responden']].sum().reset_index()
+    totals = totals[totals['responden'] > 0]
+    totals[MEAN_COLUMN] = totals['bobot'] / totals['responden']
+    totals = totals.rename(columns={'responden': RESPONDEN_COLUMN}).drop(columns='bobot')
+    totals = totals.sort_values(by + ['Tahun Akademik'], ignore_index=True)
+    if by:
+        totals[DELTA_COLUMN] = totals.groupby(by, sort=False)[MEAN_COLUMN].diff()
+    else:
+        totals[DELTA_COLUMN] = totals[MEAN_COLUMN].diff()
+    return totals.sort_values(keys, ignore_index=True)
+
+
+def trend(level="kompetensi", nidn=ALL, tahun=ALL):
+    """Tren tertimbang di tingkat ``level`` (lihat ``LEVELS``), opsional satu dosen/semester.
+
+    Delta dihitung atas seluruh riwayat sebelum dibatasi ke ``tahun``, jadi
+    semester yang dipilih tetap dibandingkan dengan semester sebelumnya.
+    """
+    aggregates = load_aggregates()
+    if nidn != ALL:
+        aggregates = aggregates[aggregates['NIDN'] == nidn]
+    result = weighted_trend(aggregates, LEVELS[level])
+    if tahun != ALL:
+        result = result[result['Tahun Akademik'] == tahun].reset_index(drop=True)
+    return result
+
+
+def course_trend(nidn, matakuliah, tahun=ALL):
+    """Tren per kompetensi untuk satu mata kuliah (query langsung ke partisi terpilih).
+
+    Agregat tersimpan tidak memisahkan mata kuliah; baris satu mata kuliah
+    cukup sedikit untuk diagregasi saat diminta.
+    """
+    clauses = [VALID_ROWS, "matakuliah = ?"]
+    params = [matakuliah]
+    if nidn != ALL:
+        clauses.append("nidn = ?")
+        params.append(nidn)
+    rows = query_partitions(PARTITION_AGGREGATE_QUERY.format(where=f" WHERE {' AND '.join(clauses)}"), params)
+    aggregates = rows.rename(columns={'tahun_akademik': 'Tahun Akademik', 'nidn': 'NIDN', 'kompetensi': 'Kompetensi'})
+    result = weighted_trend(aggregates, LEVELS["kompetensi"])
+    if tahun != ALL:
+        result = result[result['Tahun Akademik'] == tahun].reset_index(drop=True)
+    return result
+
+
+def selection_trend(tahun=ALL, nidn=ALL, matakuliah=ALL):
+    """Tren per kompetensi untuk pilihan filter halaman C.6."""
+    if matakuliah != ALL:
+        return course_trend(nidn, matakuliah, tahun)
+    return trend("dosen" if nidn != ALL else "kompetensi", nidn=nidn, tahun=tahun)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tren nilai kompetensi C.6 per semester.")
+    parser.add_argument("--level", choices=list(LEVELS), default="kompetensi")
+    parser.add_argument("--nidn", type=int)
+    args = parser.parse_args(argv)
+
+    changed, kept, removed = refresh()
+    print(f"Agregat: {len(changed)} semester diperbarui, {len(kept)} tetap, {len(removed)} dihapus")
+    result = trend(args.level, nidn=ALL if args.nidn is None else args.nidn)
+    with pd.option_context("display.max_rows", None, "display.width", 160):
+        print(result.round(3).to_string(index=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,262 @@
+"""Tabel fakta lintas survei dalam satu file database lokal (SQLite).
+
+Setiap kriteria punya CSV dengan bentuk sendiri: Likert datar, header dua
+baris (kategori, pertanyaan), kolom Status di awal atau di akhir, dan rekap
+per dosen C.6. Semua dinormalisasi menjadi satu tabel long ``fakta``::
+
+    survey | respondent | role | kategori | question_id | score
+
+- ``survey``: nama dataset (``c1_stt`` ... ``c8``)
+- ``respondent``: nomor baris di CSV sumber (mulai 1)
+- ``role``: isi kolom Status jika ada, selain itu peran responden survei
+- ``kategori``: kategori header dua baris, atau Kompetensi untuk rekap C.6
+- ``question_id``: ID dari :mod:`dashboard.questions`
+- ``score``: jawaban (sel kosong tidak disimpan); untuk rekap C.6 rata-rata
+  per kompetensi dibulatkan ke atas ke skala 1..5, sama dengan batas
+  ``Kategori per Kompetensi`` (<= 3 Cukup, <= 4 Baik, > 4 Sangat Baik)
+
+Tabel ``survei`` memetakan dataset ke kriteria KPI dan sumbernya, sehingga
+jumlah jawaban per skor untuk semua KPI Home didapat dari satu query grouped
+(:func:`score_counts`). Database dibangun ulang otomatis ke file sementara
+lalu di-``os.replace`` jika versi (mtime, ukuran) salah satu CSV berubah.
+Rekap per dosen untuk halaman C.6 disimpan terpisah, dipartisi per Tahun
+Akademik (:mod:`dashboard.partitions`).
+
+Bangun ulang database secara eksplisit::
+
+    python -m dashboard.warehouse
+"""
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from dashboard.data import DATASETS, MULTI_HEADER_DATASETS, file_signature, load_dataset
+from dashboard.long_table import SEPARATOR
+from dashboard.paths import CACHE_DIR
+from dashboard.questions import question_id, question_text
+from dashboard.timing import timed
+
+# Naikkan jika skema atau normalisasi berubah supaya database lama dibangun ulang
+WAREHOUSE_VERSION = 5
+DB_PATH = CACHE_DIR / "survey.sqlite"
+
+# Dataset -> (kriteria KPI, sumber di KPI, peran responden jika tidak ada kolom Status)
+SURVEYS = {
+    "c1_stt": ("c1", "STT Wastukancana", None),
+    "c1_tif": ("c1", "TIF", None),
+    "c2_dosen": ("c2", None, None),
+    "c2_mhs": ("c2", None, "Mahasiswa"),
+    "c3": ("c3", None, "Mahasiswa"),
+    "c4_dosen": ("c4", "Dosen", "Dosen"),
+    "c4_tendik": ("c4", "Tendik", "Tenaga Kependidikan"),
+    "c5_dosen": ("c5", "Dosen", "Dosen"),
+    "c5_mhs": ("c5", "Mahasiswa", "Mahasiswa"),
+    "c5_tendik": ("c5", "Tendik", "Tenaga Kependidikan"),
+    "c6_dosen": ("c6", "Dosen", "Mahasiswa"),
+    "c6_tendik": ("c6", "Tendik", "Mahasiswa"),
+    "c7": ("c7", None, "Dosen"),
+    "c8": ("c8", None, "Dosen"),
+}
+
+# Kolom Status (peran responden) di survei yang diisi beberapa kelompok
+STATUS_COLUMNS = {'1. Status Bpk/Ibu/Saudara/i:', 'Status Bpk/Ibu/Saudara/i.'}
+
+# Rekap per dosen: satu fakta per baris (kolom kategori, kolom rata-rata); kolom
+# lain (NO, Jumlah Pertanyaan, Jumlah Responden, ...) bukan jawaban survei
+AGGREGATE_DATASETS = {"c6_dosen": ('Kompetensi', 'Rata-rata per Kompetensi')}
+
+SCHEMA = """
+CREATE TABLE fakta (
+    survey TEXT NOT NULL,
+    respondent INTEGER NOT NULL,
+    role TEXT,
+    kategori TEXT,
+    question_id TEXT NOT NULL,
+    score REAL NOT NULL
+);
+CREATE TABLE survei (survey TEXT PRIMARY KEY, kriteria TEXT NOT NULL, sumber TEXT);
+CREATE TABLE pertanyaan (question_id TEXT PRIMARY KEY, teks TEXT NOT NULL);
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+INDEXES = """
+CREATE INDEX fakta_survey ON fakta (survey, question_id);
+CREATE INDEX fakta_question ON fakta (question_id);
+"""
+
+# Jumlah jawaban bernilai bulat 1..5 per kriteria, sumber dan skor (aturan
+# yang sama dengan dashboard.likert.score_matrix)
+SCORE_COUNTS_QUERY = """
+SELECT s.kriteria, s.sumber, CAST(f.score AS INTEGER) AS skor, COUNT(*) AS jumlah
+FROM fakta AS f JOIN survei AS s ON s.survey = f.survey
+WHERE f.score IN (1, 2, 3, 4, 5)
+GROUP BY s.kriteria, s.sumber, skor
+"""
+
+_checked = {}
+_lock = threading.Lock()
+
+
+def source_signatures():
+    return {name: list(file_signature(path)) for name, path in DATASETS.items()}
+
+
+def _aggregate_facts(name, data):
+    kategori_column, score_column = AGGREGATE_DATASETS[name]
+    return pd.DataFrame({
+        "respondent": np.arange(1, len(data) + 1),
+        "role": SURVEYS[name][2],
+        "kategori": data[kategori_column].astype(object).to_numpy(),
+        "question_id": question_id(score_column),
+        # Rata-rata dikelompokkan ke skor 1..5 supaya bisa dihitung seperti jawaban Likert
+        "score": np.clip(np.ceil(data[score_column].to_numpy(dtype="float64", na_value=np.nan)), 1, 5),
+    })
+
+
+def normalize(name, data):
+    """Fakta long dataset ``name`` (satu baris per jawaban yang terisi)."""
+    if name in AGGREGATE_DATASETS:
+        facts = _aggregate_facts(name, data)
+    else:
+        status = [column for column in data.columns if column in STATUS_COLUMNS]
+        numeric = data.select_dtypes(include="number")
+        numeric = numeric.drop(columns=[column for column in status if column in numeric.columns])
+        if name in MULTI_HEADER_DATASETS:
+            kategori, texts = zip(*(column.split(SEPARATOR, 1) for column in numeric.columns))
+        else:
+            kategori, texts = [None] * numeric.shape[1], list(numeric.columns)
+
+        values = numeric.to_numpy(dtype="float64", na_value=np.nan)
+        rows, columns = np.nonzero(~np.isnan(values))
+        if status:
+            roles = data[status[0]].astype(object).to_numpy()[rows]
+        else:
+            roles = SURVEYS[name][2]
+        facts = pd.DataFrame({
+            "respondent": rows + 1,
+            "role": roles,
+            "kategori": np.array(kategori, dtype=object)[columns],
+            "question_id": np.array([question_id(text) for text in texts], dtype=object)[columns],
+            "score": values[rows, columns],
+        })
+    facts.insert(0, "survey", name)
+    return facts.dropna(subset=["score"])
+
+
+def build(path=DB_PATH):
+    """Bangun database dari semua CSV lalu ganti file lama secara atomik."""
+    sources = source_signatures()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.unlink(missing_ok=True)
+
+    question_ids = set()
+    connection = sqlite3.connect(tmp_path)
+    try:
+        # File sementara: jurnal tidak diperlukan, gagal build cukup diulang
+        connection.execute("PRAGMA journal_mode = OFF")
+        connection.execute("PRAGMA synchronous = OFF")
+        connection.executescript(SCHEMA)
+        for name in DATASETS:
+            facts = normalize(name, load_dataset(name))
+            question_ids.update(facts["question_id"].unique())
+            # Kolom sebagai list Python: iterasi baris DataFrame jauh lebih lambat
+            connection.executemany(
+                "INSERT INTO fakta VALUES (?, ?, ?, ?, ?, ?)",
+                zip(*(facts[column].tolist() for column in facts.columns)),
+            )
+        connection.executemany(
+            "INSERT INTO survei VALUES (?, ?, ?)",
+            [(name, kriteria, sumber) for name, (kriteria, sumber, _) in SURVEYS.items()],
+        )
+        connection.executemany(
+            "INSERT INTO pertanyaan VALUES (?, ?)",
+            [(qid, question_text(qid)) for qid in sorted(question_ids)],
+        )
+        connection.executemany("INSERT INTO meta VALUES (?, ?)", [
+            ("version", str(WAREHOUSE_VERSION)),
+            ("sources", json.dumps(sources, sort_keys=True)),
+        ])
+        connection.executescript(INDEXES)
+        connection.commit()
+    except BaseException:
+        connection.close()
+        # Build gagal: jangan tinggalkan file sementara
+        tmp_path.unlink(missing_ok=True)
+        raise
+    connection.close()
+    os.replace(tmp_path, path)
+    return path
+
+
+def _is_current(path, sources):
+    try:
+        connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    except sqlite3.Error:
+        return False
+    try:
+        meta = dict(connection.execute("SELECT key, value FROM meta"))
+    except sqlite3.Error:
+        return False
+    finally:
+        connection.close()
+    return (meta.get("version") == str(WAREHOUSE_VERSION)
+            and meta.get("sources") == json.dumps(sources, sort_keys=True))
+
+
+def connect(path=DB_PATH):
+    """Koneksi ke database; dibangun ulang dulu jika ada CSV yang berubah."""
+    sources = source_signatures()
+    key = json.dumps(sources, sort_keys=True)
+    with _lock:
+        # Versi yang sudah dicek di proses ini cukup dibandingkan dengan os.stat CSV
+        if _checked.get(str(path)) != key or not path.exists():
+            if not _is_current(path, sources):
+                build(path)
+            _checked[str(path)] = key
+    return sqlite3.connect(path)
+
+
+def query(sql, params=()):
+    """Hasil ``sql`` sebagai DataFrame."""
+    connection = connect()
+    try:
+        with timed("load", DB_PATH.name):
+            return pd.read_sql_query(sql, connection, params=params)
+    finally:
+        connection.close()
+
+
+def score_counts():
+    """Jumlah jawaban per kriteria, sumber dan skor 1..5 (satu query grouped)."""
+    return query(SCORE_COUNTS_QUERY)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bangun tabel fakta lintas survei (SQLite).")
+    parser.add_argument("--path", type=Path, default=DB_PATH, help=f"file database (default: {DB_PATH})")
+    args = parser.parse_args(argv)
+
+    path = build(args.path)
+    connection = sqlite3.connect(path)
+    try:
+        rows = connection.execute(
+            "SELECT survey, COUNT(*), COUNT(DISTINCT question_id) FROM fakta GROUP BY survey"
+        ).fetchall()
+    finally:
+        connection.close()
+    for survey, facts, questions in rows:
+        print(f"{survey:<10} {facts:>7} fakta  {questions:>3} pertanyaan")
+    print(f"Database ditulis ke {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,8 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
+
+from dashboard.startup import first_paint, lazy_import, page_started
+
+page_started("c1")
 
 # Set page configuration
 st.set_page_config(
@@ -14,11 +16,20 @@ st.markdown("""
     <h2 style="text-align: center;">📊 Survey Pemahaman Dosen, Tendik Dan Mahasiswa Terhadap VMTS UPPS Dan PS</h2>
 """, unsafe_allow_html=True)
 
+# Modul berat (pandas, plotly, data survei) baru diimpor setelah judul tampil
+import pandas as pd
+
+from dashboard.figures import figure_key, get_figure, put_figure
+from dashboard.likert import category_distribution, total_counts
+from dashboard.questions import HOVER_COLUMN, display_frame, question_id, question_text, with_hover_text, with_ids
+from dashboard.stats import error_bars, load_mean_ci, with_ci
+from dashboard.timing import plotly_chart, timed, timing_panel, traced_fragment
+
+px = lazy_import("plotly.express")
+
+# Kolom pertanyaan memakai ID pendek; teks lengkap hanya untuk tampilan
+STATUS = question_id('1. Status Bpk/Ibu/Saudara/i:')
 
-# Fungsi untuk memuat data dengan caching
-@st.cache_data
-def load_data(file_path):
-    return pd.read_csv(file_path)
 
 # Fungsi untuk membersihkan data
 def clean_data(data, start_col=1):
@@ -40,67 +51,45 @@ def assign_category(score):
     else:
         return "Sangat Baik"
 
-# Tampilkan deskripsi survei dan grafik
-tab1, tab2 = st.tabs(["Survey VMTS UPPS", "Survey VMTS PS"])
 
-with tab1:
-    # Load data
-    data = load_data("C.1.SurveyPemahamanVisiMisiSTTWastukancana.csv")
-    
-
-    col1, col2 = st.columns(2)
-    
-    with col1:
+# Filter Status/Pertanyaan beserta chart yang bergantung padanya dijalankan
+# sebagai fragment: mengubah filter hanya menjalankan ulang fungsi ini, sedangkan
+# chart distribusi kategori (tidak bergantung filter) tidak dihitung ulang dan
+# tidak dikirim ulang ke browser. Tata letak dibuat di render_survey supaya
+# posisi setiap chart tetap sama.
+@st.fragment
+@traced_fragment
+def render_filtered(data, dataset, chart_prefix, filter_cols, donut_col, chart_cols, table_area):
+    with filter_cols[0]:
         # Pilih Status
-        status_filter = st.selectbox("🔍 Pilih Status:", ["All"] + list(data['1. Status Bpk/Ibu/Saudara/i:'].unique()))
+        status_filter = st.selectbox("🔍 Pilih Status:", ["All"] + list(data[STATUS].unique()))
 
         # Filter data berdasarkan status
         if status_filter == "All":
             filtered_data1 = data
         else:
-            filtered_data1 = data[data['1. Status Bpk/Ibu/Saudara/i:'] == status_filter]
+            filtered_data1 = data[data[STATUS] == status_filter]
 
         # Calculate average scores for all questions grouped by status
-        avg_scores = filtered_data1.groupby('1. Status Bpk/Ibu/Saudara/i:').mean().reset_index()
-        with col2:
+        avg_scores = filtered_data1.groupby(STATUS, observed=True).mean().reset_index()
+        with filter_cols[1]:
             # Pilih Pertanyaan (berdasarkan kolom-kolom pertanyaan yang ada di filtered data)
             pertanyaan_list = filtered_data1.columns[1:]  # Asumsi pertanyaan ada di kolom 1 hingga kolom terakhir sebelum kolom status
-            pertanyaan_filter = st.selectbox("🔍 Pilih Pertanyaan:", ["All"] + list(pertanyaan_list))  # Menambahkan "All" sebagai pilihan
+            pertanyaan_filter = st.selectbox("🔍 Pilih Pertanyaan:", ["All"] + list(pertanyaan_list), format_func=question_text)  # Menambahkan "All" sebagai pilihan
 
             # Filter data berdasarkan pertanyaan yang dipilih
             if pertanyaan_filter == "All":
                 # Jika "All" dipilih, tampilkan semua pertanyaan
                 filtered_data2 = filtered_data1
             else:
-                filtered_data2 = filtered_data1[['1. Status Bpk/Ibu/Saudara/i:', pertanyaan_filter]]
-
-            # Filter out "Netral" answers (score == 3)
-            non_neutral_data = data[data.apply(lambda row: ~row.isin([3]), axis=1)]
-
-            # Count the occurrences of each category (Sangat Kurang, Kurang, Baik, Sangat Baik)
-            categories_count = {
-                "Sangat Kurang": (non_neutral_data == 1).sum().sum(),
-                "Kurang": (non_neutral_data == 2).sum().sum(),
-                "Baik": (non_neutral_data == 4).sum().sum(),
-                "Sangat Baik": (non_neutral_data == 5).sum().sum(),
-            }
-
-            # Calculate the total number of relevant answers
-            total_non_neutral = sum(categories_count.values())
-
-            # Prepare data for the pie chart
-            fulfillment_data1 = pd.DataFrame({
-                'Kategori': categories_count.keys(),
-                'Jumlah': categories_count.values(),
-                'Persentase': [count / total_non_neutral * 100 for count in categories_count.values()]
-            })
+                filtered_data2 = filtered_data1[[STATUS, pertanyaan_filter]]
 
             # Hitung rata-rata skor untuk setiap pertanyaan dalam data yang telah difilter
             avg_scores = filtered_data1.iloc[:, 1:].mean().reset_index()
             avg_scores.columns = ['Indikator', 'Rata-Rata Skor']
 
             # Menghitung rata-rata skor berdasarkan status
-            avg_scoresbar = filtered_data1.groupby('1. Status Bpk/Ibu/Saudara/i:').mean().reset_index()
+            avg_scoresbar = filtered_data1.groupby(STATUS, observed=True).mean().reset_index()
 
             # Menghitung skor rata-rata untuk pertanyaan yang dipilih
             if pertanyaan_filter != "All":
@@ -118,320 +107,199 @@ with tab1:
                 'Persentase': [fulfilled_percentage, not_fulfilled_percentage]
             })
 
-
-
-    
     # Mengonversi DataFrame ke format long untuk pembuatan grouped bar chart
-    avg_scores_long = avg_scoresbar.melt(
-        id_vars='1. Status Bpk/Ibu/Saudara/i:',  # Kolom status sebagai identifier
-        var_name='Indikator',                   # Nama kolom indikator (a, b, c, ...)
-        value_name='Rata-Rata Skor'             # Nama kolom nilai rata-rata skor
-    )
+    with timed("clean", "melt"):
+        avg_scores_long = avg_scoresbar.melt(
+            id_vars=STATUS,  # Kolom status sebagai identifier
+            var_name='Indikator',                   # Nama kolom indikator (a, b, c, ...)
+            value_name='Rata-Rata Skor'             # Nama kolom nilai rata-rata skor
+        )
 
     # Terapkan fungsi kategori ke setiap nilai skor rata-rata
-    avg_scores_long['Kategori'] = avg_scores_long['Rata-Rata Skor'].apply(assign_category)
+    with timed("clean", "kategori"):
+        avg_scores_long['Kategori'] = avg_scores_long['Rata-Rata Skor'].apply(assign_category)
 
-    # Layout: Create three columns for the components
-    col1, col2, col3 = st.columns([4, 2, 2])
-
-    with col1:
-        with st.container(border=True):
-            # Create and style the bar chart (horizontal)
-            fig_bar = px.bar(
-                fulfillment_data1,
-                x='Persentase',  # The percentage values for the bars
-                y='Kategori',  # The categories for the bars
-                orientation='h',  # Horizontal bar chart
-                title="Distribusi Setiap Kategori",  # Title of the chart
-                color='Kategori',  # Use 'Kategori' for coloring the bars
-                color_discrete_sequence=px.colors.sequential.Purpor  # Color sequence
-            )
-
-            # Update layout for the bar chart
-            fig_bar.update_layout(
-                title_x=0.4,  # Position the title
-                legend_title="Kategori",  # Title of the legend
-                legend_orientation="h",  # Horizontal legend
-                legend_yanchor="bottom",  # Position the legend at the bottom
-                legend_y=-0.3,  # Lower the legend
-                legend_x=0.5,  # Center the legend horizontally
-                legend_xanchor="center",  # Anchor the legend to the center
-                height=400,  # Height of the chart
-                width=600,  # Width of the chart
-            )
-
-            # Display the horizontal bar chart
-            st.plotly_chart(fig_bar, use_container_width=True)
+    # Interval kepercayaan 95% per status dan pertanyaan (di-cache per versi data)
+    ci = load_mean_ci(dataset, question_text(STATUS)).rename(index=question_id, level="Pertanyaan")
+    avg_scores_long = with_ci(avg_scores_long, ci, question_column='Indikator', group_column=STATUS)
 
-    with col2:
+    with donut_col:
         with st.container(border=True):
        
             # Membuat donut chart
-            fig_donut = px.pie(
-                fulfillment_data,
-                values='Persentase',  # Nilai persentase
-                names='Status',  # Nama kategori
-                hole=0.5,  # Membuat efek donut
-                title=f"Persentase Pemahaman Setiap Pertanyaan",  # Judul chart
-                color_discrete_sequence=px.colors.sequential.Purpor  # Warna chart
-            )
-
-            # Update layout untuk judul dan posisi legenda
-            fig_donut.update_layout(
-                title_x=0.0,  # Memusatkan judul
-                legend_title="Status",  # Menambahkan judul untuk legenda
-                legend_orientation="h",  # Membuat legenda horizontal
-                legend_yanchor="bottom",  # Menempatkan legenda di bawah
-                legend_y=-0.3,  # Menurunkan posisi legenda
-                legend_x=0.5,  # Memusatkan legenda secara horizontal
-                legend_xanchor="center",  # Menjaga posisi legenda tetap di tengah
-                height=400,
-                width=400  # Ensure the chart width is adequate
-            )
-
-            # Menampilkan donut chart di Streamlit
-            st.plotly_chart(fig_donut, use_container_width=True)
-
-    with col3:
-        with st.container(border=True):
-                # Create and style the pie chart
-            fig_donut = px.pie(
-                fulfillment_data1,
-                values='Persentase',
-                names='Kategori',
-                hole=0.5,
-                title="Distribusi Setiap Kategori",
-                color_discrete_sequence=px.colors.sequential.Purpor
-            )
-
-            # Update layout for the pie chart
-            fig_donut.update_layout(
-                title_x=0.2,
-                legend_title="Kategori",
-                legend_orientation="h",
-                legend_yanchor="bottom",
-                legend_y=-0.3,
-                legend_x=0.5,
-                legend_xanchor="center",
-                height=400,
-                width=400,  # Ensure the chart width is adequate
-            )
+            fig_key = figure_key(dataset, f"{chart_prefix}.paham_donut", (status_filter, pertanyaan_filter))
+            fig_donut = get_figure(fig_key)
+            if fig_donut is None:
+                fig_donut = px.pie(
+                    fulfillment_data,
+                    values='Persentase',  # Nilai persentase
+                    names='Status',  # Nama kategori
+                    hole=0.5,  # Membuat efek donut
+                    title=f"Persentase Pemahaman Setiap Pertanyaan",  # Judul chart
+                    color_discrete_sequence=px.colors.sequential.Purpor  # Warna chart
+                )
 
-            # Display the pie chart
-            st.plotly_chart(fig_donut, use_container_width=True)
+                # Update layout untuk judul dan posisi legenda
+                fig_donut.update_layout(
+                    title_x=0.0,  # Memusatkan judul
+                    legend_title="Status",  # Menambahkan judul untuk legenda
+                    legend_orientation="h",  # Membuat legenda horizontal
+                    legend_yanchor="bottom",  # Menempatkan legenda di bawah
+                    legend_y=-0.3,  # Menurunkan posisi legenda
+                    legend_x=0.5,  # Memusatkan legenda secara horizontal
+                    legend_xanchor="center",  # Menjaga posisi legenda tetap di tengah
+                    height=400,
+                    width=400  # Ensure the chart width is adequate
+                )
+                fig_donut = put_figure(fig_key, fig_donut)
 
-    col1, col2 = st.columns(2)
+            # Menampilkan donut chart di Streamlit
+            plotly_chart(fig_donut, use_container_width=True)
 
-    with col1:
+    with chart_cols[0]:
         with st.container(border=True):
             # Filter the data based on the selected status
-            filtered_data1 = data[data['1. Status Bpk/Ibu/Saudara/i:'] == status_filter] if status_filter != "All" else data
+            filtered_data1 = data[data[STATUS] == status_filter] if status_filter != "All" else data
 
             # Calculate the average score for each question by status
-            avg_scores_line = filtered_data1.groupby('1. Status Bpk/Ibu/Saudara/i:').mean().reset_index()
+            avg_scores_line = filtered_data1.groupby(STATUS, observed=True).mean().reset_index()
 
             # Convert the data to long format for line chart
-            avg_scores_long_line = avg_scores_line.melt(
-                id_vars='1. Status Bpk/Ibu/Saudara/i:', 
-                var_name='Indikator', 
-                value_name='Rata-Rata Skor'
-            )
+            with timed("clean", "melt"):
+                avg_scores_long_line = avg_scores_line.melt(
+                    id_vars=STATUS, 
+                    var_name='Indikator', 
+                    value_name='Rata-Rata Skor'
+                )
+                avg_scores_long_line = with_hover_text(avg_scores_long_line, 'Indikator')
 
             # Create the line chart using Plotly Express
-            linechart = px.line(
-                avg_scores_long_line,
-                x="Indikator",                # X-axis: Indikator Pertanyaan (a, b, c, ...)
-                y="Rata-Rata Skor",           # Y-axis: Rata-Rata Skor
-                color="1. Status Bpk/Ibu/Saudara/i:",   # Color the lines based on Status
-                markers=True,                 # Show markers on the line chart
-                labels={
-                    "Indikator": "Indikator Pertanyaan",  # Label for X-axis
-                    "Rata-Rata Skor": "Rata-Rata Skor",   # Label for Y-axis
-                    "1. Status Bpk/Ibu/Saudara/i:": "Status"
-                },
-                title="Tren Rata-Rata Skor Berdasarkan Status dan Indikator"  # Title for the chart
-            )
-
-            # Customize the chart layout
-            linechart.update_layout(
-                hovermode="closest",  # Show hover data for the closest point
-                xaxis_title="Indikator Pertanyaan",  # X-axis label
-                yaxis_title="Rata-Rata Skor",        # Y-axis label
-                legend_title="Status",               # Title for the legend
-                title_x=0.2,                         # Center the title
-                font=dict(
-                    family="Arial, sans-serif",
-                    size=14,
-                    color="black"
-                ),
-                margin=dict(l=40, r=40, t=60, b=40),  # Adjust margins for better spacing
-                height=400,                          # Set height for the chart
-                width=600,                           # Set width for the chart
-                xaxis=dict(
-                    showticklabels=False  # Hide the labels on the X-axis (indicators)
+            fig_key = figure_key(dataset, f"{chart_prefix}.status_line", (status_filter,))
+            linechart = get_figure(fig_key)
+            if linechart is None:
+                linechart = px.line(
+                    avg_scores_long_line,
+                    x="Indikator",                # X-axis: Indikator Pertanyaan (a, b, c, ...)
+                    y="Rata-Rata Skor",           # Y-axis: Rata-Rata Skor
+                    color=STATUS,   # Color the lines based on Status
+                    markers=True,                 # Show markers on the line chart
+                    hover_data={"Indikator": False, HOVER_COLUMN: True},  # Teks pertanyaan, bukan ID
+                    labels={
+                        "Indikator": "Indikator Pertanyaan",  # Label for X-axis
+                        "Rata-Rata Skor": "Rata-Rata Skor",   # Label for Y-axis
+                        STATUS: "Status"
+                    },
+                    title="Tren Rata-Rata Skor Berdasarkan Status dan Indikator"  # Title for the chart
                 )
-            )
+
+                # Customize the chart layout
+                linechart.update_layout(
+                    hovermode="closest",  # Show hover data for the closest point
+                    xaxis_title="Indikator Pertanyaan",  # X-axis label
+                    yaxis_title="Rata-Rata Skor",        # Y-axis label
+                    legend_title="Status",               # Title for the legend
+                    title_x=0.2,                         # Center the title
+                    font=dict(
+                        family="Arial, sans-serif",
+                        size=14,
+                        color="black"
+                    ),
+                    margin=dict(l=40, r=40, t=60, b=40),  # Adjust margins for better spacing
+                    height=400,                          # Set height for the chart
+                    width=600,                           # Set width for the chart
+                    xaxis=dict(
+                        showticklabels=False  # Hide the labels on the X-axis (indicators)
+                    )
+                )
+                linechart = put_figure(fig_key, linechart)
 
             # Display the line chart
-            st.plotly_chart(linechart, use_container_width=True)
+            plotly_chart(linechart, use_container_width=True)
+
 
 
-    with col2:
+    with chart_cols[1]:
         with st.container(border=True):
             # Membuat grouped bar chart yang lebih interaktif
-            barchart = px.bar(
-                avg_scores_long,
-                x="Indikator",                            # Sumbu X: Indikator
-                y="Rata-Rata Skor",                       # Sumbu Y: Skor Rata-Rata
-                color="1. Status Bpk/Ibu/Saudara/i:",     # Warna berdasarkan Status
-                barmode="group",                          # Gunakan mode group saja
-                text="Rata-Rata Skor",                    # Tampilkan skor pada bar
-                labels={
-                    "Indikator": "Indikator Pertanyaan",
-                    "Rata-Rata Skor": "Rata-Rata Skor",
-                    "1. Status Bpk/Ibu/Saudara/i:": "Status"
-                },
-                hover_data={"Rata-Rata Skor": ":.2f"},    # Format hover dengan 2 desimal
-                title="Rata-Rata Skor Berdasarkan Status dan Pertanyaan"
-            )
-
-            barchart.update_traces(
-                texttemplate='%{text:.2f}',               # Format angka pada bar (2 desimal)
-                textposition='outside'                   # Tampilkan teks di atas bar
-            )
-
-            barchart.update_layout(
-                hovermode="closest",                      # Tooltip hanya muncul pada bar yang difokuskan
-                xaxis_title="",                           # Hapus label sumbu X
-                xaxis=dict(
-                    showticklabels=False,                 # Menyembunyikan kategori indikator di sumbu X
-                ),
-                yaxis_title="Rata-Rata Skor",             # Judul sumbu Y
-                legend_title="Status",                    # Judul legenda
-                title_x=0.25,                              # Pusatkan judul chart
-                font=dict(
-                    family="Arial, sans-serif",           # Jenis font
-                    size=14,                              # Ukuran font
-                    color="black"                         # Warna font
-                ),
-                margin=dict(l=40, r=40, t=60, b=40),      # Margin kiri, kanan, atas, bawah
-                height=400,                               # Tinggi chart
-                width=1000                                 # Lebar chart
-            )
-
-
-            st.plotly_chart(barchart, use_container_width=True)
-
-    # Menampilkan tabel rata-rata skor dengan kategori
-    st.container(border=True)
-    st.data_editor(
-                avg_scores_long,
-                column_config={
-                    "Rata-Rata Skor": st.column_config.ProgressColumn(
-                        "Rata-rata Skor",
-                        help="Menampilkan nilai rata-rata jawaban",
-                        min_value=0,
-                        max_value=5,  # Asumsikan skala 1-5
-                        format="%.2f",  # Format nilai
-                        ),
-                    "Kategori": st.column_config.TextColumn(
-                    "Kategori",
-                    help="Kategori berdasarkan skor"
-                    )
+            fig_key = figure_key(dataset, f"{chart_prefix}.status_bar", (status_filter,))
+            barchart = get_figure(fig_key)
+            if barchart is None:
+                barchart = px.bar(
+                    with_hover_text(avg_scores_long, 'Indikator'),
+                    **error_bars(avg_scores_long),  # Pita interval kepercayaan
+                    x="Indikator",                            # Sumbu X: Indikator
+                    y="Rata-Rata Skor",                       # Sumbu Y: Skor Rata-Rata
+                    color=STATUS,     # Warna berdasarkan Status
+                    barmode="group",                          # Gunakan mode group saja
+                    text="Rata-Rata Skor",                    # Tampilkan skor pada bar
+                    labels={
+                        "Indikator": "Indikator Pertanyaan",
+                        "Rata-Rata Skor": "Rata-Rata Skor",
+                        STATUS: "Status"
                     },
-                    hide_index=True,
-                    use_container_width=True
-                )      
-
-        
-
-with tab2:
-    # Load data
-    data = load_data("C.1.SurveyPemahamanVisiMisiTIF.csv")
-    
-
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Pilih Status
-        status_filter = st.selectbox("🔍 Pilih Status:", ["All"] + list(data['1. Status Bpk/Ibu/Saudara/i:'].unique()))
-
-        # Filter data berdasarkan status
-        if status_filter == "All":
-            filtered_data1 = data
-        else:
-            filtered_data1 = data[data['1. Status Bpk/Ibu/Saudara/i:'] == status_filter]
-
-        # Calculate average scores for all questions grouped by status
-        avg_scores = filtered_data1.groupby('1. Status Bpk/Ibu/Saudara/i:').mean().reset_index()
-        with col2:
-            # Pilih Pertanyaan (berdasarkan kolom-kolom pertanyaan yang ada di filtered data)
-            pertanyaan_list = filtered_data1.columns[1:]  # Asumsi pertanyaan ada di kolom 1 hingga kolom terakhir sebelum kolom status
-            pertanyaan_filter = st.selectbox("🔍 Pilih Pertanyaan:", ["All"] + list(pertanyaan_list))  # Menambahkan "All" sebagai pilihan
-
-            # Filter data berdasarkan pertanyaan yang dipilih
-            if pertanyaan_filter == "All":
-                # Jika "All" dipilih, tampilkan semua pertanyaan
-                filtered_data2 = filtered_data1
-            else:
-                filtered_data2 = filtered_data1[['1. Status Bpk/Ibu/Saudara/i:', pertanyaan_filter]]
-
-            # Filter out "Netral" answers (score == 3)
-            non_neutral_data = data[data.apply(lambda row: ~row.isin([3]), axis=1)]
-
-            # Count the occurrences of each category (Sangat Kurang, Kurang, Baik, Sangat Baik)
-            categories_count = {
-                "Sangat Kurang": (non_neutral_data == 1).sum().sum(),
-                "Kurang": (non_neutral_data == 2).sum().sum(),
-                "Baik": (non_neutral_data == 4).sum().sum(),
-                "Sangat Baik": (non_neutral_data == 5).sum().sum(),
-            }
-
-            # Calculate the total number of relevant answers
-            total_non_neutral = sum(categories_count.values())
-
-            # Prepare data for the pie chart
-            fulfillment_data1 = pd.DataFrame({
-                'Kategori': categories_count.keys(),
-                'Jumlah': categories_count.values(),
-                'Persentase': [count / total_non_neutral * 100 for count in categories_count.values()]
-            })
-
-            # Hitung rata-rata skor untuk setiap pertanyaan dalam data yang telah difilter
-            avg_scores = filtered_data1.iloc[:, 1:].mean().reset_index()
-            avg_scores.columns = ['Indikator', 'Rata-Rata Skor']
-
-            # Menghitung rata-rata skor berdasarkan status
-            avg_scoresbar = filtered_data1.groupby('1. Status Bpk/Ibu/Saudara/i:').mean().reset_index()
+                    hover_data={"Rata-Rata Skor": ":.2f", "Indikator": False, HOVER_COLUMN: True},  # 2 desimal, teks pertanyaan
+                    title="Rata-Rata Skor Berdasarkan Status dan Pertanyaan"
+                )
 
-            # Menghitung skor rata-rata untuk pertanyaan yang dipilih
-            if pertanyaan_filter != "All":
-                selected_question_avg_score = filtered_data1[pertanyaan_filter].mean()
-            else:
-                selected_question_avg_score = filtered_data1[pertanyaan_list].mean().mean()  # Rata-rata semua pertanyaan jika "All" dipilih
+                barchart.update_traces(
+                    texttemplate='%{text:.2f}',               # Format angka pada bar (2 desimal)
+                    textposition='outside'                   # Tampilkan teks di atas bar
+                )
 
-            # Hitung persentase terpenuhi dan tidak terpenuhi
-            fulfilled_percentage = (selected_question_avg_score / 5) * 100
-            not_fulfilled_percentage = 100 - fulfilled_percentage
+                barchart.update_layout(
+                    hovermode="closest",                      # Tooltip hanya muncul pada bar yang difokuskan
+                    xaxis_title="",                           # Hapus label sumbu X
+                    xaxis=dict(
+                        showticklabels=False,                 # Menyembunyikan kategori indikator di sumbu X
+                    ),
+                    yaxis_title="Rata-Rata Skor",             # Judul sumbu Y
+                    legend_title="Status",                    # Judul legenda
+                    title_x=0.25,                              # Pusatkan judul chart
+                    font=dict(
+                        family="Arial, sans-serif",           # Jenis font
+                        size=14,                              # Ukuran font
+                        color="black"                         # Warna font
+                    ),
+                    margin=dict(l=40, r=40, t=60, b=40),      # Margin kiri, kanan, atas, bawah
+                    height=400,                               # Tinggi chart
+                    width=1000                                 # Lebar chart
+                )
+                barchart = put_figure(fig_key, barchart)
+
+
+            plotly_chart(barchart, use_container_width=True)
+
+    with table_area:
+        # Menampilkan tabel rata-rata skor dengan kategori
+        st.container(border=True)
+        st.data_editor(
+                    display_frame(avg_scores_long, columns=['Indikator']),
+                    column_config={
+                        "Rata-Rata Skor": st.column_config.ProgressColumn(
+                            "Rata-rata Skor",
+                            help="Menampilkan nilai rata-rata jawaban",
+                            min_value=0,
+                            max_value=5,  # Asumsikan skala 1-5
+                            format="%.2f",  # Format nilai
+                            ),
+                        "Kategori": st.column_config.TextColumn(
+                        "Kategori",
+                        help="Kategori berdasarkan skor"
+                        )
+                        },
+                        hide_index=True,
+                        use_container_width=True
+                    )
 
-            # Siapkan data untuk donut chart
-            fulfillment_data = pd.DataFrame({
-                'Status': ['Paham', 'Tidak Paham'],
-                'Persentase': [fulfilled_percentage, not_fulfilled_percentage]
-            })
 
+def render_survey(dataset, chart_prefix):
+    # Load data (kolom pertanyaan sudah berupa ID, di-cache per versi file)
+    data = with_ids(dataset)
 
+    filter_cols = st.columns(2)
 
-    
-    # Mengonversi DataFrame ke format long untuk pembuatan grouped bar chart
-    avg_scores_long = avg_scoresbar.melt(
-        id_vars='1. Status Bpk/Ibu/Saudara/i:',  # Kolom status sebagai identifier
-        var_name='Indikator',                   # Nama kolom indikator (a, b, c, ...)
-        value_name='Rata-Rata Skor'             # Nama kolom nilai rata-rata skor
-    )
-
-    # Terapkan fungsi kategori ke setiap nilai skor rata-rata
-    avg_scores_long['Kategori'] = avg_scores_long['Rata-Rata Skor'].apply(assign_category)
+    # Hitung distribusi kategori tanpa netral (skor == 3) dalam satu pass tervektorisasi
+    fulfillment_data1 = category_distribution(total_counts(data))
 
     # Layout: Create three columns for the components
     col1, col2, col3 = st.columns([4, 2, 2])
@@ -439,210 +307,87 @@ with tab2:
     with col1:
         with st.container(border=True):
             # Create and style the bar chart (horizontal)
-            fig_bar = px.bar(
-                fulfillment_data1,
-                x='Persentase',  # The percentage values for the bars
-                y='Kategori',  # The categories for the bars
-                orientation='h',  # Horizontal bar chart
-                title="Distribusi Setiap Kategori",  # Title of the chart
-                color='Kategori',  # Use 'Kategori' for coloring the bars
-                color_discrete_sequence=px.colors.sequential.Purpor  # Color sequence
-            )
-
-            # Update layout for the bar chart
-            fig_bar.update_layout(
-                title_x=0.4,  # Position the title
-                legend_title="Kategori",  # Title of the legend
-                legend_orientation="h",  # Horizontal legend
-                legend_yanchor="bottom",  # Position the legend at the bottom
-                legend_y=-0.3,  # Lower the legend
-                legend_x=0.5,  # Center the legend horizontally
-                legend_xanchor="center",  # Anchor the legend to the center
-                height=400,  # Height of the chart
-                width=600,  # Width of the chart
-            )
+            fig_key = figure_key(dataset, f"{chart_prefix}.kategori_bar")
+            fig_bar = get_figure(fig_key)
+            if fig_bar is None:
+                fig_bar = px.bar(
+                    fulfillment_data1,
+                    x='Persentase',  # The percentage values for the bars
+                    y='Kategori',  # The categories for the bars
+                    orientation='h',  # Horizontal bar chart
+                    title="Distribusi Setiap Kategori",  # Title of the chart
+                    color='Kategori',  # Use 'Kategori' for coloring the bars
+                    color_discrete_sequence=px.colors.sequential.Purpor  # Color sequence
+                )
+
+                # Update layout for the bar chart
+                fig_bar.update_layout(
+                    title_x=0.4,  # Position the title
+                    legend_title="Kategori",  # Title of the legend
+                    legend_orientation="h",  # Horizontal legend
+                    legend_yanchor="bottom",  # Position the legend at the bottom
+                    legend_y=-0.3,  # Lower the legend
+                    legend_x=0.5,  # Center the legend horizontally
+                    legend_xanchor="center",  # Anchor the legend to the center
+                    height=400,  # Height of the chart
+                    width=600,  # Width of the chart
+                )
+                fig_bar = put_figure(fig_key, fig_bar)
 
             # Display the horizontal bar chart
-            st.plotly_chart(fig_bar, use_container_width=True)
-            
-    with col2:
-        with st.container(border=True):
-       
-            # Membuat donut chart
-            fig_donut = px.pie(
-                fulfillment_data,
-                values='Persentase',  # Nilai persentase
-                names='Status',  # Nama kategori
-                hole=0.5,  # Membuat efek donut
-                title=f"Persentase Pemahaman Setiap Pertanyaan",  # Judul chart
-                color_discrete_sequence=px.colors.sequential.Purpor  # Warna chart
-            )
-
-            # Update layout untuk judul dan posisi legenda
-            fig_donut.update_layout(
-                title_x=0.0,  # Memusatkan judul
-                legend_title="Status",  # Menambahkan judul untuk legenda
-                legend_orientation="h",  # Membuat legenda horizontal
-                legend_yanchor="bottom",  # Menempatkan legenda di bawah
-                legend_y=-0.3,  # Menurunkan posisi legenda
-                legend_x=0.5,  # Memusatkan legenda secara horizontal
-                legend_xanchor="center",  # Menjaga posisi legenda tetap di tengah
-                height=400,
-                width=400  # Ensure the chart width is adequate
-            )
+            plotly_chart(fig_bar, use_container_width=True)
+            first_paint()
 
-            # Menampilkan donut chart di Streamlit
-            st.plotly_chart(fig_donut, use_container_width=True)
 
     with col3:
         with st.container(border=True):
                 # Create and style the pie chart
-            fig_donut = px.pie(
-                fulfillment_data1,
-                values='Persentase',
-                names='Kategori',
-                hole=0.5,
-                title="Distribusi Setiap Kategori",
-                color_discrete_sequence=px.colors.sequential.Purpor
-            )
-
-            # Update layout for the pie chart
-            fig_donut.update_layout(
-                title_x=0.2,
-                legend_title="Kategori",
-                legend_orientation="h",
-                legend_yanchor="bottom",
-                legend_y=-0.3,
-                legend_x=0.5,
-                legend_xanchor="center",
-                height=400,
-                width=400,  # Ensure the chart width is adequate
-            )
-
-            # Display the pie chart
-            st.plotly_chart(fig_donut, use_container_width=True)
+            fig_key = figure_key(dataset, f"{chart_prefix}.kategori_donut")
+            fig_donut = get_figure(fig_key)
+            if fig_donut is None:
+                fig_donut = px.pie(
+                    fulfillment_data1,
+                    values='Persentase',
+                    names='Kategori',
+                    hole=0.5,
+                    title="Distribusi Setiap Kategori",
+                    color_discrete_sequence=px.colors.sequential.Purpor
+                )
 
-    col1, col2 = st.columns(2)
+                # Update layout for the pie chart
+                fig_donut.update_layout(
+                    title_x=0.2,
+                    legend_title="Kategori",
+                    legend_orientation="h",
+                    legend_yanchor="bottom",
+                    legend_y=-0.3,
+                    legend_x=0.5,
+                    legend_xanchor="center",
+                    height=400,
+                    width=400,  # Ensure the chart width is adequate
+                )
+                fig_donut = put_figure(fig_key, fig_donut)
 
-    with col1:
-        with st.container(border=True):
-            # Filter the data based on the selected status
-            filtered_data1 = data[data['1. Status Bpk/Ibu/Saudara/i:'] == status_filter] if status_filter != "All" else data
+            # Display the pie chart
+            plotly_chart(fig_donut, use_container_width=True)
 
-            # Calculate the average score for each question by status
-            avg_scores_line = filtered_data1.groupby('1. Status Bpk/Ibu/Saudara/i:').mean().reset_index()
+    chart_cols = st.columns(2)
+    table_area = st.container()
 
-            # Convert the data to long format for line chart
-            avg_scores_long_line = avg_scores_line.melt(
-                id_vars='1. Status Bpk/Ibu/Saudara/i:', 
-                var_name='Indikator', 
-                value_name='Rata-Rata Skor'
-            )
+    render_filtered(data, dataset, chart_prefix, filter_cols, col2, chart_cols, table_area)
 
-            # Create the line chart using Plotly Express
-            linechart = px.line(
-                avg_scores_long_line,
-                x="Indikator",                # X-axis: Indikator Pertanyaan (a, b, c, ...)
-                y="Rata-Rata Skor",           # Y-axis: Rata-Rata Skor
-                color="1. Status Bpk/Ibu/Saudara/i:",   # Color the lines based on Status
-                markers=True,                 # Show markers on the line chart
-                labels={
-                    "Indikator": "Indikator Pertanyaan",  # Label for X-axis
-                    "Rata-Rata Skor": "Rata-Rata Skor",   # Label for Y-axis
-                    "1. Status Bpk/Ibu/Saudara/i:": "Status"
-                },
-                title="Tren Rata-Rata Skor Berdasarkan Status dan Indikator"  # Title for the chart
-            )
-
-            # Customize the chart layout
-            linechart.update_layout(
-                hovermode="closest",  # Show hover data for the closest point
-                xaxis_title="Indikator Pertanyaan",  # X-axis label
-                yaxis_title="Rata-Rata Skor",        # Y-axis label
-                legend_title="Status",               # Title for the legend
-                title_x=0.2,                         # Center the title
-                font=dict(
-                    family="Arial, sans-serif",
-                    size=14,
-                    color="black"
-                ),
-                margin=dict(l=40, r=40, t=60, b=40),  # Adjust margins for better spacing
-                height=400,                          # Set height for the chart
-                width=600,                           # Set width for the chart
-                xaxis=dict(
-                    showticklabels=False  # Hide the labels on the X-axis (indicators)
-                )
-            )
 
-            # Display the line chart
-            st.plotly_chart(linechart, use_container_width=True)
+# Tampilkan deskripsi survei dan grafik
+tab1, tab2 = st.tabs(["Survey VMTS UPPS", "Survey VMTS PS"], key="c1.tabs", on_change="rerun")
 
+with tab1:
+    # Hanya tab yang sedang dibuka yang dihitung dan digambar
+    if tab1.open:
+        render_survey("c1_stt", "c1.upps")
 
-    with col2:
-        with st.container(border=True):
-            # Membuat grouped bar chart yang lebih interaktif
-            barchart = px.bar(
-                avg_scores_long,
-                x="Indikator",                            # Sumbu X: Indikator
-                y="Rata-Rata Skor",                       # Sumbu Y: Skor Rata-Rata
-                color="1. Status Bpk/Ibu/Saudara/i:",     # Warna berdasarkan Status
-                barmode="group",                          # Gunakan mode group saja
-                text="Rata-Rata Skor",                    # Tampilkan skor pada bar
-                labels={
-                    "Indikator": "Indikator Pertanyaan",
-                    "Rata-Rata Skor": "Rata-Rata Skor",
-                    "1. Status Bpk/Ibu/Saudara/i:": "Status"
-                },
-                hover_data={"Rata-Rata Skor": ":.2f"},    # Format hover dengan 2 desimal
-                title="Rata-Rata Skor Berdasarkan Status dan Pertanyaan"
-            )
-
-            barchart.update_traces(
-                texttemplate='%{text:.2f}',               # Format angka pada bar (2 desimal)
-                textposition='outside'                   # Tampilkan teks di atas bar
-            )
-
-            barchart.update_layout(
-                hovermode="closest",                      # Tooltip hanya muncul pada bar yang difokuskan
-                xaxis_title="",                           # Hapus label sumbu X
-                xaxis=dict(
-                    showticklabels=False,                 # Menyembunyikan kategori indikator di sumbu X
-                ),
-                yaxis_title="Rata-Rata Skor",             # Judul sumbu Y
-                legend_title="Status",                    # Judul legenda
-                title_x=0.25,                              # Pusatkan judul chart
-                font=dict(
-                    family="Arial, sans-serif",           # Jenis font
-                    size=14,                              # Ukuran font
-                    color="black"                         # Warna font
-                ),
-                margin=dict(l=40, r=40, t=60, b=40),      # Margin kiri, kanan, atas, bawah
-                height=400,                               # Tinggi chart
-                width=1000                                 # Lebar chart
-            )
-
-
-            st.plotly_chart(barchart, use_container_width=True)
-
-    # Menampilkan tabel rata-rata skor dengan kategori
-    st.container(border=True)
-    st.data_editor(
-                avg_scores_long,
-                column_config={
-                    "Rata-Rata Skor": st.column_config.ProgressColumn(
-                        "Rata-rata Skor",
-                        help="Menampilkan nilai rata-rata jawaban",
-                        min_value=0,
-                        max_value=5,  # Asumsikan skala 1-5
-                        format="%.2f",  # Format nilai
-                        ),
-                    "Kategori": st.column_config.TextColumn(
-                    "Kategori",
-                    help="Kategori berdasarkan skor"
-                    )
-                    },
-                    hide_index=True,
-                    use_container_width=True
-                )      
+with tab2:
+    if tab2.open:
+        render_survey("c1_tif", "c1.ps")
 
-        
+# Panel waktu per tahap (hanya tampil dengan ?debug=timing)
+timing_panel()
@@ -1,6 +1,8 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
+
+from dashboard.startup import first_paint, lazy_import, page_started
+
+page_started("c5")
 
 # Set page configuration
 st.set_page_config(
@@ -14,12 +16,18 @@ st.markdown("""
     <h2 style="text-align: center;">📊 Survey Evaluasi Kepuasan Dosen Dan Tenaga Kependidikan Dan Mahasiswa Terhadap Ketersediaan Dan Keteraksesan Sarana Prasarana</h2>
 """, unsafe_allow_html=True)
 
-st.divider()
+# Modul berat (pandas, plotly, data survei) baru diimpor setelah judul tampil
+import pandas as pd
+
+from dashboard.data import load_data
+from dashboard.figures import figure_key, get_figure, put_figure
+from dashboard.likert import category_distribution, total_counts
+from dashboard.stats import error_bars, load_mean_ci, with_ci
+from dashboard.timing import plotly_chart, timed, timing_panel
 
-# Fungsi untuk memuat data dengan caching
-@st.cache_data
-def load_data(file_path):
-    return pd.read_csv(file_path)
+px = lazy_import("plotly.express")
+
+st.divider()
 
 # Fungsi untuk membersihkan data
 def clean_data(data, start_col=1):
@@ -41,650 +49,672 @@ def determine_category(score):
         return "Sangat Baik"
 
 # Tampilkan deskripsi survey dan grafik
-tab1, tab2, tab3 = st.tabs(["Survey Kepuasan Dosen (Fasilitas Pendukung Mengajar dan Faskes)", "Survey Kepuasan MHS (Tangible)", "Survey Kepuasan Tendik (Sarana dan Prasarana)"])
+tab1, tab2, tab3 = st.tabs(["Survey Kepuasan Dosen (Fasilitas Pendukung Mengajar dan Faskes)", "Survey Kepuasan MHS (Tangible)", "Survey Kepuasan Tendik (Sarana dan Prasarana)"], key="c5.tabs", on_change="rerun")
 
 # Tab 1: SARANA DOSEN
 with tab1:
-    # Load data
-    data1 = load_data("C5.saranadosen-prep.csv")
-
-    # Calculate average scores for each question
-    avg_scores = data1.mean()
-
-    # Prepare the indicator names (letters for X-axis)
-    questions = data1.columns.tolist()  # Assuming questions are column names
-    letters = [chr(i) for i in range(97, 97 + len(avg_scores))]  # ['a', 'b', 'c', ...]
-
-    # Create a DataFrame with letters as 'Indikator', average scores, and questions
-    avg_scores_df = pd.DataFrame({
-        'Indikator': letters,
-        'Pertanyaan': questions,
-        'Rata-Rata Skor': avg_scores.values
-    })
-
-        # Terapkan fungsi kategori ke setiap nilai skor rata-rata
-    avg_scores_df['Kategori'] = avg_scores_df['Rata-Rata Skor'].apply(determine_category)
-
-        # Tambahkan opsi "All" di awal daftar pertanyaan
-    all_questions = ["All"] + questions
-
-    # Perbarui selectbox untuk menyertakan opsi "All"
-    selected_question_index = st.selectbox(
-        "🔎 Pilih Pertanyaan :",
-        range(len(all_questions)),
-        format_func=lambda x: all_questions[x]
-    )
-
-    # Jika "All" dipilih, hitung data gabungan, jika tidak, ambil pertanyaan spesifik
-    if selected_question_index == 0:  # "All" dipilih
-        selected_question_avg_score = avg_scores_df['Rata-Rata Skor'].mean()
-        fulfilled_percentage = (selected_question_avg_score / 5) * 100
-        not_fulfilled_percentage = 100 - fulfilled_percentage
-    else:
-        selected_question_avg_score = avg_scores_df['Rata-Rata Skor'].iloc[selected_question_index - 1]
-        fulfilled_percentage = (selected_question_avg_score / 5) * 100
-        not_fulfilled_percentage = 100 - fulfilled_percentage
-
-    # Persiapkan data untuk donut chart
-    fulfillment_data = pd.DataFrame({
-        'Status': ['Puas', 'Tidak Puas'],
-        'Persentase': [fulfilled_percentage, not_fulfilled_percentage]
-    })
-
-        # Filter data tanpa netral (skor == 3 dianggap netral)
-    non_neutral_data = data1[data1.apply(lambda row: ~row.isin([3]), axis=1)]
-
-    # Hitung jumlah kategori
-    categories_count = {
-        "Sangat Kurang": (non_neutral_data == 1).sum().sum(),
-        "Kurang": (non_neutral_data == 2).sum().sum(),
-        "Baik": (non_neutral_data == 4).sum().sum(),
-        "Sangat Baik": (non_neutral_data == 5).sum().sum(),
-    }
-
-    # Hitung total jawaban yang relevan
-    total_non_neutral = sum(categories_count.values())
-
-    # Hitung persentase untuk setiap kategori
-    fulfillment_data1 = pd.DataFrame({
-        'Kategori': categories_count.keys(),
-        'Jumlah': categories_count.values(),
-        'Persentase': [count / total_non_neutral * 100 for count in categories_count.values()]
-    })
-
-            # Create the fulfillment_data DataFrame
-    fulfillment_data = pd.DataFrame({
-        'Status': ['Puas', 'Tidak Puas'],  # Change 'Kategori' to 'Status'
-        'Persentase': [fulfilled_percentage, not_fulfilled_percentage]
-    })
-
-    col1, col2 = st.columns(2)
-
-    with col1:
+    # Hanya tab yang sedang dibuka yang dihitung dan digambar
+    if tab1.open:
+        # Load data
+        data1 = load_data("C5.saranadosen-prep.csv")
+
+        # Calculate average scores for each question
+        with timed("aggregate", "avg_scores"):
+            avg_scores = data1.mean()
+
+        # Prepare the indicator names (letters for X-axis)
+        questions = data1.columns.tolist()  # Assuming questions are column names
+        letters = [chr(i) for i in range(97, 97 + len(avg_scores))]  # ['a', 'b', 'c', ...]
+
+        # Create a DataFrame with letters as 'Indikator', average scores, and questions
+        avg_scores_df = pd.DataFrame({
+            'Indikator': letters,
+            'Pertanyaan': questions,
+            'Rata-Rata Skor': avg_scores.values
+        })
+
+            # Terapkan fungsi kategori ke setiap nilai skor rata-rata
+        with timed("clean", "kategori"):
+            avg_scores_df['Kategori'] = avg_scores_df['Rata-Rata Skor'].apply(determine_category)
+
+        # Interval kepercayaan 95% setiap pertanyaan (di-cache per versi data)
+        avg_scores_df = with_ci(avg_scores_df, load_mean_ci("c5_dosen"))
+
+            # Tambahkan opsi "All" di awal daftar pertanyaan
+        all_questions = ["All"] + questions
+
+        # Perbarui selectbox untuk menyertakan opsi "All"
+        selected_question_index = st.selectbox(
+            "🔎 Pilih Pertanyaan :",
+            range(len(all_questions)),
+            format_func=lambda x: all_questions[x]
+        )
+
+        # Jika "All" dipilih, hitung data gabungan, jika tidak, ambil pertanyaan spesifik
+        if selected_question_index == 0:  # "All" dipilih
+            selected_question_avg_score = avg_scores_df['Rata-Rata Skor'].mean()
+            fulfilled_percentage = (selected_question_avg_score / 5) * 100
+            not_fulfilled_percentage = 100 - fulfilled_percentage
+        else:
+            selected_question_avg_score = avg_scores_df['Rata-Rata Skor'].iloc[selected_question_index - 1]
+            fulfilled_percentage = (selected_question_avg_score / 5) * 100
+            not_fulfilled_percentage = 100 - fulfilled_percentage
+
+        # Persiapkan data untuk donut chart
+        fulfillment_data = pd.DataFrame({
+            'Status': ['Puas', 'Tidak Puas'],
+            'Persentase': [fulfilled_percentage, not_fulfilled_percentage]
+        })
+
+        # Hitung distribusi kategori tanpa netral (skor == 3) dalam satu pass tervektorisasi
+        fulfillment_data1 = category_distribution(total_counts(data1))
+
+                # Create the fulfillment_data DataFrame
+        fulfillment_data = pd.DataFrame({
+            'Status': ['Puas', 'Tidak Puas'],  # Change 'Kategori' to 'Status'
+            'Persentase': [fulfilled_percentage, not_fulfilled_percentage]
+        })
+
+        col1, col2 = st.columns(2)
+
+        with col1:
         
-        with st.container(border=True): 
-            # Create the donut chart
-            fig_donut = px.pie(
-                fulfillment_data,
-                values='Persentase',
-                names='Status',
-                hole=0.4,
-                title=f"Persentase Puas dan Tidak Puas untuk Pertanyaan",
-                color_discrete_sequence=px.colors.sequential.Purpor
-            )
-            # Update layout to center the title and position the legend at the bottom
-            fig_donut.update_layout(
-                title_x=0.2,  # Centers the title
-                legend_title="Indikator",  # Title for the legend
-                legend_orientation="h",  # Horizontal legend
-                legend_yanchor="bottom",  # Aligns legend at the bottom
-                legend_y=-0.5,  # Moves the legend below the chart
-                legend_x=0.5,  # Centers the legend horizontally
-                legend_xanchor="center"  # Ensures that the legend is anchored in the center
-            )
-            # Display the donut chart
-            st.plotly_chart(fig_donut,use_container_width=True)
+            with st.container(border=True): 
+                # Create the donut chart
+                fig_key = figure_key("c5_dosen", "c5.dosen.puas_donut", (selected_question_index,))
+                fig_donut = get_figure(fig_key)
+                if fig_donut is None:
+                    fig_donut = px.pie(
+                        fulfillment_data,
+                        values='Persentase',
+                        names='Status',
+                        hole=0.4,
+                        title=f"Persentase Puas dan Tidak Puas untuk Pertanyaan",
+                        color_discrete_sequence=px.colors.sequential.Purpor
+                    )
+                    # Update layout to center the title and position the legend at the bottom
+                    fig_donut.update_layout(
+                        title_x=0.2,  # Centers the title
+                        legend_title="Indikator",  # Title for the legend
+                        legend_orientation="h",  # Horizontal legend
+                        legend_yanchor="bottom",  # Aligns legend at the bottom
+                        legend_y=-0.5,  # Moves the legend below the chart
+                        legend_x=0.5,  # Centers the legend horizontally
+                        legend_xanchor="center"  # Ensures that the legend is anchored in the center
+                    )
+                    fig_donut = put_figure(fig_key, fig_donut)
+                # Display the donut chart
+                plotly_chart(fig_donut,use_container_width=True)
+                first_paint()
 
  
         
-        with st.container(border=True):    # Line Chart for the average scores of each indicator
-
-            fig_line = px.line(
-                avg_scores_df,
-                x='Indikator',
-                y='Rata-Rata Skor',
-                labels={'Indikator': 'Indikator', 'Rata-Rata Skor': 'Rata-Rata Skor'},
-                title="Perubahan Skor Rata-Rata untuk Setiap Indikator",
-                markers=True,
-                height=400,
-            )
-
-            # Update the line color to use the Purpor color scale
-            fig_line.update_traces(
-                line=dict(color='rgba(255, 99, 71, 1)'),  # Default line color if you want specific color
-                marker=dict(color=avg_scores_df['Rata-Rata Skor'], colorscale='Purpor')  # Applying color scale to markers
-            )
-
-            # Update layout for line chart
-            fig_line.update_layout(
-                title_x=0.2,  # Centers the title
-                title_y=0.95,  # Adjusts the title position vertically
-                title_font=dict(size=20, color="white"),  # Title font size and color
-                xaxis_title="Indikator",
-                yaxis_title="Rata-Rata Skor",
-                xaxis=dict(
-                    tickmode='array', 
-                    tickvals=avg_scores_df['Indikator'],  # Use the actual indicator names for ticks
-                    showgrid=True,
-                    gridcolor='#cecdcd',  # Light grid color for x-axis
-                ),
-                yaxis=dict(
-                    showgrid=True,
-                    gridcolor='#cecdcd',  # Light grid color for y-axis
-                ),
-                plot_bgcolor='rgba(0, 0, 0, 0)',  # Transparent plot background
-                paper_bgcolor='rgba(0, 0, 0, 0)',  # Transparent paper background
-                font=dict(color='#cecdcd'),  # Font color for the chart
-            )
-
-            # Display the line chart
-            st.plotly_chart(fig_line,use_container_width=True)
-
-    with col2:
-        with st.container(border=True):
-            # Donut chart with the correct names column
-            fig_donut = px.pie(
-                fulfillment_data1,
-                values='Persentase',
-                names='Kategori',  # This should be 'Kategori' as defined in the DataFrame
-                hole=0.4,
-                title="Distribusi Kategori Jawaban (Tanpa Netral)",
-                color_discrete_sequence=px.colors.sequential.Purpor
-            )
-
-            # Update layout for better visualization
-            fig_donut.update_layout(
-                title_x=0.2,
-                legend_title="Kategori",
-                legend_orientation="h",
-                legend_yanchor="bottom",
-                legend_y=-0.2,
-                legend_x=0.5,
-                legend_xanchor="center"
-            )
-
-            # Display the donut chart
-            st.plotly_chart(fig_donut, use_container_width=True)
+            with st.container(border=True):    # Line Chart for the average scores of each indicator
+
+                fig_key = figure_key("c5_dosen", "c5.dosen.indikator_line")
+                fig_line = get_figure(fig_key)
+                if fig_line is None:
+                    fig_line = px.line(
+                        avg_scores_df,
+                        x='Indikator',
+                        y='Rata-Rata Skor',
+                        labels={'Indikator': 'Indikator', 'Rata-Rata Skor': 'Rata-Rata Skor'},
+                        title="Perubahan Skor Rata-Rata untuk Setiap Indikator",
+                        markers=True,
+                        height=400,
+                    )
+
+                    # Update the line color to use the Purpor color scale
+                    fig_line.update_traces(
+                        line=dict(color='rgba(255, 99, 71, 1)'),  # Default line color if you want specific color
+                        marker=dict(color=avg_scores_df['Rata-Rata Skor'], colorscale='Purpor')  # Applying color scale to markers
+                    )
+
+                    # Update layout for line chart
+                    fig_line.update_layout(
+                        title_x=0.2,  # Centers the title
+                        title_y=0.95,  # Adjusts the title position vertically
+                        title_font=dict(size=20, color="white"),  # Title font size and color
+                        xaxis_title="Indikator",
+                        yaxis_title="Rata-Rata Skor",
+                        xaxis=dict(
+                            tickmode='array', 
+                            tickvals=avg_scores_df['Indikator'],  # Use the actual indicator names for ticks
+                            showgrid=True,
+                            gridcolor='#cecdcd',  # Light grid color for x-axis
+                        ),
+                        yaxis=dict(
+                            showgrid=True,
+                            gridcolor='#cecdcd',  # Light grid color for y-axis
+                        ),
+                        plot_bgcolor='rgba(0, 0, 0, 0)',  # Transparent plot background
+                        paper_bgcolor='rgba(0, 0, 0, 0)',  # Transparent paper background
+                        font=dict(color='#cecdcd'),  # Font color for the chart
+                    )
+                    fig_line = put_figure(fig_key, fig_line)
+
+                # Display the line chart
+                plotly_chart(fig_line,use_container_width=True)
+
+        with col2:
+            with st.container(border=True):
+                # Donut chart with the correct names column
+                fig_key = figure_key("c5_dosen", "c5.dosen.kategori_donut")
+                fig_donut = get_figure(fig_key)
+                if fig_donut is None:
+                    fig_donut = px.pie(
+                        fulfillment_data1,
+                        values='Persentase',
+                        names='Kategori',  # This should be 'Kategori' as defined in the DataFrame
+                        hole=0.4,
+                        title="Distribusi Kategori Jawaban (Tanpa Netral)",
+                        color_discrete_sequence=px.colors.sequential.Purpor
+                    )
+
+                    # Update layout for better visualization
+                    fig_donut.update_layout(
+                        title_x=0.2,
+                        legend_title="Kategori",
+                        legend_orientation="h",
+                        legend_yanchor="bottom",
+                        legend_y=-0.2,
+                        legend_x=0.5,
+                        legend_xanchor="center"
+                    )
+                    fig_donut = put_figure(fig_key, fig_donut)
+
+                # Display the donut chart
+                plotly_chart(fig_donut, use_container_width=True)
         
 
-        with st.container(border=True):
-            # Plot a bar chart for average scores
-            fig_bar = px.bar(
-                avg_scores_df,
-                x='Indikator',
-                y='Rata-Rata Skor',
-                labels={'Indikator': 'Indikator', 'Rata-Rata Skor': 'Rata-Rata Skor'},
-                title="Rata-Rata Skor untuk Setiap Indikator",
-                color='Rata-Rata Skor',
-                color_continuous_scale='Purpor',
-                height=400,
-                hover_data=["Rata-Rata Skor"]
-            )
-
-            fig_bar.update_layout(
-                title_x=0.2
-            )
-
-            st.plotly_chart(fig_bar,use_container_width=True)
-
-    # Display data editor with category column
-    st.container(border=True)
-    st.data_editor(
-        avg_scores_df,
-        column_config={
-            "Rata-Rata Skor": st.column_config.ProgressColumn(
-                "Rata-rata Skor",
-                help="Menampilkan nilai rata-rata jawaban",
-                min_value=0,
-                max_value=5,
-                format="%.2f",
-            ),
-            "Kategori": st.column_config.TextColumn(
-                "Kategori",
-                help="Kategori berdasarkan skor"
-            )
-        },
-        hide_index=True,
-        use_container_width=True
-    )
+            with st.container(border=True):
+                # Plot a bar chart for average scores
+                fig_key = figure_key("c5_dosen", "c5.dosen.indikator_bar")
+                fig_bar = get_figure(fig_key)
+                if fig_bar is None:
+                    fig_bar = px.bar(
+                        avg_scores_df,
+                        **error_bars(avg_scores_df),  # Pita interval kepercayaan
+                        x='Indikator',
+                        y='Rata-Rata Skor',
+                        labels={'Indikator': 'Indikator', 'Rata-Rata Skor': 'Rata-Rata Skor'},
+                        title="Rata-Rata Skor untuk Setiap Indikator",
+                        color='Rata-Rata Skor',
+                        color_continuous_scale='Purpor',
+                        height=400,
+                        hover_data=["Rata-Rata Skor"]
+                    )
+
+                    fig_bar.update_layout(
+                        title_x=0.2
+                    )
+                    fig_bar = put_figure(fig_key, fig_bar)
+
+                plotly_chart(fig_bar,use_container_width=True)
+
+        # Display data editor with category column
+        st.container(border=True)
+        st.data_editor(
+            avg_scores_df,
+            column_config={
+                "Rata-Rata Skor": st.column_config.ProgressColumn(
+                    "Rata-rata Skor",
+                    help="Menampilkan nilai rata-rata jawaban",
+                    min_value=0,
+                    max_value=5,
+                    format="%.2f",
+                ),
+                "Kategori": st.column_config.TextColumn(
+                    "Kategori",
+                    help="Kategori berdasarkan skor"
+                )
+            },
+            hide_index=True,
+            use_container_width=True
+        )
 
 
 # Tab 1: SARANA MAHASISWA
 with tab2:
-    # Load data
-    data1 = load_data("C5.saranamahasiswa-prep.csv")
+    if tab2.open:
+        # Load data
+        data1 = load_data("C5.saranamahasiswa-prep.csv")
+
+        # Calculate average scores for each question
+        with timed("aggregate", "avg_scores"):
+            avg_scores = data1.mean()
 
-    # Calculate average scores for each question
-    avg_scores = data1.mean()
+        # Prepare the indicator names (letters for X-axis)
+        questions = data1.columns.tolist()  # Assuming questions are column names
+        letters = [chr(i) for i in range(97, 97 + len(avg_scores))]  # ['a', 'b', 'c', ...]
 
-    # Prepare the indicator names (letters for X-axis)
-    questions = data1.columns.tolist()  # Assuming questions are column names
-    letters = [chr(i) for i in range(97, 97 + len(avg_scores))]  # ['a', 'b', 'c', ...]
+        # Create a DataFrame with letters as 'Indikator', average scores, and questions
+        avg_scores_df = pd.DataFrame({
+            'Indikator': letters,
+            'Pertanyaan': questions,
+            'Rata-Rata Skor': avg_scores.values
+        })
 
-    # Create a DataFrame with letters as 'Indikator', average scores, and questions
-    avg_scores_df = pd.DataFrame({
-        'Indikator': letters,
-        'Pertanyaan': questions,
-        'Rata-Rata Skor': avg_scores.values
-    })
+        # Terapkan fungsi kategori ke setiap nilai skor rata-rata
+        with timed("clean", "kategori"):
+            avg_scores_df['Kategori'] = avg_scores_df['Rata-Rata Skor'].apply(determine_category)
 
-    # Terapkan fungsi kategori ke setiap nilai skor rata-rata
-    avg_scores_df['Kategori'] = avg_scores_df['Rata-Rata Skor'].apply(determine_category)
+        # Interval kepercayaan 95% setiap pertanyaan (di-cache per versi data)
+        avg_scores_df = with_ci(avg_scores_df, load_mean_ci("c5_mhs"))
     
-        # Tambahkan opsi "All" di awal daftar pertanyaan
-    all_questions = ["All"] + questions
-
-    # Perbarui selectbox untuk menyertakan opsi "All"
-    selected_question_index = st.selectbox(
-        "🔎 Pilih Pertanyaan :",
-        range(len(all_questions)),
-        format_func=lambda x: all_questions[x]
-    )
-
-    # Jika "All" dipilih, hitung data gabungan, jika tidak, ambil pertanyaan spesifik
-    if selected_question_index == 0:  # "All" dipilih
-        selected_question_avg_score = avg_scores_df['Rata-Rata Skor'].mean()
-        fulfilled_percentage = (selected_question_avg_score / 5) * 100
-        not_fulfilled_percentage = 100 - fulfilled_percentage
-    else:
-        selected_question_avg_score = avg_scores_df['Rata-Rata Skor'].iloc[selected_question_index - 1]
-        fulfilled_percentage = (selected_question_avg_score / 5) * 100
-        not_fulfilled_percentage = 100 - fulfilled_percentage
-
-    # Persiapkan data untuk donut chart
-    fulfillment_data = pd.DataFrame({
-        'Status': ['Puas', 'Tidak Puas'],
-        'Persentase': [fulfilled_percentage, not_fulfilled_percentage]
-    })
-
-        # Filter data tanpa netral (skor == 3 dianggap netral)
-    non_neutral_data = data1[data1.apply(lambda row: ~row.isin([3]), axis=1)]
-
-    # Hitung jumlah kategori
-    categories_count = {
-        "Sangat Kurang": (non_neutral_data == 1).sum().sum(),
-        "Kurang": (non_neutral_data == 2).sum().sum(),
-        "Baik": (non_neutral_data == 4).sum().sum(),
-        "Sangat Baik": (non_neutral_data == 5).sum().sum(),
-    }
-
-    # Hitung total jawaban yang relevan
-    total_non_neutral = sum(categories_count.values())
-
-    # Hitung persentase untuk setiap kategori
-    fulfillment_data1 = pd.DataFrame({
-        'Kategori': categories_count.keys(),
-        'Jumlah': categories_count.values(),
-        'Persentase': [count / total_non_neutral * 100 for count in categories_count.values()]
-    })
-
-            # Create the fulfillment_data DataFrame
-    fulfillment_data = pd.DataFrame({
-        'Status': ['Puas', 'Tidak Puas'],  # Change 'Kategori' to 'Status'
-        'Persentase': [fulfilled_percentage, not_fulfilled_percentage]
-    })
-
-    col1, col2 = st.columns(2)
-
-    with col1:
+            # Tambahkan opsi "All" di awal daftar pertanyaan
+        all_questions = ["All"] + questions
+
+        # Perbarui selectbox untuk menyertakan opsi "All"
+        selected_question_index = st.selectbox(
+            "🔎 Pilih Pertanyaan :",
+            range(len(all_questions)),
+            format_func=lambda x: all_questions[x]
+        )
+
+        # Jika "All" dipilih, hitung data gabungan, jika tidak, ambil pertanyaan spesifik
+        if selected_question_index == 0:  # "All" dipilih
+            selected_question_avg_score = avg_scores_df['Rata-Rata Skor'].mean()
+            fulfilled_percentage = (selected_question_avg_score / 5) * 100
+            not_fulfilled_percentage = 100 - fulfilled_percentage
+        else:
+            selected_question_avg_score = avg_scores_df['Rata-Rata Skor'].iloc[selected_question_index - 1]
+            fulfilled_percentage = (selected_question_avg_score / 5) * 100
+            not_fulfilled_percentage = 100 - fulfilled_percentage
+
+        # Persiapkan data untuk donut chart
+        fulfillment_data = pd.DataFrame({
+            'Status': ['Puas', 'Tidak Puas'],
+            'Persentase': [fulfilled_percentage, not_fulfilled_percentage]
+        })
+
+        # Hitung distribusi kategori tanpa netral (skor == 3) dalam satu pass tervektorisasi
+        fulfillment_data1 = category_distribution(total_counts(data1))
+
+                # Create the fulfillment_data DataFrame
+        fulfillment_data = pd.DataFrame({
+            'Status': ['Puas', 'Tidak Puas'],  # Change 'Kategori' to 'Status'
+            'Persentase': [fulfilled_percentage, not_fulfilled_percentage]
+        })
+
+        col1, col2 = st.columns(2)
+
+        with col1:
         
-        with st.container(border=True): 
-            # Create the donut chart
-            fig_donut = px.pie(
-                fulfillment_data,
-                values='Persentase',
-                names='Status',
-                hole=0.4,
-                title=f"Persentase Puas dan Tidak Puas untuk Pertanyaan",
-                color_discrete_sequence=px.colors.sequential.Purpor
-            )
-            # Update layout to center the title and position the legend at the bottom
-            fig_donut.update_layout(
-                title_x=0.2,  # Centers the title
-                legend_title="Indikator",  # Title for the legend
-                legend_orientation="h",  # Horizontal legend
-                legend_yanchor="bottom",  # Aligns legend at the bottom
-                legend_y=-0.5,  # Moves the legend below the chart
-                legend_x=0.5,  # Centers the legend horizontally
-                legend_xanchor="center"  # Ensures that the legend is anchored in the center
-            )
-            # Display the donut chart
-            st.plotly_chart(fig_donut,use_container_width=True)
+            with st.container(border=True): 
+                # Create the donut chart
+                fig_key = figure_key("c5_mhs", "c5.mhs.puas_donut", (selected_question_index,))
+                fig_donut = get_figure(fig_key)
+                if fig_donut is None:
+                    fig_donut = px.pie(
+                        fulfillment_data,
+                        values='Persentase',
+                        names='Status',
+                        hole=0.4,
+                        title=f"Persentase Puas dan Tidak Puas untuk Pertanyaan",
+                        color_discrete_sequence=px.colors.sequential.Purpor
+                    )
+                    # Update layout to center the title and position the legend at the bottom
+                    fig_donut.update_layout(
+                        title_x=0.2,  # Centers the title
+                        legend_title="Indikator",  # Title for the legend
+                        legend_orientation="h",  # Horizontal legend
+                        legend_yanchor="bottom",  # Aligns legend at the bottom
+                        legend_y=-0.5,  # Moves the legend below the chart
+                        legend_x=0.5,  # Centers the legend horizontally
+                        legend_xanchor="center"  # Ensures that the legend is anchored in the center
+                    )
+                    fig_donut = put_figure(fig_key, fig_donut)
+                # Display the donut chart
+                plotly_chart(fig_donut,use_container_width=True)
+                first_paint()
 
  
         
-        with st.container(border=True):    # Line Chart for the average scores of each indicator
-
-            fig_line = px.line(
-                avg_scores_df,
-                x='Indikator',
-                y='Rata-Rata Skor',
-                labels={'Indikator': 'Indikator', 'Rata-Rata Skor': 'Rata-Rata Skor'},
-                title="Perubahan Skor Rata-Rata untuk Setiap Indikator",
-                markers=True,
-                height=400,
-            )
-
-            # Update the line color to use the Purpor color scale
-            fig_line.update_traces(
-                line=dict(color='rgba(255, 99, 71, 1)'),  # Default line color if you want specific color
-                marker=dict(color=avg_scores_df['Rata-Rata Skor'], colorscale='Purpor')  # Applying color scale to markers
-            )
-
-            # Update layout for line chart
-            fig_line.update_layout(
-                title_x=0.2,  # Centers the title
-                title_y=0.95,  # Adjusts the title position vertically
-                title_font=dict(size=20, color="white"),  # Title font size and color
-                xaxis_title="Indikator",
-                yaxis_title="Rata-Rata Skor",
-                xaxis=dict(
-                    tickmode='array', 
-                    tickvals=avg_scores_df['Indikator'],  # Use the actual indicator names for ticks
-                    showgrid=True,
-                    gridcolor='#cecdcd',  # Light grid color for x-axis
-                ),
-                yaxis=dict(
-                    showgrid=True,
-                    gridcolor='#cecdcd',  # Light grid color for y-axis
-                ),
-                plot_bgcolor='rgba(0, 0, 0, 0)',  # Transparent plot background
-                paper_bgcolor='rgba(0, 0, 0, 0)',  # Transparent paper background
-                font=dict(color='#cecdcd'),  # Font color for the chart
-            )
-
-            # Display the line chart
-            st.plotly_chart(fig_line,use_container_width=True)
-
-    with col2:
-        with st.container(border=True):
-            # Donut chart with the correct names column
-            fig_donut = px.pie(
-                fulfillment_data1,
-                values='Persentase',
-                names='Kategori',  # This should be 'Kategori' as defined in the DataFrame
-                hole=0.4,
-                title="Distribusi Kategori Jawaban (Tanpa Netral)",
-                color_discrete_sequence=px.colors.sequential.Purpor
-            )
-
-            # Update layout for better visualization
-            fig_donut.update_layout(
-                title_x=0.2,
-                legend_title="Kategori",
-                legend_orientation="h",
-                legend_yanchor="bottom",
-                legend_y=-0.2,
-                legend_x=0.5,
-                legend_xanchor="center"
-            )
-
-            # Display the donut chart
-            st.plotly_chart(fig_donut, use_container_width=True)
+            with st.container(border=True):    # Line Chart for the average scores of each indicator
+
+                fig_key = figure_key("c5_mhs", "c5.mhs.indikator_line")
+                fig_line = get_figure(fig_key)
+                if fig_line is None:
+                    fig_line = px.line(
+                        avg_scores_df,
+                        x='Indikator',
+                        y='Rata-Rata Skor',
+                        labels={'Indikator': 'Indikator', 'Rata-Rata Skor': 'Rata-Rata Skor'},
+                        title="Perubahan Skor Rata-Rata untuk Setiap Indikator",
+                        markers=True,
+                        height=400,
+                    )
+
+                    # Update the line color to use the Purpor color scale
+                    fig_line.update_traces(
+                        line=dict(color='rgba(255, 99, 71, 1)'),  # Default line color if you want specific color
+                        marker=dict(color=avg_scores_df['Rata-Rata Skor'], colorscale='Purpor')  # Applying color scale to markers
+                    )
+
+                    # Update layout for line chart
+                    fig_line.update_layout(
+                        title_x=0.2,  # Centers the title
+                        title_y=0.95,  # Adjusts the title position vertically
+                        title_font=dict(size=20, color="white"),  # Title font size and color
+                        xaxis_title="Indikator",
+                        yaxis_title="Rata-Rata Skor",
+                        xaxis=dict(
+                            tickmode='array', 
+                            tickvals=avg_scores_df['Indikator'],  # Use the actual indicator names for ticks
+                            showgrid=True,
+                            gridcolor='#cecdcd',  # Light grid color for x-axis
+                        ),
+                        yaxis=dict(
+                            showgrid=True,
+                            gridcolor='#cecdcd',  # Light grid color for y-axis
+                        ),
+                        plot_bgcolor='rgba(0, 0, 0, 0)',  # Transparent plot background
+                        paper_bgcolor='rgba(0, 0, 0, 0)',  # Transparent paper background
+                        font=dict(color='#cecdcd'),  # Font color for the chart
+                    )
+                    fig_line = put_figure(fig_key, fig_line)
+
+                # Display the line chart
+                plotly_chart(fig_line,use_container_width=True)
+
+        with col2:
+            with st.container(border=True):
+                # Donut chart with the correct names column
+                fig_key = figure_key("c5_mhs", "c5.mhs.kategori_donut")
+                fig_donut = get_figure(fig_key)
+                if fig_donut is None:
+                    fig_donut = px.pie(
+                        fulfillment_data1,
+                        values='Persentase',
+                        names='Kategori',  # This should be 'Kategori' as defined in the DataFrame
+                        hole=0.4,
+                        title="Distribusi Kategori Jawaban (Tanpa Netral)",
+                        color_discrete_sequence=px.colors.sequential.Purpor
+                    )
+
+                    # Update layout for better visualization
+                    fig_donut.update_layout(
+                        title_x=0.2,
+                        legend_title="Kategori",
+                        legend_orientation="h",
+                        legend_yanchor="bottom",
+                        legend_y=-0.2,
+                        legend_x=0.5,
+                        legend_xanchor="center"
+                    )
+                    fig_donut = put_figure(fig_key, fig_donut)
+
+                # Display the donut chart
+                plotly_chart(fig_donut, use_container_width=True)
         
 
-        with st.container(border=True):
-            # Plot a bar chart for average scores
-            fig_bar = px.bar(
-                avg_scores_df,
-                x='Indikator',
-                y='Rata-Rata Skor',
-                labels={'Indikator': 'Indikator', 'Rata-Rata Skor': 'Rata-Rata Skor'},
-                title="Rata-Rata Skor untuk Setiap Indikator",
-                color='Rata-Rata Skor',
-                color_continuous_scale='Purpor',
-                height=400,
-                hover_data=["Rata-Rata Skor"]
-            )
-
-            fig_bar.update_layout(
-                title_x=0.2
-            )
-
-            st.plotly_chart(fig_bar,use_container_width=True)
-
-    # Display data editor with category column
-    st.container(border=True)
-    st.data_editor(
-        avg_scores_df,
-        column_config={
-            "Rata-Rata Skor": st.column_config.ProgressColumn(
-                "Rata-rata Skor",
-                help="Menampilkan nilai rata-rata jawaban",
-                min_value=0,
-                max_value=5,
-                format="%.2f",
-            ),
-            "Kategori": st.column_config.TextColumn(
-                "Kategori",
-                help="Kategori berdasarkan skor"
-            )
-        },
-        hide_index=True,
-        use_container_width=True
-    )
-
-    # Tab 3: SARANA TENDIK
+            with st.container(border=True):
+                # Plot a bar chart for average scores
+                fig_key = figure_key("c5_mhs", "c5.mhs.indikator_bar")
+                fig_bar = get_figure(fig_key)
+                if fig_bar is None:
+                    fig_bar = px.bar(
+                        avg_scores_df,
+                        **error_bars(avg_scores_df),  # Pita interval kepercayaan
+                        x='Indikator',
+                        y='Rata-Rata Skor',
+                        labels={'Indikator': 'Indikator', 'Rata-Rata Skor': 'Rata-Rata Skor'},
+                        title="Rata-Rata Skor untuk Setiap Indikator",
+                        color='Rata-Rata Skor',
+                        color_continuous_scale='Purpor',
+                        height=400,
+                        hover_data=["Rata-Rata Skor"]
+                    )
+
+                    fig_bar.update_layout(
+                        title_x=0.2
+                    )
+                    fig_bar = put_figure(fig_key, fig_bar)
+
+                plotly_chart(fig_bar,use_container_width=True)
+
+        # Display data editor with category column
+        st.container(border=True)
+        st.data_editor(
+            avg_scores_df,
+            column_config={
+                "Rata-Rata Skor": st.column_config.ProgressColumn(
+                    "Rata-rata Skor",
+                    help="Menampilkan nilai rata-rata jawaban",
+                    min_value=0,
+                    max_value=5,
+                    format="%.2f",
+                ),
+                "Kategori": st.column_config.TextColumn(
+                    "Kategori",
+                    help="Kategori berdasarkan skor"
+                )
+            },
+            hide_index=True,
+            use_container_width=True
+        )
+
+        # Tab 3: SARANA TENDIK
 with tab3:
-    # Load data
-    data1 = load_data("C5.saranatendik-prep.csv")
-
-    # Calculate average scores for each question
-    avg_scores = data1.mean()
-
-    # Prepare the indicator names (letters for X-axis)
-    questions = data1.columns.tolist()  # Assuming questions are column names
-    letters = [chr(i) for i in range(97, 97 + len(avg_scores))]  # ['a', 'b', 'c', ...]
-
-    # Create a DataFrame with letters as 'Indikator', average scores, and questions
-    avg_scores_df = pd.DataFrame({
-        'Indikator': letters,
-        'Pertanyaan': questions,
-        'Rata-Rata Skor': avg_scores.values
-    })
-
-    # Terapkan fungsi kategori ke setiap nilai skor rata-rata
-    avg_scores_df['Kategori'] = avg_scores_df['Rata-Rata Skor'].apply(determine_category)
-
-        # Tambahkan opsi "All" di awal daftar pertanyaan
-    all_questions = ["All"] + questions
-
-    # Perbarui selectbox untuk menyertakan opsi "All"
-    selected_question_index = st.selectbox(
-        "🔎 Pilih Pertanyaan :",
-        range(len(all_questions)),
-        format_func=lambda x: all_questions[x]
-    )
-
-    # Jika "All" dipilih, hitung data gabungan, jika tidak, ambil pertanyaan spesifik
-    if selected_question_index == 0:  # "All" dipilih
-        selected_question_avg_score = avg_scores_df['Rata-Rata Skor'].mean()
-        fulfilled_percentage = (selected_question_avg_score / 5) * 100
-        not_fulfilled_percentage = 100 - fulfilled_percentage
-    else:
-        selected_question_avg_score = avg_scores_df['Rata-Rata Skor'].iloc[selected_question_index - 1]
-        fulfilled_percentage = (selected_question_avg_score / 5) * 100
-        not_fulfilled_percentage = 100 - fulfilled_percentage
-
-    # Persiapkan data untuk donut chart
-    fulfillment_data = pd.DataFrame({
-        'Status': ['Puas', 'Tidak Puas'],
-        'Persentase': [fulfilled_percentage, not_fulfilled_percentage]
-    })
-
-        # Filter data tanpa netral (skor == 3 dianggap netral)
-    non_neutral_data = data1[data1.apply(lambda row: ~row.isin([3]), axis=1)]
-
-    # Hitung jumlah kategori
-    categories_count = {
-        "Sangat Kurang": (non_neutral_data == 1).sum().sum(),
-        "Kurang": (non_neutral_data == 2).sum().sum(),
-        "Baik": (non_neutral_data == 4).sum().sum(),
-        "Sangat Baik": (non_neutral_data == 5).sum().sum(),
-    }
-
-    # Hitung total jawaban yang relevan
-    total_non_neutral = sum(categories_count.values())
-
-    # Hitung persentase untuk setiap kategori
-    fulfillment_data1 = pd.DataFrame({
-        'Kategori': categories_count.keys(),
-        'Jumlah': categories_count.values(),
-        'Persentase': [count / total_non_neutral * 100 for count in categories_count.values()]
-    })
-
-            # Create the fulfillment_data DataFrame
-    fulfillment_data = pd.DataFrame({
-        'Status': ['Puas', 'Tidak Puas'],  # Change 'Kategori' to 'Status'
-        'Persentase': [fulfilled_percentage, not_fulfilled_percentage]
-    })
-
-    col1, col2 = st.columns(2)
-
-    with col1:
+    if tab3.open:
+        # Load data
+        data1 = load_data("C5.saranatendik-prep.csv")
+
+        # Calculate average scores for each question
+        with timed("aggregate", "avg_scores"):
+            avg_scores = data1.mean()
+
+        # Prepare the indicator names (letters for X-axis)
+        questions = data1.columns.tolist()  # Assuming questions are column names
+        letters = [chr(i) for i in range(97, 97 + len(avg_scores))]  # ['a', 'b', 'c', ...]
+
+        # Create a DataFrame with letters as 'Indikator', average scores, and questions
+        avg_scores_df = pd.DataFrame({
+            'Indikator': letters,
+            'Pertanyaan': questions,
+            'Rata-Rata Skor': avg_scores.values
+        })
+
+        # Terapkan fungsi kategori ke setiap nilai skor rata-rata
+        with timed("clean", "kategori"):
+            avg_scores_df['Kategori'] = avg_scores_df['Rata-Rata Skor'].apply(determine_category)
+
+        # Interval kepercayaan 95% setiap pertanyaan (di-cache per versi data)
+        avg_scores_df = with_ci(avg_scores_df, load_mean_ci("c5_tendik"))
+
+            # Tambahkan opsi "All" di awal daftar pertanyaan
+        all_questions = ["All"] + questions
+
+        # Perbarui selectbox untuk menyertakan opsi "All"
+        selected_question_index = st.selectbox(
+            "🔎 Pilih Pertanyaan :",
+            range(len(all_questions)),
+            format_func=lambda x: all_questions[x]
+        )
+
+        # Jika "All" dipilih, hitung data gabungan, jika tidak, ambil pertanyaan spesifik
+        if selected_question_index == 0:  # "All" dipilih
+            selected_question_avg_score = avg_scores_df['Rata-Rata Skor'].mean()
+            fulfilled_percentage = (selected_question_avg_score / 5) * 100
+            not_fulfilled_percentage = 100 - fulfilled_percentage
+        else:
+            selected_question_avg_score = avg_scores_df['Rata-Rata Skor'].iloc[selected_question_index - 1]
+            fulfilled_percentage = (selected_question_avg_score / 5) * 100
+            not_fulfilled_percentage = 100 - fulfilled_percentage
+
+        # Persiapkan data untuk donut chart
+        fulfillment_data = pd.DataFrame({
+            'Status': ['Puas', 'Tidak Puas'],
+            'Persentase': [fulfilled_percentage, not_fulfilled_percentage]
+        })
+
+        # Hitung distribusi kategori tanpa netral (skor == 3) dalam satu pass tervektorisasi
+        fulfillment_data1 = category_distribution(total_counts(data1))
+
+                # Create the fulfillment_data DataFrame
+        fulfillment_data = pd.DataFrame({
+            'Status': ['Puas', 'Tidak Puas'],  # Change 'Kategori' to 'Status'
+            'Persentase': [fulfilled_percentage, not_fulfilled_percentage]
+        })
+
+        col1, col2 = st.columns(2)
+
+        with col1:
         
-        with st.container(border=True): 
-            # Create the donut chart
-            fig_donut = px.pie(
-                fulfillment_data,
-                values='Persentase',
-                names='Status',
-                hole=0.4,
-                title=f"Persentase Puas dan Tidak Puas untuk Pertanyaan",
-                color_discrete_sequence=px.colors.sequential.Purpor
-            )
-            # Update layout to center the title and position the legend at the bottom
-            fig_donut.update_layout(
-                title_x=0.2,  # Centers the title
-                legend_title="Indikator",  # Title for the legend
-                legend_orientation="h",  # Horizontal legend
-                legend_yanchor="bottom",  # Aligns legend at the bottom
-                legend_y=-0.5,  # Moves the legend below the chart
-                legend_x=0.5,  # Centers the legend horizontally
-                legend_xanchor="center"  # Ensures that the legend is anchored in the center
-            )
-            # Display the donut chart
-            st.plotly_chart(fig_donut,use_container_width=True)
+            with st.container(border=True): 
+                # Create the donut chart
+                fig_key = figure_key("c5_tendik", "c5.tendik.puas_donut", (selected_question_index,))
+                fig_donut = get_figure(fig_key)
+                if fig_donut is None:
+                    fig_donut = px.pie(
+                        fulfillment_data,
+                        values='Persentase',
+                        names='Status',
+                        hole=0.4,
+                        title=f"Persentase Puas dan Tidak Puas untuk Pertanyaan",
+                        color_discrete_sequence=px.colors.sequential.Purpor
+                    )
+                    # Update layout to center the title and position the legend at the bottom
+                    fig_donut.update_layout(
+                        title_x=0.2,  # Centers the title
+                        legend_title="Indikator",  # Title for the legend
+                        legend_orientation="h",  # Horizontal legend
+                        legend_yanchor="bottom",  # Aligns legend at the bottom
+                        legend_y=-0.5,  # Moves the legend below the chart
+                        legend_x=0.5,  # Centers the legend horizontally
+                        legend_xanchor="center"  # Ensures that the legend is anchored in the center
+                    )
+                    fig_donut = put_figure(fig_key, fig_donut)
+                # Display the donut chart
+                plotly_chart(fig_donut,use_container_width=True)
+                first_paint()
 
  
         
-        with st.container(border=True):    # Line Chart for the average scores of each indicator
-
-            fig_line = px.line(
-                avg_scores_df,
-                x='Indikator',
-                y='Rata-Rata Skor',
-                labels={'Indikator': 'Indikator', 'Rata-Rata Skor': 'Rata-Rata Skor'},
-                title="Perubahan Skor Rata-Rata untuk Setiap Indikator",
-                markers=True,
-                height=400,
-            )
-
-            # Update the line color to use the Purpor color scale
-            fig_line.update_traces(
-                line=dict(color='rgba(255, 99, 71, 1)'),  # Default line color if you want specific color
-                marker=dict(color=avg_scores_df['Rata-Rata Skor'], colorscale='Purpor')  # Applying color scale to markers
-            )
-
-            # Update layout for line chart
-            fig_line.update_layout(
-                title_x=0.2,  # Centers the title
-                title_y=0.95,  # Adjusts the title position vertically
-                title_font=dict(size=20, color="white"),  # Title font size and color
-                xaxis_title="Indikator",
-                yaxis_title="Rata-Rata Skor",
-                xaxis=dict(
-                    tickmode='array', 
-                    tickvals=avg_scores_df['Indikator'],  # Use the actual indicator names for ticks
-                    showgrid=True,
-                    gridcolor='#cecdcd',  # Light grid color for x-axis
-                ),
-                yaxis=dict(
-                    showgrid=True,
-                    gridcolor='#cecdcd',  # Light grid color for y-axis
-                ),
-                plot_bgcolor='rgba(0, 0, 0, 0)',  # Transparent plot background
-                paper_bgcolor='rgba(0, 0, 0, 0)',  # Transparent paper background
-                font=dict(color='#cecdcd'),  # Font color for the chart
-            )
-
-            # Display the line chart
-            st.plotly_chart(fig_line,use_container_width=True)
-
-    with col2:
-        with st.container(border=True):
-            # Donut chart with the correct names column
-            fig_donut = px.pie(
-                fulfillment_data1,
-                values='Persentase',
-                names='Kategori',  # This should be 'Kategori' as defined in the DataFrame
-                hole=0.4,
-                title="Distribusi Kategori Jawaban (Tanpa Netral)",
-                color_discrete_sequence=px.colors.sequential.Purpor
-            )
-
-            # Update layout for better visualization
-            fig_donut.update_layout(
-                title_x=0.2,
-                legend_title="Kategori",
-                legend_orientation="h",
-                legend_yanchor="bottom",
-                legend_y=-0.2,
-                legend_x=0.5,
-                legend_xanchor="center"
-            )
-
-            # Display the donut chart
-            st.plotly_chart(fig_donut, use_container_width=True)
+            with st.container(border=True):    # Line Chart for the average scores of each indicator
+
+                fig_key = figure_key("c5_tendik", "c5.tendik.indikator_line")
+                fig_line = get_figure(fig_key)
+                if fig_line is None:
+                    fig_line = px.line(
+                        avg_scores_df,
+                        x='Indikator',
+                        y='Rata-Rata Skor',
+                        labels={'Indikator': 'Indikator', 'Rata-Rata Skor': 'Rata-Rata Skor'},
+                        title="Perubahan Skor Rata-Rata untuk Setiap Indikator",
+                        markers=True,
+                        height=400,
+                    )
+
+                    # Update the line color to use the Purpor color scale
+                    fig_line.update_traces(
+                        line=dict(color='rgba(255, 99, 71, 1)'),  # Default line color if you want specific color
+                        marker=dict(color=avg_scores_df['Rata-Rata Skor'], colorscale='Purpor')  # Applying color scale to markers
+                    )
+
+                    # Update layout for line chart
+                    fig_line.update_layout(
+                        title_x=0.2,  # Centers the title
+                        title_y=0.95,  # Adjusts the title position vertically
+                        title_font=dict(size=20, color="white"),  # Title font size and color
+                        xaxis_title="Indikator",
+                        yaxis_title="Rata-Rata Skor",
+                        xaxis=dict(
+                            tickmode='array', 
+                            tickvals=avg_scores_df['Indikator'],  # Use the actual indicator names for ticks
+                            showgrid=True,
+                            gridcolor='#cecdcd',  # Light grid color for x-axis
+                        ),
+                        yaxis=dict(
+                            showgrid=True,
+                            gridcolor='#cecdcd',  # Light grid color for y-axis
+                        ),
+                        plot_bgcolor='rgba(0, 0, 0, 0)',  # Transparent plot background
+                        paper_bgcolor='rgba(0, 0, 0, 0)',  # Transparent paper background
+                        font=dict(color='#cecdcd'),  # Font color for the chart
+                    )
+                    fig_line = put_figure(fig_key, fig_line)
+
+                # Display the line chart
+                plotly_chart(fig_line,use_container_width=True)
+
+        with col2:
+            with st.container(border=True):
+                # Donut chart with the correct names column
+                fig_key = figure_key("c5_tendik", "c5.tendik.kategori_donut")
+                fig_donut = get_figure(fig_key)
+                if fig_donut is None:
+                    fig_donut = px.pie(
+                        fulfillment_data1,
+                        values='Persentase',
+                        names='Kategori',  # This should be 'Kategori' as defined in the DataFrame
+                        hole=0.4,
+                        title="Distribusi Kategori Jawaban (Tanpa Netral)",
+                        color_discrete_sequence=px.colors.sequential.Purpor
+                    )
+
+                    # Update layout for better visualization
+                    fig_donut.update_layout(
+                        title_x=0.2,
+                        legend_title="Kategori",
+                        legend_orientation="h",
+                        legend_yanchor="bottom",
+                        legend_y=-0.2,
+                        legend_x=0.5,
+                        legend_xanchor="center"
+                    )
+                    fig_donut = put_figure(fig_key, fig_donut)
+
+                # Display the donut chart
+                plotly_chart(fig_donut, use_container_width=True)
         
 
-        with st.container(border=True):
-            # Plot a bar chart for average scores
-            fig_bar = px.bar(
-                avg_scores_df,
-                x='Indikator',
-                y='Rata-Rata Skor',
-                labels={'Indikator': 'Indikator', 'Rata-Rata Skor': 'Rata-Rata Skor'},
-                title="Rata-Rata Skor untuk Setiap Indikator",
-                color='Rata-Rata Skor',
-                color_continuous_scale='Purpor',
-                height=400,
-                hover_data=["Rata-Rata Skor"]
-            )
-
-            fig_bar.update_layout(
-                title_x=0.2
-            )
-
-            st.plotly_chart(fig_bar,use_container_width=True)
-
-    # Display data editor with category column
-    st.container(border=True)
-    st.data_editor(
-        avg_scores_df,
-        column_config={
-            "Rata-Rata Skor": st.column_config.ProgressColumn(
-                "Rata-rata Skor",
-                help="Menampilkan nilai rata-rata jawaban",
-                min_value=0,
-                max_value=5,
-                format="%.2f",
-            ),
-            "Kategori": st.column_config.TextColumn(
-                "Kategori",
-                help="Kategori berdasarkan skor"
-            )
-        },
-        hide_index=True,
-        use_container_width=True
-    )
+            with st.container(border=True):
+                # Plot a bar chart for average scores
+                fig_key = figure_key("c5_tendik", "c5.tendik.indikator_bar")
+                fig_bar = get_figure(fig_key)
+                if fig_bar is None:
+                    fig_bar = px.bar(
+                        avg_scores_df,
+                        **error_bars(avg_scores_df),  # Pita interval kepercayaan
+                        x='Indikator',
+                        y='Rata-Rata Skor',
+                        labels={'Indikator': 'Indikator', 'Rata-Rata Skor': 'Rata-Rata Skor'},
+                        title="Rata-Rata Skor untuk Setiap Indikator",
+                        color='Rata-Rata Skor',
+                        color_continuous_scale='Purpor',
+                        height=400,
+                        hover_data=["Rata-Rata Skor"]
+                    )
+
+                    fig_bar.update_layout(
+                        title_x=0.2
+                    )
+                    fig_bar = put_figure(fig_key, fig_bar)
+
+                plotly_chart(fig_bar,use_container_width=True)
+
+        # Display data editor with category column
+        st.container(border=True)
+        st.data_editor(
+            avg_scores_df,
+            column_config={
+                "Rata-Rata Skor": st.column_config.ProgressColumn(
+                    "Rata-rata Skor",
+                    help="Menampilkan nilai rata-rata jawaban",
+                    min_value=0,
+                    max_value=5,
+                    format="%.2f",
+                ),
+                "Kategori": st.column_config.TextColumn(
+                    "Kategori",
+                    help="Kategori berdasarkan skor"
+                )
+            },
+            hide_index=True,
+            use_container_width=True
+        )
+
+# Panel waktu per tahap (hanya tampil dengan ?debug=timing)
+timing_panel()
@@ -1,6 +1,8 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
+
+from dashboard.startup import first_paint, lazy_import, page_started
+
+page_started("c8")
 
 # Set page configuration
 st.set_page_config(
@@ -14,12 +16,18 @@ st.markdown("""
     <h2 style="text-align: center;">Survey Kepuasan Dosen (Pengabdian)</h2>
 """, unsafe_allow_html=True)
 
-st.divider()
-# Fungsi untuk memuat data dengan caching
-@st.cache_data
-def load_data(file_path):
-    return pd.read_csv(file_path)
+# Modul berat (pandas, plotly, data survei) baru diimpor setelah judul tampil
+import pandas as pd
 
+from dashboard.data import load_data
+from dashboard.figures import figure_key, get_figure, put_figure
+from dashboard.likert import category_distribution, total_counts
+from dashboard.stats import error_bars, load_mean_ci, with_ci
+from dashboard.timing import plotly_chart, timed, timing_panel
+
+px = lazy_import("plotly.express")
+
+st.divider()
 # Fungsi untuk membersihkan data
 def clean_data(data, start_col=1):
     for col in data.columns[start_col:]:
@@ -44,7 +52,8 @@ def determine_category(score):
 data1 = load_data("pengabdian-prep.csv")
 
 # Calculate average scores for each question
-avg_scores = data1.mean()
+with timed("aggregate", "avg_scores"):
+    avg_scores = data1.mean()
 
 # Prepare the indicator names (letters for X-axis)
 questions = data1.columns.tolist()  # Assuming questions are column names
@@ -60,7 +69,11 @@ avg_scores_df = pd.DataFrame({
 })
 
 # Terapkan fungsi kategori ke setiap nilai skor rata-rata
-avg_scores_df['Kategori'] = avg_scores_df['Rata-Rata Skor'].apply(determine_category)
+with timed("clean", "kategori"):
+    avg_scores_df['Kategori'] = avg_scores_df['Rata-Rata Skor'].apply(determine_category)
+
+# Interval kepercayaan 95% setiap pertanyaan (di-cache per versi data)
+avg_scores_df = with_ci(avg_scores_df, load_mean_ci("c8"))
 
 
 # Tambahkan opsi "All" di awal daftar pertanyaan
@@ -96,93 +109,89 @@ col1, col2, col3 = st.columns(3)
 with col1:
     with st.container(border=True):
         # Create the donut chart
-        fig_donut = px.pie(
-            fulfillment_data,
-            values='Persentase',
-            names='Status',
-            hole=0.4,
-            title=f"Persentase Puas dan Tidak Puas untuk Pertanyaan",
-            color_discrete_sequence=px.colors.sequential.Purpor
-        )
-        # Update layout to center the title and position the legend at the bottom
-        fig_donut.update_layout(
-            title_x=0.2,  # Centers the title
-            legend_title="Indikator",  # Title for the legend
-            legend_orientation="h",  # Horizontal legend
-            legend_yanchor="middle",  # Aligns legend at the bottom
-        )
+        fig_key = figure_key("c8", "c8.puas_donut", (selected_question_index,))
+        fig_donut = get_figure(fig_key)
+        if fig_donut is None:
+            fig_donut = px.pie(
+                fulfillment_data,
+                values='Persentase',
+                names='Status',
+                hole=0.4,
+                title=f"Persentase Puas dan Tidak Puas untuk Pertanyaan",
+                color_discrete_sequence=px.colors.sequential.Purpor
+            )
+            # Update layout to center the title and position the legend at the bottom
+            fig_donut.update_layout(
+                title_x=0.2,  # Centers the title
+                legend_title="Indikator",  # Title for the legend
+                legend_orientation="h",  # Horizontal legend
+                legend_yanchor="middle",  # Aligns legend at the bottom
+            )
+            fig_donut = put_figure(fig_key, fig_donut)
         # Display the donut chart
-        st.plotly_chart(fig_donut, use_container_width=True)
+        plotly_chart(fig_donut, use_container_width=True)
+        first_paint()
     
 
 with col2:
     with st.container(border=True):
         # Plot a bar chart for average scores
-        fig_bar = px.bar(
-            avg_scores_df,
-            x='Indikator',
-            y='Rata-Rata Skor',
-            labels={'Indikator': 'Indikator', 'Rata-Rata Skor': 'Rata-Rata Skor'},
-            title="Rata-Rata Skor untuk Setiap Indikator",
-            color='Rata-Rata Skor',
-            color_continuous_scale='Purpor',
-            height=450,
-            hover_data=["Rata-Rata Skor"]  # Include only non-conflicting fields
-        )
-        # Update layout untuk menyesuaikan tampilan
-        fig_bar.update_layout(
-            title_x=0.2,  # Centers the title
+        fig_key = figure_key("c8", "c8.indikator_bar")
+        fig_bar = get_figure(fig_key)
+        if fig_bar is None:
+            fig_bar = px.bar(
+                avg_scores_df,
+                **error_bars(avg_scores_df),  # Pita interval kepercayaan
+                x='Indikator',
+                y='Rata-Rata Skor',
+                labels={'Indikator': 'Indikator', 'Rata-Rata Skor': 'Rata-Rata Skor'},
+                title="Rata-Rata Skor untuk Setiap Indikator",
+                color='Rata-Rata Skor',
+                color_continuous_scale='Purpor',
+                height=450,
+                hover_data=["Rata-Rata Skor"]  # Include only non-conflicting fields
             )
+            # Update layout untuk menyesuaikan tampilan
+            fig_bar.update_layout(
+                title_x=0.2,  # Centers the title
+                )
+            fig_bar = put_figure(fig_key, fig_bar)
 
         # Display the bar chart
-        st.plotly_chart(fig_bar, use_container_width=True)
+        plotly_chart(fig_bar, use_container_width=True)
 
 with col3:
     with st.container(border=True):
-        # Filter data tanpa netral (skor == 3 dianggap netral)
-        non_neutral_data = data1[data1.apply(lambda row: ~row.isin([3]), axis=1)]
-
-        # Hitung jumlah kategori
-        categories_count = {
-            "Sangat Kurang": (non_neutral_data == 1).sum().sum(),
-            "Kurang": (non_neutral_data == 2).sum().sum(),
-            "Baik": (non_neutral_data == 4).sum().sum(),
-            "Sangat Baik": (non_neutral_data == 5).sum().sum(),
-        }
-
-        # Hitung total jawaban yang relevan
-        total_non_neutral = sum(categories_count.values())
-
-        # Hitung persentase untuk setiap kategori
-        fulfillment_data = pd.DataFrame({
-            'Kategori': categories_count.keys(),
-            'Jumlah': categories_count.values(),
-            'Persentase': [count / total_non_neutral * 100 for count in categories_count.values()]
-        })
+        # Hitung distribusi kategori tanpa netral (skor == 3) dalam satu pass tervektorisasi
+        fulfillment_data = category_distribution(total_counts(data1))
 
         # Buat diagram pie dengan persentase
-        fig_donut = px.pie(
-            fulfillment_data,
-            values='Persentase',
-            names='Kategori',
-            hole=0.4,
-            title="Distribusi Kategori Jawaban",
-            color_discrete_sequence=px.colors.sequential.Purpor
-        )
+        fig_key = figure_key("c8", "c8.kategori_donut")
+        fig_donut = get_figure(fig_key)
+        if fig_donut is None:
+            fig_donut = px.pie(
+                fulfillment_data,
+                values='Persentase',
+                names='Kategori',
+                hole=0.4,
+                title="Distribusi Kategori Jawaban",
+                color_discrete_sequence=px.colors.sequential.Purpor
+            )
 
-        # Update layout untuk menyesuaikan tampilan
-        fig_donut.update_layout(
-            title_x=0.3,  # Centers the title
-            legend_title="Kategori",  # Title for the legend
-            legend_orientation="h",  # Horizontal legend
-            legend_yanchor="bottom",  # Aligns legend at the bottom
-            legend_y=-0.2,  # Moves the legend below the chart
-            legend_x=0.5,  # Centers the legend horizontally
-            legend_xanchor="center"  # Ensures that the legend is anchored in the center
-        )
+            # Update layout untuk menyesuaikan tampilan
+            fig_donut.update_layout(
+                title_x=0.3,  # Centers the title
+                legend_title="Kategori",  # Title for the legend
+                legend_orientation="h",  # Horizontal legend
+                legend_yanchor="bottom",  # Aligns legend at the bottom
+                legend_y=-0.2,  # Moves the legend below the chart
+                legend_x=0.5,  # Centers the legend horizontally
+                legend_xanchor="center"  # Ensures that the legend is anchored in the center
+            )
+            fig_donut = put_figure(fig_key, fig_donut)
 
         # Tampilkan diagram pie
-        st.plotly_chart(fig_donut, use_container_width=True)
+        plotly_chart(fig_donut, use_container_width=True)
 
 
 # Tampilkan data editor dengan kolom kategori
@@ -205,3 +214,5 @@ st.data_editor(
     use_container_width=True  # Menggunakan lebar penuh tabel
 )
 
+# Panel waktu per tahap (hanya tampil dengan ?debug=timing)
+timing_panel()
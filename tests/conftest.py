@@ -0,0 +1,25 @@
+"""Lingkungan pengujian: salinan CSV survei dan folder cache sementara.
+
+``dashboard.paths`` membaca ``DASHBOARD_DATA_DIR`` dan ``DASHBOARD_CACHE_DIR``
+saat diimpor, jadi keduanya diarahkan ke folder sementara sebelum modul
+dashboard mana pun dimuat. Pengujian tidak menulis ke CSV atau ``.cache``
+repositori.
+"""
+import atexit
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+_root = Path(tempfile.mkdtemp(prefix="dashboard-tests-"))
+atexit.register(shutil.rmtree, _root, ignore_errors=True)
+DATA_DIR = _root / "data"
+DATA_DIR.mkdir()
+for _path in REPO_DIR.glob("*.csv"):
+    shutil.copy2(_path, DATA_DIR / _path.name)
+
+os.environ["DASHBOARD_DATA_DIR"] = str(DATA_DIR)
+os.environ["DASHBOARD_CACHE_DIR"] = str(_root / "cache")
+os.environ.pop("DASHBOARD_TIMING_TRACE", None)
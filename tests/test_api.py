@@ -0,0 +1,59 @@
+import http.client
+import json
+import threading
+
+import pytest
+
+from dashboard import api
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = api.make_server(port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def get(server, path, headers=None):
+    connection = http.client.HTTPConnection("127.0.0.1", server.server_port, timeout=30)
+    try:
+        connection.request("GET", path, headers=headers or {})
+        response = connection.getresponse()
+        return response.status, dict(response.getheaders()), response.read()
+    finally:
+        connection.close()
+
+
+def test_kpis_returns_json_with_etag(server):
+    status, headers, body = get(server, "/kpis")
+    assert status == 200
+    assert headers["ETag"] == api.current_etag()
+    payload = json.loads(body)
+    assert sorted(payload["summary"]) == api.CRITERIA
+    assert payload["summary"]["c5"]["cakupan"] == "Dosen"
+
+
+def test_matching_if_none_match_returns_304_without_loading(server):
+    etag = api.current_etag()
+    api._bodies.clear()
+    for header in (etag, f'W/{etag}', f'"lain", {etag}', "*"):
+        status, headers, body = get(server, "/kpis", {"If-None-Match": header})
+        assert status == 304
+        assert headers["ETag"] == etag
+        assert body == b""
+    assert api._bodies == {}
+
+
+def test_stale_etag_returns_body(server):
+    status, _, body = get(server, "/kpis/c6", {"If-None-Match": '"basi"'})
+    assert status == 200
+    assert json.loads(body)["summary"]["cakupan"] == "Tendik"
+
+
+def test_unknown_path_is_404(server):
+    status, _, body = get(server, "/kpis/c9")
+    assert status == 404
+    assert "error" in json.loads(body)
@@ -0,0 +1,50 @@
+import pytest
+
+from dashboard import ingest
+from dashboard.data import DATASETS, resolve_path
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.setattr(ingest, "resolve_path", lambda file_path: tmp_path / file_path)
+    monkeypatch.setattr(ingest, "STATE_PATH", tmp_path / "ingest_state.json")
+    return tmp_path
+
+
+def run(name, **kwargs):
+    entry = ingest.ingest_all([name], **kwargs)[name]
+    return entry, ingest.resolve_path(DATASETS[name]).read_bytes()
+
+
+@pytest.mark.parametrize("name", sorted(ingest.RAW_SOURCES))
+def test_incremental_append_equals_full(workdir, name):
+    raw = resolve_path(ingest.RAW_SOURCES[name]).read_bytes()
+    cut = ingest._record_end(raw[:len(raw) // 2])
+    raw_path = workdir / ingest.RAW_SOURCES[name]
+
+    raw_path.write_bytes(raw[:cut])
+    first, _ = run(name)
+    with open(raw_path, "ab") as f:
+        f.write(raw[cut:])
+    incremental, incremental_prep = run(name)
+    full, full_prep = run(name, full=True)
+
+    assert first["rows"] > 0
+    assert incremental["new_rows"] == full["rows"] - first["rows"] > 0
+    assert incremental_prep == full_prep
+    assert incremental["aggregates"] == full["aggregates"]
+    assert ingest.load_aggregates(name) == full["aggregates"]
+
+
+def test_incomplete_record_waits_for_next_refresh():
+    chunk = b'a,b\n1,"baris\n2"\n3,"belum'
+    assert ingest._record_end(chunk) == len(b'a,b\n1,"baris\n2"\n')
+
+
+def test_aggregates_dropped_when_prep_changes(workdir):
+    name = "c1_tif"
+    (workdir / ingest.RAW_SOURCES[name]).write_bytes(resolve_path(ingest.RAW_SOURCES[name]).read_bytes())
+    run(name)
+    with open(ingest.resolve_path(DATASETS[name]), "a", encoding="utf-8") as f:
+        f.write("Dosen,5,5,5,5,5\n")
+    assert ingest.load_aggregates(name) is None
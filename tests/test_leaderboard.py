@@ -0,0 +1,48 @@
+from dashboard.leaderboard import load_tables, top_k
+
+
+def test_ties_at_boundary_are_included_with_competition_ranks():
+    candidates = [
+        ("1", "Andi", 4.501, 20),
+        ("2", "Budi", 4.8, 30),
+        ("3", "Citra", 4.499, 15),
+        ("4", "Dewi", 4.2, 40),
+        ("5", "Eka", 4.8, 12),
+    ]
+    assert top_k(candidates, 3) == [
+        (1, "2", "Budi", 4.8, 30),
+        (1, "5", "Eka", 4.8, 12),
+        (3, "1", "Andi", 4.5, 20),
+        (3, "3", "Citra", 4.5, 15),
+    ]
+
+
+def test_bottom_ranking_and_minimum_respondents():
+    candidates = [
+        ("1", "Andi", 3.1, 20),
+        ("2", "Budi", 2.0, 5),
+        ("3", "Citra", 3.1, 15),
+        ("4", "Dewi", 4.2, 40),
+    ]
+    assert top_k(candidates, 1, largest=False) == [
+        (1, "1", "Andi", 3.1, 20),
+        (1, "3", "Citra", 3.1, 15),
+    ]
+    assert top_k(candidates, 1, largest=False, min_responden=1) == [(1, "2", "Budi", 2.0, 5)]
+
+
+def test_equal_names_are_ordered_by_key():
+    candidates = [("9", "Sama", 4.0, 10), ("3", "Sama", 4.0, 10)]
+    assert [row[1] for row in top_k(candidates, 2)] == ["3", "9"]
+
+
+def test_empty_results():
+    assert top_k([("1", "Andi", 4.0, 10)], 0) == []
+    assert top_k([("1", "Andi", 4.0, 3)], 5) == []
+
+
+def test_stored_rankings_are_ordered():
+    rankings, _ = load_tables()
+    columns = ['tahun_akademik', 'jenis', 'kompetensi', 'arah', 'peringkat', 'nama', 'kunci']
+    assert len(rankings)
+    assert rankings[columns].equals(rankings.sort_values(columns)[columns].reset_index(drop=True))
@@ -0,0 +1,34 @@
+import pandas as pd
+import pytest
+
+from dashboard.data import DATASETS, MULTI_HEADER_DATASETS, load_dataset, resolve_path
+from dashboard.likert import SATISFACTION, satisfaction_distribution, total_counts
+
+
+def baseline_counts(data):
+    # Aturan hitung process_c* Home lama: buang skor 3 lalu (df == k).sum().sum()
+    non_neutral = data[data.apply(lambda row: ~row.isin([3]), axis=1)]
+    return {score: int((non_neutral == score).sum().sum()) for score in (1, 2, 4, 5)}
+
+
+def read_baseline(name):
+    header = [0, 1] if name in MULTI_HEADER_DATASETS else 0
+    return pd.read_csv(resolve_path(DATASETS[name]), header=header)
+
+
+@pytest.mark.parametrize("name", sorted(DATASETS))
+def test_total_counts_match_baseline(name):
+    totals = total_counts(load_dataset(name))
+    expected = baseline_counts(read_baseline(name))
+    assert {score: int(totals[score]) for score in expected} == expected
+
+
+@pytest.mark.parametrize("name", ["c3", "c5_dosen", "c5_mhs", "c5_tendik", "c7", "c8"])
+def test_satisfaction_table_matches_baseline(name):
+    table = satisfaction_distribution(total_counts(load_dataset(name)))
+    counts = baseline_counts(read_baseline(name))
+    puas, tidak_puas = counts[4] + counts[5], counts[1] + counts[2]
+    assert list(table['Status']) == list(SATISFACTION)
+    assert list(table['Jumlah']) == [puas, tidak_puas]
+    assert table['Persentase'].tolist() == pytest.approx(
+        [puas / (puas + tidak_puas) * 100, tidak_puas / (puas + tidak_puas) * 100])
@@ -0,0 +1,65 @@
+import pandas as pd
+import pytest
+
+from dashboard import partitions
+from dashboard.data import load_dataset
+
+
+@pytest.fixture
+def source(tmp_path, monkeypatch):
+    # Partisi di folder sementara; isi CSV diganti lewat ``source["data"]``
+    partition_dir = tmp_path / partitions.PARTITION_DATASET
+    monkeypatch.setattr(partitions, "PARTITION_DIR", partition_dir)
+    monkeypatch.setattr(partitions, "MANIFEST_PATH", partition_dir / "manifest.json")
+    monkeypatch.setattr(partitions, "_checked", {})
+    # Versi CSV ikut berubah setiap kali isi diganti supaya manifest dicek ulang
+    state = {"data": load_dataset(partitions.PARTITION_DATASET), "version": 1}
+    monkeypatch.setattr(partitions, "load_dataset", lambda name: state["data"])
+    monkeypatch.setattr(partitions, "file_signature", lambda path: (state["version"], 0))
+    return state
+
+
+def count_rows(tahun=None):
+    result = partitions.query_partitions("SELECT COUNT(*) AS n FROM dosen", tahun=tahun)
+    return int(result["n"].sum())
+
+
+def test_sync_writes_keeps_and_removes(source):
+    data = source["data"]
+    years = [str(year) for year in sorted(data[partitions.PARTITION_COLUMN].unique())]
+    assert len(years) >= 3
+
+    assert partitions.sync() == (years, [], [])
+    assert partitions.sync() == ([], years, [])
+    assert count_rows() == len(data)
+
+    dropped, changed = int(years[0]), int(years[1])
+    added = int(years[-1]) + 10
+    column = partitions.PARTITION_COLUMN
+    updated = data[data[column] != dropped].copy()
+    first_changed = updated.index[updated[column] == changed][0]
+    updated.loc[first_changed, 'Rata-rata per Kompetensi'] = 1.0
+    extra = data[data[column] == int(years[-1])].copy()
+    extra[column] = added
+    extra.index = extra.index + len(data)
+    source["data"] = pd.concat([updated, extra])
+    source["version"] += 1
+
+    written, kept, removed = partitions.sync()
+    assert written == sorted([years[1], str(added)])
+    assert kept == years[2:]
+    assert removed == [years[0]]
+    assert not (partitions.PARTITION_DIR / partitions.partition_file_name(dropped)).exists()
+
+    assert count_rows() == len(source["data"])
+    assert count_rows(dropped) == 0
+    assert count_rows(added) == len(extra)
+    assert partitions.query_partitions(
+        "SELECT rata_rata FROM dosen WHERE baris = ?", (int(first_changed) + 1,), tahun=changed
+    )["rata_rata"].tolist() == [1.0]
+
+
+def test_force_rewrites_every_partition(source):
+    years = [str(year) for year in sorted(source["data"][partitions.PARTITION_COLUMN].unique())]
+    partitions.sync()
+    assert partitions.sync(force=True) == (years, [], [])
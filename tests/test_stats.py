@@ -0,0 +1,42 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dashboard.stats import COUNT_COLUMN, LOWER_COLUMN, MEAN_COLUMN, UPPER_COLUMN, mean_ci, t_quantile
+
+
+@pytest.mark.parametrize("df, expected", [(1, 12.7062), (29, 2.0452), (30, 2.0423)])
+def test_t_quantile_matches_table(df, expected):
+    assert t_quantile(0.975, df) == pytest.approx(expected, abs=1e-3)
+    assert t_quantile(0.025, df) == pytest.approx(-expected, abs=1e-3)
+
+
+def test_t_quantile_without_degrees_of_freedom():
+    assert np.isnan(t_quantile(0.975, 0))
+
+
+def test_analytic_interval_small_groups_without_warning():
+    data = pd.DataFrame({"a": [1.0, 3.0, 5.0], "b": [np.nan, 2.0, np.nan], "c": [np.nan] * 3})
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        result = mean_ci(data, method="analytic")
+
+    assert result.loc["a", MEAN_COLUMN] == pytest.approx(3.0)
+    half = t_quantile(0.975, 2) * 2.0 / np.sqrt(3)
+    assert result.loc["a", LOWER_COLUMN] == pytest.approx(3.0 - half)
+    assert result.loc["a", UPPER_COLUMN] == pytest.approx(3.0 + half)
+    assert result.loc["b", MEAN_COLUMN] == pytest.approx(2.0)
+    assert result.loc["b", [LOWER_COLUMN, UPPER_COLUMN]].isna().all()
+    assert result.loc["c", [MEAN_COLUMN, LOWER_COLUMN, UPPER_COLUMN]].isna().all()
+    assert result[COUNT_COLUMN].tolist() == [3, 1, 0]
+
+
+def test_bootstrap_interval_contains_mean():
+    rng = np.random.default_rng(1)
+    data = pd.DataFrame(rng.integers(1, 6, size=(200, 3)).astype(float), columns=["a", "b", "c"])
+    result = mean_ci(data, resamples=500)
+    assert (result[LOWER_COLUMN] <= result[MEAN_COLUMN]).all()
+    assert (result[MEAN_COLUMN] <= result[UPPER_COLUMN]).all()
+    assert result[MEAN_COLUMN].tolist() == pytest.approx(data.mean().tolist())
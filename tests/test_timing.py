@@ -0,0 +1,44 @@
+import json
+
+import pytest
+
+from dashboard import timing
+
+
+@pytest.fixture
+def trace(tmp_path, monkeypatch):
+    path = tmp_path / "timing.jsonl"
+    monkeypatch.setattr(timing, "TRACE_PATH", path)
+    monkeypatch.setattr(timing, "TRACE_ENABLED", True)
+    yield path
+    timing._run.__dict__.clear()
+
+
+def read(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_records_outside_a_render_are_ignored(trace):
+    timing.record("aggregate", "x", 0.1)
+    timing.flush_traces()
+    assert not trace.exists()
+
+
+def test_fragment_rerun_is_flushed_as_its_own_render(trace, monkeypatch):
+    timing.begin("c1")
+    full_render = timing._run.render
+
+    @timing.traced_fragment
+    def fragment():
+        timing.record("aggregate", "filter", 0.25)
+
+    # Render penuh: fragment ikut render halaman dan belum ditulis
+    monkeypatch.setattr(timing, "_fragment_rerun", lambda: False)
+    fragment()
+    assert not trace.exists()
+
+    monkeypatch.setattr(timing, "_fragment_rerun", lambda: True)
+    fragment()
+    records = read(trace)
+    assert [(r["page"], r["stage"], r["section"]) for r in records] == [("c1", "aggregate", "filter")]
+    assert records[0]["render"] != full_render